@@ -1,9 +1,11 @@
 """Endpoints for orchestrated crawling."""
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 from app.schemas.crawl import (
     PlaceCrawlRequest,
     PlaceCrawlSummary,
@@ -17,10 +19,10 @@ router = APIRouter(prefix="/crawl", tags=["crawl"])
 
 
 @router.post("", response_model=PlaceCrawlSummary)
-def crawl_places(payload: PlaceCrawlRequest, db: Session = Depends(get_db)) -> PlaceCrawlSummary:
+async def crawl_places(payload: PlaceCrawlRequest, db: AsyncSession = Depends(get_async_db)) -> PlaceCrawlSummary:
     """Trigger place crawling via subprocess."""
     try:
-        return ingest_from_crawl(
+        return await ingest_from_crawl(
             db,
             query=payload.query,
             # 기본은 고화질 보강 포함. 빠르게 돌리고 싶으면 환경변수로 제어.
@@ -31,11 +33,13 @@ def crawl_places(payload: PlaceCrawlRequest, db: Session = Depends(get_db)) -> P
 
 
 @router.post("/reviews", response_model=ReviewCrawlSummary)
-def crawl_reviews(payload: ReviewCrawlRequest, db: Session = Depends(get_db)) -> ReviewCrawlSummary:
+async def crawl_reviews(payload: ReviewCrawlRequest, db: Session = Depends(get_db)) -> ReviewCrawlSummary:
     """Trigger review crawling for stored places."""
     try:
         place_ids = payload.place_ids or None
-        return crawl_reviews_for_places(
+        # 리뷰 처리(LLM 추출 + 임베딩)는 동기 경로라 워커 스레드에서 실행
+        return await run_in_threadpool(
+            crawl_reviews_for_places,
             db,
             place_ids=place_ids,
             max_count=payload.max_count,
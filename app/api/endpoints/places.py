@@ -1,32 +1,40 @@
 """Place endpoints."""
 
+import re
+
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_async_db, get_read_conn
 from app.schemas.place import PlaceCreate, PlaceOut
 from app.services.recommendation import upsert_place
 from app.models.place import Place
 
 router = APIRouter(prefix="/places", tags=["places"])
 
+# 목록 조회는 PlaceOut 필드만 SELECT 하고, 행 묶음을 한 번에 검증한다 (ORM 객체 생성 생략).
+_PLACE_OUT_COLUMNS = tuple(getattr(Place, name) for name in PlaceOut.model_fields)
+_PLACES_ADAPTER = TypeAdapter(list[PlaceOut])
+# 쉼표로 구분된 토큰 중 숫자만으로 된 것만 id로 인정 ("1a", "-5" 등은 무시)
+_ID_TOKEN_RE = re.compile(r"(?:^|,)\s*(\d+)\s*(?=,|$)")
+
 
 @router.post("", response_model=PlaceOut)
-def create_place(payload: PlaceCreate, db: Session = Depends(get_db)) -> PlaceOut:
+async def create_place(payload: PlaceCreate, db: AsyncSession = Depends(get_async_db)) -> PlaceOut:
     """Create or update a place."""
-    place = upsert_place(db, payload.model_dump())
+    place = await db.run_sync(upsert_place, payload.model_dump())
     return PlaceOut.model_validate(place)
 
 
 @router.get("", response_model=list[PlaceOut])
-def list_places(ids: str | None = None, db: Session = Depends(get_db)) -> list[PlaceOut]:
+async def list_places(ids: str | None = None, db: AsyncConnection = Depends(get_read_conn)) -> list[PlaceOut]:
     """Return places; optionally filter by comma-separated ids."""
-    query = db.query(Place)
+    stmt = select(*_PLACE_OUT_COLUMNS)
     if ids:
-        id_list = [int(i.strip()) for i in ids.split(",") if i.strip().isdigit()]
+        id_list = [int(token) for token in _ID_TOKEN_RE.findall(ids)]
         if id_list:
-            query = query.filter(Place.id.in_(id_list))
-    places = query.all()
-    return [PlaceOut.model_validate(p) for p in places]
-
-
+            stmt = stmt.where(Place.id.in_(id_list))
+    rows = (await db.execute(stmt)).mappings().all()
+    return _PLACES_ADAPTER.validate_python(rows)
@@ -3,9 +3,9 @@
 import logging
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncConnection
 
-from app.db.session import get_db
+from app.db.session import get_read_conn
 from app.schemas.recommendation import (
     RecommendationRequest,
     RecommendationResponse,
@@ -13,17 +13,19 @@ from app.schemas.recommendation import (
     RecommendationItem,
 )
 from app.services.llm import llm_service
-from app.services.recommendation import recommend_places, MAX_RAW_SCORE
+from app.services.recommendation import recommend_places, to_absolute_scores
 
 router = APIRouter(prefix="/recommendations", tags=["recommendations"])
 logger = logging.getLogger(__name__)
 
 
 @router.post("", response_model=RecommendationResponse)
-def recommend(payload: RecommendationRequest, db: Session = Depends(get_db)) -> RecommendationResponse:
+async def recommend(
+    payload: RecommendationRequest,
+    db: AsyncConnection = Depends(get_read_conn),
+) -> RecommendationResponse:
     """Recommend places based on a natural language query."""
-    categories = llm_service.extract_categories_from_query(payload.query)
-    location = llm_service.extract_location_from_query(payload.query)
+    categories, location = await llm_service.extract_query_info(payload.query)
     
     # 위치 필터링 (있는 경우만)
     location_filter = None
@@ -34,18 +36,15 @@ def recommend(payload: RecommendationRequest, db: Session = Depends(get_db)) ->
             "radius_km": 10.0,  # 기본 10km 반경
         }
     
-    items, extracted, place_scores, place_scores_by_category = recommend_places(
+    items, extracted, place_scores, place_scores_by_category = await recommend_places(
         db, categories, payload.limit, location_filter
     )
 
-    def to_absolute_score(raw: float) -> float:
-        if MAX_RAW_SCORE <= 0:
-            return 0.0
-        return min(100.0, round((raw / MAX_RAW_SCORE) * 100.0, 2))
+    raws = [place_scores.get(item.id, 0.0) for item in items]
+    ai_scores = to_absolute_scores(raws)
 
     result_items = []
-    for item in items:
-        raw = place_scores.get(item.id, 0.0)
+    for item, raw, ai_score in zip(items, raws, ai_scores):
         by_cat = place_scores_by_category.get(item.id, {})
         logger.info(
             "[추천 점수] place_id=%s name=%s category=%s total=%.4f | by_category=%s",
@@ -54,7 +53,7 @@ def recommend(payload: RecommendationRequest, db: Session = Depends(get_db)) ->
         result_items.append(
             RecommendationItem(
                 **item.model_dump(),
-                ai_score=to_absolute_score(raw),
+                ai_score=ai_score,
                 similarity_score=round(raw, 4),
             )
         )
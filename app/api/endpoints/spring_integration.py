@@ -1,28 +1,75 @@
 """Spring Boot integration endpoints."""
 
-from fastapi import APIRouter, Depends
+import hashlib
+import json
+import logging
+
+import numpy as np
+from fastapi import APIRouter
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncConnection
 
-from app.db.session import get_db
+from app.db.session import async_engine
 from app.models.place_summary_embedding import PlaceSummaryEmbedding
 from app.schemas.recommendation import PlaceRecommendRequest, PlaceRecommendResponse, PlaceRecommendationItem
+from app.schemas.review import CategoryInfo
 from app.services.llm import llm_service
-from app.services.recommendation import CATEGORY_WEIGHTS, recommend_places, MAX_RAW_SCORE, build_profile_vectors, recommend_places_by_profile
+from app.services.recommendation import (
+    build_profile_vectors,
+    find_place_ids_within_radius,
+    haversine_km,
+    recommend_places,
+    recommend_places_by_profile,
+    to_absolute_scores,
+)
+from app.services.singleflight import SingleFlight
 from app.core.config import settings
 
 router = APIRouter(tags=["spring-integration"])
+logger = logging.getLogger(__name__)
+
+_recommend_flight = SingleFlight()
+
+
+def _flight_key(payload: PlaceRecommendRequest) -> str:
+    """추천 결과에 영향을 주는 요청 필드만으로 만든 singleflight key."""
+    raw = json.dumps(
+        [
+            " ".join((payload.query or "").split()),
+            payload.limit,
+            payload.latitude,
+            payload.longitude,
+            payload.tab,
+            payload.past_place_ids,
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
 
 
 @router.post("/recommend-places", response_model=PlaceRecommendResponse)
-def recommend_places_for_spring(
-    payload: PlaceRecommendRequest,
-    db: Session = Depends(get_db),
-) -> PlaceRecommendResponse:
+async def recommend_places_for_spring(payload: PlaceRecommendRequest) -> PlaceRecommendResponse:
     """Spring Boot 호출 형식. 요청에서 추출된 카테고리만 유사도 검색하며, 없으면 해당 카테고리는 스킵. PK+ai_score만 반환."""
-    import logging
-    logger = logging.getLogger(__name__)
-    
+    # 같은 약속의 참여자들이 동시에 같은 요청을 보내면 LLM/DB 작업은 한 번만 수행하고 결과를 나눠 받는다.
+    recommendations = await _recommend_flight.do(
+        _flight_key(payload), lambda: _recommend_with_conn(payload)
+    )
+    return PlaceRecommendResponse(
+        promise_id=payload.promise_id,
+        recommendations=recommendations,
+    )
+
+
+async def _recommend_with_conn(payload: PlaceRecommendRequest) -> list[PlaceRecommendationItem]:
+    # 요청 스코프 커넥션 대신 실행 단위로 커넥션을 잡는다 (먼저 온 요청이 끝나도 다른 대기자가 결과를 받도록)
+    async with async_engine.connect() as db:
+        return await _build_recommendations(payload, db)
+
+
+async def _build_recommendations(
+    payload: PlaceRecommendRequest,
+    db: AsyncConnection,
+) -> list[PlaceRecommendationItem]:
     # 위치 필터링 (우선순위: 요청의 위도/경도 > 쿼리에서 추출한 위치)
     location_filter = None
     if payload.latitude is not None and payload.longitude is not None:
@@ -39,39 +86,24 @@ def recommend_places_for_spring(
         # 쿼리 없음 + 히스토리 있음 → 프로필 벡터 기반 개인화 추천
         logger.info("프로필 기반 추천 모드: user_id=%s, past_place_ids=%s", payload.user_id, payload.past_place_ids)
 
-        profile_vectors = build_profile_vectors(db, payload.past_place_ids)
+        profile_vectors = await build_profile_vectors(db, payload.past_place_ids)
 
         # 위치 필터로 후보 장소 ID 추출
         candidate_place_ids = None
         if location_filter:
-            from math import radians, cos, sin, asin, sqrt
-            from sqlalchemy import select as sa_select
-            from app.models.place import Place
-            R = 6371.0
-            lat1 = radians(location_filter["latitude"])
-            lon1 = radians(location_filter["longitude"])
-            radius_km = location_filter.get("radius_km") or settings.recommendation_default_radius_km
-            all_places = db.execute(sa_select(Place)).scalars().all()
-            candidate_place_ids = []
-            for place in all_places:
-                if place.latitude is None or place.longitude is None:
-                    continue
-                lat2, lon2 = radians(place.latitude), radians(place.longitude)
-                dlat, dlon = lat2 - lat1, lon2 - lon1
-                a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-                if R * 2 * asin(sqrt(a)) <= radius_km:
-                    candidate_place_ids.append(place.id)
-
-        items, place_scores, place_scores_by_category = recommend_places_by_profile(
+            candidate_place_ids = await find_place_ids_within_radius(db, location_filter)
+
+        items, place_scores, place_scores_by_category = await recommend_places_by_profile(
             db, profile_vectors, payload.limit or 10, candidate_place_ids
         )
-        from app.schemas.review import CategoryInfo
         extracted = CategoryInfo()
 
     else:
         # 쿼리 있음 → 기존 방식
-        location = llm_service.extract_location_from_query(payload.query) if not query_is_empty else None
-        categories = llm_service.extract_categories_from_query(payload.query) if not query_is_empty else __import__('app.schemas.review', fromlist=['CategoryInfo']).CategoryInfo()
+        if query_is_empty:
+            categories, location = CategoryInfo(), None
+        else:
+            categories, location = await llm_service.extract_query_info(payload.query)
 
         logger.info(
             "쿼리 기반 추천 모드: companion=%s, menu=%s, mood=%s, purpose=%s, place_type=%s",
@@ -85,57 +117,52 @@ def recommend_places_for_spring(
                 "radius_km": settings.recommendation_default_radius_km,
             }
 
-        items, extracted, place_scores, place_scores_by_category = recommend_places(
+        items, extracted, place_scores, place_scores_by_category = await recommend_places(
             db, categories, payload.limit, location_filter, payload.tab
         )
 
-    # 절대점수: 만점 100점, raw를 MAX_RAW_SCORE 기준으로 환산 후 소수 둘째자리
-    def to_absolute_score(raw: float) -> float:
-        if MAX_RAW_SCORE <= 0:
-            return 0.0
-        return min(100.0, round((raw / MAX_RAW_SCORE) * 100.0, 2))
-
-    # 중간지점이 있으면 장소까지 거리(km) 계산
-    def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        import math
-        R = 6371.0
-        lat1, lon1 = math.radians(lat1), math.radians(lon1)
-        lat2, lon2 = math.radians(lat2), math.radians(lon2)
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-        c = 2 * math.asin(math.sqrt(a))
-        return round(R * c, 2)
-
-    center_lat = location_filter["latitude"] if location_filter else None
-    center_lon = location_filter["longitude"] if location_filter else None
+    # 중간지점이 있으면 장소까지 거리(km)를 한 번에 계산
+    distances: list[float | None] = [None] * len(items)
+    if location_filter and items:
+        distances = np.round(
+            haversine_km(
+                location_filter["latitude"],
+                location_filter["longitude"],
+                np.fromiter((item.latitude for item in items), dtype=np.float64, count=len(items)),
+                np.fromiter((item.longitude for item in items), dtype=np.float64, count=len(items)),
+            ),
+            2,
+        ).tolist()
 
     place_ids = [item.id for item in items]
     place_summary_map: dict[int, str] = {}
     if place_ids:
-        rows = db.execute(
-            select(PlaceSummaryEmbedding.place_id, PlaceSummaryEmbedding.summary_text)
-            .where(PlaceSummaryEmbedding.place_id.in_(place_ids))
-            .distinct(PlaceSummaryEmbedding.place_id)
+        rows = (
+            await db.execute(
+                select(PlaceSummaryEmbedding.place_id, PlaceSummaryEmbedding.summary_text)
+                .where(PlaceSummaryEmbedding.place_id.in_(place_ids))
+                .distinct(PlaceSummaryEmbedding.place_id)
+            )
         ).fetchall()
         place_summary_map = {place_id: summary for place_id, summary in rows if summary}
 
+    # 절대점수: 만점 100점, raw를 MAX_RAW_SCORE 기준으로 환산 후 소수 둘째자리 (일괄 계산)
+    raws = [place_scores.get(item.id, 0.0) for item in items]
+    ai_scores = to_absolute_scores(raws)
+
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     recommendations = []
-    for item in items:
-        raw = place_scores.get(item.id, 0.0)
-        by_cat = place_scores_by_category.get(item.id, {})
+    for item, raw, ai_score, dist in zip(items, raws, ai_scores, distances):
         summary_text = place_summary_map.get(item.id)
-        logger.info(
-            "[추천 점수] place_id=%s name=%s category=%s total=%.4f | by_category=%s | summary_exists=%s",
-            item.id, item.name, item.category, raw, by_cat, bool(summary_text),
-        )
-        dist = None
-        if center_lat is not None and center_lon is not None and item.latitude is not None and item.longitude is not None:
-            dist = distance_km(center_lat, center_lon, item.latitude, item.longitude)
+        if debug_enabled:
+            logger.debug(
+                "[추천 점수] place_id=%s name=%s category=%s total=%.4f | by_category=%s | summary_exists=%s",
+                item.id, item.name, item.category, raw, place_scores_by_category.get(item.id, {}), bool(summary_text),
+            )
         recommendations.append(
-            PlaceRecommendationItem(
+            PlaceRecommendationItem.model_construct(
                 place_id=str(item.id),
-                ai_score=to_absolute_score(raw),
+                ai_score=ai_score,
                 similarity_score=round(raw, 4),
                 distance_from_midpoint=dist,
                 place_name=item.name,
@@ -148,8 +175,5 @@ def recommend_places_for_spring(
                 summary_text=summary_text,
             )
         )
-    
-    return PlaceRecommendResponse(
-        promise_id=payload.promise_id,
-        recommendations=recommendations,
-    )
+
+    return recommendations
@@ -3,18 +3,53 @@
 from sqlalchemy import text
 
 from app.db.session import engine
+from app.models.extraction_cache import ExtractionCache
 from app.models.place import Place
 from app.models.place_summary_embedding import PlaceSummaryEmbedding
 
+# 여러 워커가 동시에 기동할 때 DDL이 겹치지 않도록 잡는 advisory lock 키
+INIT_DB_LOCK_KEY = 0x67677564  # "ggud"
+
 
 def init_db() -> None:
-    """Create pgvector extension (if needed) and tables."""
-    with engine.connect() as conn:
-        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
-        conn.commit()
-    # 전체 metadata create_all()을 쓰면 Review/Embedding 모델 import 시
-    # 불필요한 테이블이 재생성될 수 있어 필요한 테이블만 명시적으로 생성한다.
-    Place.__table__.create(bind=engine, checkfirst=True)
-    PlaceSummaryEmbedding.__table__.create(bind=engine, checkfirst=True)
+    """Create extensions, tables and indexes.
 
+    다른 프로세스가 초기화 중이면 끝날 때까지 기다린 뒤 진행한다 (DDL이 모두 IF NOT EXISTS라 이어서 실행해도 무해).
+    건너뛰고 바로 요청을 받으면 테이블/extension이 생기기 전에 서비스가 시작될 수 있다.
+    """
+    # 트랜잭션 단위 lock이라 commit/rollback 시 자동으로 풀린다 (DDL이 실패해도 lock이 연결에 남지 않음).
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": INIT_DB_LOCK_KEY})
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        # 전체 metadata create_all()을 쓰면 Review/Embedding 모델 import 시
+        # 불필요한 테이블이 재생성될 수 있어 필요한 테이블만 명시적으로 생성한다.
+        # 테이블마다 존재 확인(checkfirst)하지 않고 한 번의 조회로 없는 테이블만 골라 만든다.
+        tables = [Place.__table__, PlaceSummaryEmbedding.__table__, ExtractionCache.__table__]
+        existing = set(
+            conn.execute(
+                text(
+                    "SELECT tablename FROM pg_tables "
+                    "WHERE schemaname = current_schema() AND tablename = ANY(:names)"
+                ),
+                {"names": [table.name for table in tables]},
+            ).scalars()
+        )
+        for table in tables:
+            if table.name not in existing:
+                table.create(bind=conn, checkfirst=False)
 
+        # 반경 검색(earthdistance)용 확장 + GiST 인덱스
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS cube"))
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS earthdistance"))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS places_earth_gix "
+            "ON places USING gist (ll_to_earth(latitude, longitude))"
+        ))
+        # 기존 테이블에는 create(checkfirst)가 인덱스를 추가하지 않으므로 직접 보장
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_places_lat_lon ON places (latitude, longitude)"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_place_summary_embeddings_value_text "
+            "ON place_summary_embeddings (value_text)"
+        ))
@@ -1,13 +1,48 @@
 """Database session and engine."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 스크립트/크롤링 배치용 동기 엔진
+# executemany는 INSERT를 multi-row VALUES로, UPDATE는 execute_batch로 묶어 왕복 수를 줄인다
+engine = create_engine(
+    settings.database_url,
+    pool_size=settings.sync_db_pool_size,
+    max_overflow=settings.sync_db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,
+    pool_pre_ping=True,
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+)
+# expire_on_commit=False: 커밋 후 속성 접근마다 SELECT로 다시 읽지 않는다 (비동기 세션과 동일)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# API 요청 경로용 비동기 엔진 (asyncpg)
+async_engine = create_async_engine(
+    settings.async_database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,
+    pool_pre_ping=settings.db_pool_pre_ping,
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def _register_vector_codec(dbapi_connection, connection_record) -> None:
+    """asyncpg 커넥션마다 pgvector 타입 코덱을 등록하고 HNSW 검색 파라미터를 설정."""
+    from pgvector.asyncpg import register_vector
+
+    dbapi_connection.run_async(register_vector)
+    dbapi_connection.run_async(
+        lambda conn: conn.execute(f"SET hnsw.ef_search = {int(settings.hnsw_ef_search)}")
+    )
 
 
 def get_db():
@@ -19,3 +54,13 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Yield an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_read_conn():
+    """Yield a plain async connection for read-only endpoints (ORM 세션/unit-of-work 생략)."""
+    async with async_engine.connect() as conn:
+        yield conn
@@ -5,6 +5,11 @@ import logging
 from dotenv import load_dotenv
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
 
 # Load environment variables from .env file
 load_dotenv()
@@ -22,8 +27,12 @@ from app.api.routes import router
 from app.api.endpoints import spring_integration
 from app.core.config import settings
 from app.db.init_db import init_db
+from app.services import scoring
+from app.services.llm import close_llm_service
+from app.services.recommendation import summary_embedding_index
 
-app = FastAPI(title=settings.project_name)
+# 응답 직렬화는 orjson으로 (stdlib json 대비 빠름)
+app = FastAPI(title=settings.project_name, default_response_class=ORJSONResponse)
 app.include_router(router, prefix=settings.api_v1_prefix)
 
 # Spring Boot 호출을 위한 루트 경로 엔드포인트 (prefix 없이)
@@ -31,20 +40,39 @@ app.include_router(spring_integration.router)
 
 
 @app.on_event("startup")
-def on_startup() -> None:
+async def on_startup() -> None:
     """Initialize database artifacts."""
-    init_db()
+    if settings.run_db_init_on_startup:
+        await run_in_threadpool(init_db)
+    scoring.warmup()
+    # 요약 임베딩 centroid 행렬 적재 (실패해도 SQL 경로로 동작)
+    try:
+        await summary_embedding_index.load()
+    except Exception:  # noqa: BLE001
+        logging.getLogger(__name__).exception("embedding index load failed; falling back to SQL scoring")
 
 
-@app.get("/", tags=["root"])
-async def root() -> dict[str, str]:
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    """Release pooled connections."""
+    await close_llm_service()
+
+
+# 헬스체크/루트는 고정 응답이라 FastAPI 의존성 해석·응답 모델 검증을 거치지 않는 raw Starlette 라우트로 등록
+_ROOT_BODY = b'{"message":"Meetup Recommender API is running"}'
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+
+async def root(request: Request) -> Response:
     """Basic sanity endpoint."""
-    return {"message": "Meetup Recommender API is running"}
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
-@app.get("/health", tags=["health"])
-async def health() -> dict[str, str]:
+async def health(request: Request) -> Response:
     """Health check endpoint for Docker."""
-    return {"status": "healthy"}
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
+# 라우터로 등록된 경로보다 먼저 매칭되도록 맨 앞에 삽입
+app.router.routes.insert(0, Route("/health", health, methods=["GET"]))
+app.router.routes.insert(0, Route("/", root, methods=["GET"]))
@@ -1,5 +1,6 @@
 """Import models for metadata registration."""
 
+from app.models.extraction_cache import ExtractionCache  # noqa: F401
 from app.models.place import Place  # noqa: F401
 from app.models.place_summary_embedding import PlaceSummaryEmbedding  # noqa: F401
 
@@ -0,0 +1,17 @@
+"""Review category extraction cache model."""
+
+from sqlalchemy import CHAR, Column, Text
+
+from app.db.base import Base
+
+
+class ExtractionCache(Base):
+    """리뷰 본문 SHA-256 → LLM이 추출한 카테고리 값 (재크롤링 시 같은 본문은 LLM 호출 생략)."""
+
+    __tablename__ = "review_extraction_cache"
+
+    content_hash = Column(CHAR(64), primary_key=True)  # sha256(본문).hexdigest()
+    companion = Column(Text)
+    menu = Column(Text)
+    mood = Column(Text)
+    purpose = Column(Text)
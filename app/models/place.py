@@ -1,6 +1,6 @@
 """Place model."""
 
-from sqlalchemy import BigInteger, Column, DateTime, Float, Integer, String, Text
+from sqlalchemy import BigInteger, Column, DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -10,6 +10,10 @@ class Place(Base):
     """Place metadata."""
 
     __tablename__ = "places"
+    __table_args__ = (
+        # 반경 검색 시 위도/경도 bounding box 사전 필터용
+        Index("ix_places_lat_lon", "latitude", "longitude"),
+    )
 
     id = Column(BigInteger, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
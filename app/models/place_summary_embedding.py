@@ -1,6 +1,6 @@
 """Place-level summary embedding model."""
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 from pgvector.sqlalchemy import Vector
 
@@ -18,6 +18,8 @@ class PlaceSummaryEmbedding(Base):
             "value_text",
             name="uq_place_summary_embedding",
         ),
+        # 같은 값 텍스트의 기존 임베딩 재사용 조회용
+        Index("ix_place_summary_embeddings_value_text", "value_text"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -12,7 +12,13 @@ class Review(Base):
     __tablename__ = "reviews"
 
     id = Column(Integer, primary_key=True, index=True)
-    place_id = Column(BigInteger, ForeignKey("places.id", ondelete="CASCADE"), nullable=False, index=True)
+    # 대량 적재 트랜잭션에서 SET CONSTRAINTS ... DEFERRED로 검사를 커밋 시점으로 미룰 수 있게 DEFERRABLE
+    place_id = Column(
+        BigInteger,
+        ForeignKey("places.id", ondelete="CASCADE", deferrable=True, initially="IMMEDIATE"),
+        nullable=False,
+        index=True,
+    )
     review_id = Column(String(100), nullable=False, unique=True, index=True)  # 네이버 리뷰 ID
     author = Column(String(100))  # 작성자 닉네임
     content = Column(Text, nullable=False)  # 리뷰 내용
@@ -1,8 +1,8 @@
 """Review embedding model for individual review embeddings."""
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 
 from app.db.base import Base
 
@@ -23,6 +23,8 @@ class PlaceEmbedding(Base):
             "value_text",
             name="uq_review_embedding_per_review",
         ),
+        # 같은 값 텍스트의 기존 임베딩 재사용 조회용
+        Index("ix_review_embeddings_value_text", "value_text"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -30,7 +32,8 @@ class PlaceEmbedding(Base):
     review_id = Column(ForeignKey("reviews.id", ondelete="CASCADE"), nullable=False)
     category = Column(String(50), nullable=False)  # companion, menu, mood, purpose
     value_text = Column(Text, nullable=False)  # 카테고리 값 (예: "친구", "카페", "조용한")
-    embedding = Column(Vector(1536), nullable=False)  # 카테고리 값의 임베딩
+    # 카테고리 값의 임베딩 (FP16 저장: 테이블/인덱스 크기 절반)
+    embedding = Column(HALFVEC(1536), nullable=False)
 
     place = relationship("Place")
     review = relationship("Review")
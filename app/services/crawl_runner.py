@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
-import subprocess
 import sys
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
-from sqlalchemy.orm import Session
+from sqlalchemy import column, or_, select, table, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.crawl import PlaceCrawlSummary
-from app.services.recommendation import upsert_place
 from app.models.place import Place
 
 # backend 폴더 내부의 scripts 폴더에서 크롤러 실행
@@ -19,89 +22,187 @@ BACKEND_ROOT = Path(__file__).resolve().parent.parent.parent
 NAVER_SCRIPT = BACKEND_ROOT / "scripts" / "naver_crawl.py"
 PYTHON_BIN = sys.executable
 
-
-def _run_command(args: list[str]) -> str:
-    """Run a subprocess command and return stdout."""
-    completed = subprocess.run(
-        args,
+# 크롤러가 NDJSON으로 내보내는 장소를 몇 개씩 모아 DB에 반영할지
+INGEST_BATCH_SIZE = 100
+# 기존 장소 보강 시 덮어쓰는 컬럼 (crawled_at은 최초 적재 시점 유지)
+_UPSERT_UPDATE_FIELDS = (
+    "name",
+    "category",
+    "road_address",
+    "image_url",
+    "ai_summary",
+    "latitude",
+    "longitude",
+    "review_count",
+    "updated_at",
+)
+# COPY로 임시 테이블에 넣는 컬럼 순서 (마지막 두 개는 적재 시각)
+_INGEST_COPY_FIELDS = (
+    "id",
+    "name",
+    "category",
+    "road_address",
+    "image_url",
+    "ai_summary",
+    "latitude",
+    "longitude",
+    "review_count",
+    "crawled_at",
+    "updated_at",
+)
+_INGEST_TEMP_TABLE = table("_ingest_places", *(column(field) for field in _INGEST_COPY_FIELDS))
+
+
+async def _iter_ndjson(args: list[str]) -> AsyncIterator[dict[str, Any]]:
+    """Run a subprocess and yield one JSON object per stdout line."""
+    proc = await asyncio.create_subprocess_exec(
+        *args,
         cwd=BACKEND_ROOT,
-        capture_output=True,
-        text=True,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=1 << 20,  # 장소 1건(JSON 한 줄)이 기본 64KB 버퍼를 넘는 경우 대비
     )
-    if completed.returncode != 0:
-        raise RuntimeError(completed.stderr.strip() or completed.stdout.strip() or "Crawler failed")
-    return completed.stdout.strip()
-
-
-def fetch_places_from_cli(
+    # stderr 파이프가 가득 차 크롤러가 멈추지 않도록 동시에 비운다.
+    stderr_task = asyncio.create_task(proc.stderr.read())
+    try:
+        async for raw_line in proc.stdout:
+            line = raw_line.strip()
+            if line:
+                yield json.loads(line)
+        await proc.wait()
+        stderr = (await stderr_task).decode("utf-8", errors="replace").strip()
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        # 중간에 예외/취소로 빠져나오면 stderr 읽기 태스크가 남지 않도록 정리
+        if not stderr_task.done():
+            stderr_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await stderr_task
+    if proc.returncode != 0:
+        raise RuntimeError(stderr or "Crawler failed")
+
+
+async def fetch_places_from_cli(
     query: str,
     thumbnail_only: bool = False,
     limit: int | None = None,
-) -> list[dict[str, Any]]:
-    """Invoke naver_crawl.py and return place dicts."""
-    cmd = [PYTHON_BIN, str(NAVER_SCRIPT), "--query", query, "--json-output"]
+) -> AsyncIterator[dict[str, Any]]:
+    """Invoke naver_crawl.py and stream place dicts as they are emitted."""
+    cmd = [PYTHON_BIN, str(NAVER_SCRIPT), "--query", query, "--ndjson"]
     if limit is not None:
         cmd.extend(["--limit", str(limit)])
     if thumbnail_only:
         cmd.append("--thumbnail-only")
-    stdout = _run_command(cmd)
-    if not stdout:
-        return []
-    return json.loads(stdout)
-
-
-def ingest_from_crawl(
-    db: Session,
+    async for place in _iter_ndjson(cmd):
+        yield place
+
+
+def _build_place_payload(place: dict[str, Any]) -> dict[str, Any] | None:
+    """크롤 결과 1건을 places 컬럼 dict로 변환. 필수값이 없으면 None."""
+    # place_id가 없거나 None이면 스킵
+    place_id_raw = place.get("place_id")
+    if not place_id_raw:
+        return None
+    try:
+        place_id = int(place_id_raw)
+    except (ValueError, TypeError):
+        return None
+
+    road_address = place.get("origin_address") or place.get("address")
+    if not road_address:
+        return None
+    latitude = place.get("latitude")
+    longitude = place.get("longitude")
+    if latitude is None or longitude is None:
+        return None
+
+    return {
+        "id": place_id,
+        "name": place["name"],
+        "category": place.get("category") or "기타",
+        "road_address": road_address,
+        "image_url": (place.get("image_url") or "").strip() or None,
+        "ai_summary": (place.get("ai_summary") or "").strip() or None,
+        "latitude": float(latitude),
+        "longitude": float(longitude),
+        "review_count": place.get("review_count") if place.get("review_count") is not None else 0,
+    }
+
+
+async def _ingest_batch(db: AsyncSession, batch: dict[int, dict[str, Any]]) -> tuple[int, int]:
+    """장소 배치를 반영하고 (적재, 스킵) 개수를 반환.
+
+    배치를 COPY로 임시 테이블에 한 번에 밀어넣고 INSERT ... SELECT ... ON CONFLICT 한 문장으로 반영한다.
+    이미 image_url/ai_summary가 채워진 장소는 ON CONFLICT의 WHERE 조건으로 건너뛴다.
+    """
+    if not batch:
+        return 0, 0
+
+    now = datetime.now()
+    records = [
+        tuple(row[field] for field in _INGEST_COPY_FIELDS[:-2]) + (now, now)
+        for row in batch.values()
+    ]
+    stmt = pg_insert(Place).from_select(
+        list(_INGEST_COPY_FIELDS),
+        select(*(_INGEST_TEMP_TABLE.c[field] for field in _INGEST_COPY_FIELDS)),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Place.id],
+        set_={field: stmt.excluded[field] for field in _UPSERT_UPDATE_FIELDS},
+        # 이미 존재하더라도 ai_summary/image_url이 비어있으면 보강 업데이트한다.
+        where=or_(Place.image_url.is_(None), Place.ai_summary.is_(None)),
+    ).returning(Place.id)
+    try:
+        # 임시 테이블 생성으로 트랜잭션을 먼저 연 뒤, 같은 커넥션에서 asyncpg COPY 실행
+        await db.execute(
+            text(
+                f"CREATE TEMP TABLE {_INGEST_TEMP_TABLE.name} "
+                f"(LIKE {Place.__tablename__} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+        )
+        raw_conn = await (await db.connection()).get_raw_connection()
+        await raw_conn.driver_connection.copy_records_to_table(
+            _INGEST_TEMP_TABLE.name, records=records, columns=list(_INGEST_COPY_FIELDS)
+        )
+        ingested = len((await db.execute(stmt)).all())
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return ingested, len(batch) - ingested
+
+
+async def ingest_from_crawl(
+    db: AsyncSession,
     query: str,
     thumbnail_only: bool = False,
     limit: int | None = None,
 ) -> PlaceCrawlSummary:
-    """Run crawlers and insert place metadata into DB."""
-    places = fetch_places_from_cli(query, thumbnail_only=thumbnail_only, limit=limit)
+    """Run crawlers and insert place metadata into DB (배치 단위로 스트리밍 적재)."""
     places_ingested = 0
     places_skipped = 0
+    # 같은 배치 안의 중복 id는 마지막 값으로 (ON CONFLICT는 한 문장에서 같은 행을 두 번 갱신 불가)
+    batch: dict[int, dict[str, Any]] = {}
 
-    for place in places:
-        # place_id가 없거나 None이면 스킵
-        place_id_raw = place.get("place_id")
-        if not place_id_raw:
-            continue
-        try:
-            place_id = int(place_id_raw)
-        except (ValueError, TypeError):
-            continue
-
-        road_address = place.get("origin_address") or place.get("address")
-        if not road_address:
-            continue
-        latitude = place.get("latitude")
-        longitude = place.get("longitude")
-        if latitude is None or longitude is None:
-            continue
-
-        # 이미 존재하더라도 ai_summary/image_url이 비어있으면 보강 업데이트한다.
-        existing = db.get(Place, place_id)
-        if existing and existing.image_url and existing.ai_summary:
-            places_skipped += 1
+    async for place in fetch_places_from_cli(query, thumbnail_only=thumbnail_only, limit=limit):
+        payload = _build_place_payload(place)
+        if payload is None:
             continue
+        batch[payload["id"]] = payload
+        if len(batch) >= INGEST_BATCH_SIZE:
+            ingested, skipped = await _ingest_batch(db, batch)
+            places_ingested += ingested
+            places_skipped += skipped
+            batch.clear()
 
-        payload = {
-            "id": int(place["place_id"]),
-            "name": place["name"],
-            "category": place.get("category") or "기타",
-            "road_address": road_address,
-            "image_url": (place.get("image_url") or "").strip() or None,
-            "ai_summary": (place.get("ai_summary") or "").strip() or None,
-            "latitude": float(latitude),
-            "longitude": float(longitude),
-            "review_count": place.get("review_count") if place.get("review_count") is not None else 0,
-        }
-        upsert_place(db, payload)
-        places_ingested += 1
+    ingested, skipped = await _ingest_batch(db, batch)
+    places_ingested += ingested
+    places_skipped += skipped
 
     return PlaceCrawlSummary(
         places_fetched=places_ingested,
         places_skipped=places_skipped,
     )
-
-
@@ -0,0 +1,178 @@
+"""In-memory matrix of place summary embedding centroids."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+import numpy as np
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.db.session import async_engine
+from app.models.place_summary_embedding import PlaceSummaryEmbedding
+from app.services.scoring import build_query_matrix, collect_scores, score_places
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 float32로 올려 계산하는 장소 수 (전체 스캔 시 메모리 피크 제한)
+SCORE_CHUNK_SIZE = 2048
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    place_ids: np.ndarray  # (n,) int64
+    id_index: dict[int, int]
+    centroids: np.ndarray  # (n, n_categories, dim) int8
+    scales: np.ndarray  # (n, n_categories) float32, centroid ≈ centroids * scale
+    present: np.ndarray  # (n, n_categories) bool
+
+
+def quantize_int8(vector: Sequence[float]) -> tuple[np.ndarray, float]:
+    """벡터를 int8 + 스케일 1개로 대칭 양자화 (scale = max|v| / 127)."""
+    arr = np.asarray(vector, dtype=np.float32)
+    max_abs = float(np.max(np.abs(arr))) if arr.size else 0.0
+    if max_abs == 0.0:
+        return np.zeros(arr.shape, dtype=np.int8), 0.0
+    scale = max_abs / 127.0
+    return np.clip(np.rint(arr / scale), -127, 127).astype(np.int8), scale
+
+
+class SummaryEmbeddingIndex:
+    """place_summary_embeddings의 (장소, 카테고리)별 임베딩 평균을 메모리에 올려두고 행렬 연산으로 점수 계산.
+
+    centroid는 int8 + 벡터별 스케일로 보관해 float32 대비 1/4 메모리로 유지하고, 계산 시 청크 단위로 복원한다.
+    임베딩은 단위 벡터라 centroid·q̂ 가 개별 코사인 유사도의 평균과 같아 SQL 경로와 같은 점수를 낸다.
+    적재 후 embedding_index_ttl_seconds가 지나면 요청을 막지 않고 백그라운드에서 다시 적재한다.
+    """
+
+    def __init__(self, category_keys: Sequence[str], weights_vec: np.ndarray) -> None:
+        self.category_keys = tuple(category_keys)
+        self.weights_vec = np.asarray(weights_vec, dtype=np.float32)
+        self._category_index = {key: i for i, key in enumerate(self.category_keys)}
+        self._snapshot: _Snapshot | None = None
+        self._loaded_at = 0.0
+        self._load_lock = asyncio.Lock()
+        self._reload_task: asyncio.Task | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    async def load(self) -> None:
+        """DB에서 centroid 행렬을 새로 만들어 교체. 비활성/장소 수 초과면 인덱스를 비운다."""
+        if not settings.embedding_index_enabled:
+            return
+        async with self._load_lock:
+            async with async_engine.connect() as db:
+                n_places = await db.scalar(select(func.count(func.distinct(PlaceSummaryEmbedding.place_id))))
+                if not n_places or n_places > settings.embedding_index_max_places:
+                    if n_places:
+                        logger.warning(
+                            "embedding index skipped: %s places > EMBEDDING_INDEX_MAX_PLACES=%s",
+                            n_places, settings.embedding_index_max_places,
+                        )
+                    self._snapshot = None
+                    self._loaded_at = time.monotonic()
+                    return
+
+                place_ids: list[int] = []
+                id_index: dict[int, int] = {}
+                centroids: np.ndarray | None = None
+                present = np.zeros((n_places, len(self.category_keys)), dtype=np.bool_)
+                scales = np.zeros((n_places, len(self.category_keys)), dtype=np.float32)
+                result = await db.stream(
+                    select(
+                        PlaceSummaryEmbedding.place_id,
+                        PlaceSummaryEmbedding.category,
+                        func.avg(PlaceSummaryEmbedding.embedding),
+                    )
+                    .group_by(PlaceSummaryEmbedding.place_id, PlaceSummaryEmbedding.category)
+                )
+                async for place_id, category, embedding in result:
+                    c = self._category_index.get(category)
+                    if c is None or embedding is None:
+                        continue
+                    i = id_index.get(place_id)
+                    if i is None:
+                        if len(place_ids) >= n_places:
+                            # count 이후 새로 들어온 장소는 다음 적재 때 반영
+                            continue
+                        i = id_index[place_id] = len(place_ids)
+                        place_ids.append(place_id)
+                    if centroids is None:
+                        centroids = np.zeros((n_places, len(self.category_keys), len(embedding)), dtype=np.int8)
+                    centroids[i, c], scales[i, c] = quantize_int8(embedding)
+                    present[i, c] = True
+
+            if centroids is None:
+                self._snapshot = None
+            else:
+                n = len(place_ids)
+                self._snapshot = _Snapshot(
+                    place_ids=np.asarray(place_ids, dtype=np.int64),
+                    id_index=id_index,
+                    centroids=centroids[:n],
+                    scales=scales[:n],
+                    present=present[:n],
+                )
+                logger.info("embedding index loaded: %s places", n)
+            self._loaded_at = time.monotonic()
+
+    def refresh_if_stale(self) -> None:
+        """TTL이 지났으면 백그라운드 재적재를 예약 (현재 요청은 기존 스냅샷 사용, 스냅샷이 없어도 재시도)."""
+        if not settings.embedding_index_enabled:
+            return
+        if time.monotonic() - self._loaded_at < settings.embedding_index_ttl_seconds:
+            return
+        if self._reload_task is not None and not self._reload_task.done():
+            return
+        self._reload_task = asyncio.create_task(self._reload())
+
+    async def _reload(self) -> None:
+        try:
+            await self.load()
+        except Exception:  # noqa: BLE001
+            logger.exception("embedding index reload failed; keeping previous snapshot")
+            self._loaded_at = time.monotonic()
+
+    def score(
+        self,
+        query_vectors: Mapping[str, Sequence[float]],
+        candidate_place_ids: Sequence[int] | None = None,
+    ) -> tuple[dict[int, float], dict[int, dict[str, float]]]:
+        """카테고리별 쿼리 벡터로 (장소별 총점, 장소별 카테고리 점수) 계산. 후보가 있으면 후보만."""
+        snapshot = self._snapshot
+        if snapshot is None or not query_vectors:
+            return {}, {}
+
+        if candidate_place_ids is None:
+            rows = np.arange(len(snapshot.place_ids))
+        else:
+            rows = np.fromiter(
+                (snapshot.id_index[pid] for pid in candidate_place_ids if pid in snapshot.id_index),
+                dtype=np.int64,
+            )
+        if rows.size == 0:
+            return {}, {}
+
+        query_vecs, weights = build_query_matrix(
+            query_vectors, self._category_index, self.weights_vec, snapshot.centroids.shape[2]
+        )
+        by_category = np.empty((rows.size, len(self.category_keys)), dtype=np.float32)
+        for start in range(0, rows.size, SCORE_CHUNK_SIZE):
+            chunk = rows[start:start + SCORE_CHUNK_SIZE]
+            dequantized = snapshot.centroids[chunk].astype(np.float32)
+            dequantized *= snapshot.scales[chunk][:, :, None]
+            by_category[start:start + chunk.size] = score_places(
+                dequantized,
+                snapshot.present[chunk],
+                query_vecs,
+                weights,
+            )
+        return collect_scores(
+            snapshot.place_ids[rows], snapshot.present[rows], weights, by_category, self.category_keys
+        )
@@ -0,0 +1,44 @@
+"""Persistent review content hash → CategoryInfo cache."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable, Mapping
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.extraction_cache import ExtractionCache
+from app.schemas.review import CategoryInfo
+
+_CACHED_FIELDS = ("companion", "menu", "mood", "purpose")
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def load_cached_categories(db: Session, hashes: Iterable[str]) -> dict[str, CategoryInfo]:
+    """해시 목록 중 캐시에 있는 것만 한 번의 조회로 CategoryInfo로 반환."""
+    hashes = list(dict.fromkeys(hashes))
+    if not hashes:
+        return {}
+    rows = db.execute(select(ExtractionCache).where(ExtractionCache.content_hash.in_(hashes))).scalars()
+    return {
+        row.content_hash: CategoryInfo(**{field: getattr(row, field) for field in _CACHED_FIELDS})
+        for row in rows
+    }
+
+
+def store_cached_categories(db: Session, entries: Mapping[str, CategoryInfo]) -> None:
+    """새로 추출한 결과를 캐시에 추가 (커밋은 호출 측 트랜잭션에 맡긴다)."""
+    if not entries:
+        return
+    rows = [
+        {"content_hash": h, **{field: getattr(categories, field) for field in _CACHED_FIELDS}}
+        for h, categories in entries.items()
+    ]
+    db.execute(
+        pg_insert(ExtractionCache).values(rows).on_conflict_do_nothing(index_elements=["content_hash"])
+    )
@@ -2,13 +2,186 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+import atexit
+import copy
+from typing import Any, Callable, TypeVar
 
-from openai import OpenAI
+import httpx
+import orjson
+from openai import AsyncOpenAI, OpenAI
+from pydantic import field_validator
 
 from app.core.config import settings
 from app.schemas.review import CategoryInfo
+from app.services.semantic_cache import EmbeddingLRU, SemanticCache
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+T = TypeVar("T")
+
+# embeddings.create 한 번에 보내는 입력 수 (API 상한 2048, 처리량은 512 안팎이 가장 좋음)
+EMBEDDING_BATCH_SIZE = 512
+# 유휴 keep-alive 커넥션 유지 시간 (httpx 기본 5초는 배치 사이 간격보다 짧아 재핸드셰이크가 잦음)
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+# 쿼리 추출 결과 캐시. 카테고리 어휘는 제한적이라 0.93, 위치는 정밀도가 중요해 0.97로 더 엄격하게.
+_QUERY_CATEGORY_CACHE = SemanticCache(threshold=0.93, ttl_seconds=24 * 60 * 60)
+_QUERY_LOCATION_CACHE = SemanticCache(threshold=0.97, ttl_seconds=7 * 24 * 60 * 60)
+# 리뷰 카테고리 추출 캐시. 같은 리뷰 재크롤링/복붙 리뷰만 맞도록 exact(내용 해시) 조회만 사용한다.
+# (유사 리뷰의 카테고리를 재사용하면 review_extraction_cache에 다른 리뷰 결과가 저장되고, miss마다 임베딩 호출도 늘어남)
+_REVIEW_CATEGORY_CACHE = SemanticCache(threshold=1.0, ttl_seconds=7 * 24 * 60 * 60)
+# 임베딩 exact-match 캐시 (프로세스 전역, 요청 간 유지)
+_EMBEDDING_CACHE = EmbeddingLRU(max_entries=settings.embedding_cache_max_entries)
+
+# 시스템 프롬프트 (고정 문자열)
+_REVIEW_CATEGORY_SYSTEM_PROMPT = (
+    "너는 한국어 리뷰에서 동행자/메뉴/분위기/모임목적 정보를 추출하는 어시스턴트야. "
+    "JSON만 반환하고 값이 없으면 null을 사용해. "
+    "모든 필드는 반드시 문자열(string) 타입이어야 하며, 여러 값이 있으면 쉼표로 구분된 하나의 문자열로 반환해. "
+    "리스트나 배열 형태로 반환하지 마."
+)
+
+_QUERY_INFO_SYSTEM_PROMPT = (
+    "너는 사용자의 장소 추천 요청에서 동행자/메뉴/분위기/모임목적/업종(place_type)과 위치 정보를 추출하는 어시스턴트야. "
+    "JSON만 반환하고 값이 없으면 null을 사용해. "
+    "위도/경도를 제외한 모든 필드는 반드시 문자열(string) 타입이어야 하며, 여러 값이 있으면 쉼표로 구분된 하나의 문자열로 반환해. "
+    "리스트나 배열 형태로 반환하지 마. "
+    "지역명이 있으면 해당 지역의 대표적인 위도/경도를 반환해줘."
+)
+
+_QUERY_CATEGORY_SYSTEM_PROMPT = (
+    "너는 사용자의 장소 추천 요청에서 동행자/메뉴/분위기/모임목적/업종(place_type) 정보를 추출하는 어시스턴트야. "
+    "JSON만 반환하고 값이 없으면 null을 사용해. "
+    "모든 필드는 반드시 문자열(string) 타입이어야 하며, 여러 값이 있으면 쉼표로 구분된 하나의 문자열로 반환해. "
+    "리스트나 배열 형태로 반환하지 마."
+)
+
+_QUERY_LOCATION_SYSTEM_PROMPT = (
+    "너는 사용자의 장소 추천 요청에서 위치 정보를 추출하는 어시스턴트야. "
+    "위치 정보가 있으면 JSON으로 반환하고, 없으면 null을 반환해. "
+    "지역명이 있으면 해당 지역의 대표적인 위도/경도를 반환해줘. "
+    "예: 홍대 -> latitude: 37.5563, longitude: 126.9239"
+)
+
+_SUMMARY_SYSTEM_PROMPT = (
+    "너는 여러 사용자 리뷰를 1개의 대표 리뷰로 압축 요약하는 어시스턴트야. "
+    "추천 시스템에서 카테고리(companion/menu/mood/purpose)를 잘 추출할 수 있게 "
+    "핵심 키워드를 빠뜨리지 말고 한국어로 요약해."
+)
+
+# 사용자 프롬프트 템플릿과 system 메시지 (요청마다 같은 문자열/dict를 다시 만들지 않도록 모듈에서 한 번만 생성)
+_REVIEW_CATEGORY_USER_TEMPLATE = (
+    "리뷰에서 다음 필드를 채워줘:\n"
+    "- companion (동행자: 문자열, 여러 명이면 쉼표로 구분)\n"
+    "- menu (메뉴: 문자열, 여러 메뉴면 쉼표로 구분, 예: '볶음우동, 치킨가라야케')\n"
+    "- mood (분위기: 문자열)\n"
+    "- purpose (모임 목적: 문자열)\n\n"
+    "중요: 모든 값은 반드시 문자열(string) 타입이어야 합니다. 리스트나 배열을 사용하지 마세요.\n\n"
+    "리뷰: {text}"
+)
+_REVIEW_CATEGORY_MSG_HEAD = ({"role": "system", "content": _REVIEW_CATEGORY_SYSTEM_PROMPT},)
+
+_QUERY_INFO_USER_TEMPLATE = (
+    "사용자 요청에서 다음 필드를 추출해줘:\n"
+    "- companion (동행자: 문자열, 예: 친구, 연인, 가족, 혼자 등)\n"
+    "- menu (먹고 싶은 메뉴/음식: 문자열. 구체적인 음식·메뉴일 때만 채워줘. 예: 파스타, 스테이크, 라떼, 브런치, 회, 초밥, 치킨, 베이글 등. '한식', '카페', '양식'처럼 장소 종류는 place_type에 넣고 menu에는 넣지 마)\n"
+    "- mood (분위기: 문자열, 예: 조용한, 시끌벅적한, 로맨틱한, 편안한 등)\n"
+    "- purpose (모임 목적: 문자열, 예: 데이트, 비즈니스, 친목, 회식 등)\n"
+    "- place_type (사용자가 원하는 장소의 업종/종류: 문자열 하나만. 예: 카페, 한식, 이탈리아음식, 일식, 중식, 양식, 베이커리, 술집, 호프 등. '카페 추천해줘', '한식당 있어?', '이탈리안 가고 싶어'처럼 구체적인 업종이 있으면 그걸로 채우고, 없으면 null)\n"
+    "- latitude (위도: 숫자, 지역명이면 해당 지역의 대표 위도, 위치 정보가 없으면 null)\n"
+    "- longitude (경도: 숫자, 지역명이면 해당 지역의 대표 경도, 위치 정보가 없으면 null)\n"
+    "- region (지역명: 문자열, 참고용)\n\n"
+    "중요: latitude/longitude 외의 값은 문자열(string) 타입으로, 리스트나 배열은 사용하지 마세요. place_type은 DB 장소 카테고리(업종)와 매칭하므로 한 단어 또는 짧은 표현(예: 이탈리아음식)으로만 적어줘.\n\n"
+    "지역명 예시:\n"
+    "- 홍대: latitude: 37.5563, longitude: 126.9239\n"
+    "- 강남: latitude: 37.4979, longitude: 127.0276\n"
+    "- 신촌: latitude: 37.5551, longitude: 126.9368\n"
+    "- 이태원: latitude: 37.5345, longitude: 126.9947\n\n"
+    "사용자 요청: {query}"
+)
+_QUERY_INFO_MSG_HEAD = ({"role": "system", "content": _QUERY_INFO_SYSTEM_PROMPT},)
+
+_QUERY_CATEGORY_USER_TEMPLATE = (
+    "사용자 요청에서 다음 필드를 추출해줘:\n"
+    "- companion (동행자: 문자열, 예: 친구, 연인, 가족, 혼자 등)\n"
+    "- menu (먹고 싶은 메뉴/음식: 문자열. 구체적인 음식·메뉴일 때만 채워줘. 예: 파스타, 스테이크, 라떼, 브런치, 회, 초밥, 치킨, 베이글 등. '한식', '카페', '양식'처럼 장소 종류는 place_type에 넣고 menu에는 넣지 마)\n"
+    "- mood (분위기: 문자열, 예: 조용한, 시끌벅적한, 로맨틱한, 편안한 등)\n"
+    "- purpose (모임 목적: 문자열, 예: 데이트, 비즈니스, 친목, 회식 등)\n"
+    "- place_type (사용자가 원하는 장소의 업종/종류: 문자열 하나만. 예: 카페, 한식, 이탈리아음식, 일식, 중식, 양식, 베이커리, 술집, 호프 등. '카페 추천해줘', '한식당 있어?', '이탈리안 가고 싶어'처럼 구체적인 업종이 있으면 그걸로 채우고, 없으면 null)\n\n"
+    "중요: 모든 값은 문자열(string) 타입으로, 리스트나 배열은 사용하지 마세요. place_type은 DB 장소 카테고리(업종)와 매칭하므로 한 단어 또는 짧은 표현(예: 이탈리아음식)으로만 적어줘.\n\n"
+    "사용자 요청: {query}"
+)
+_QUERY_CATEGORY_MSG_HEAD = ({"role": "system", "content": _QUERY_CATEGORY_SYSTEM_PROMPT},)
+
+_QUERY_LOCATION_USER_TEMPLATE = (
+    "사용자 요청에서 위치 정보를 추출하고, 지역명이면 해당 지역의 위도/경도를 반환해줘:\n"
+    "- latitude (위도: 숫자, 지역명이면 해당 지역의 대표 위도)\n"
+    "- longitude (경도: 숫자, 지역명이면 해당 지역의 대표 경도)\n"
+    "- region (지역명: 문자열, 참고용)\n\n"
+    "사용자 요청: {query}\n\n"
+    "지역명 예시:\n"
+    "- 홍대: latitude: 37.5563, longitude: 126.9239\n"
+    "- 강남: latitude: 37.4979, longitude: 127.0276\n"
+    "- 신촌: latitude: 37.5551, longitude: 126.9368\n"
+    "- 이태원: latitude: 37.5345, longitude: 126.9947"
+)
+_QUERY_LOCATION_MSG_HEAD = ({"role": "system", "content": _QUERY_LOCATION_SYSTEM_PROMPT},)
+
+_SUMMARY_USER_TEMPLATE = (
+    "{place_info}"
+    "아래 리뷰들을 바탕으로 단일 요약 리뷰를 작성해줘.\n"
+    "조건:\n"
+    "1) 250~700자 사이의 자연스러운 한국어 문단 1개\n"
+    "2) 동행자, 메뉴, 분위기, 방문목적 관련 단서를 최대한 포함\n"
+    "3) 긍정/부정 포인트를 균형 있게 포함\n"
+    "4) 없는 사실을 만들지 말 것\n\n"
+    "리뷰 목록:\n{context}"
+)
+_SUMMARY_MSG_HEAD = ({"role": "system", "content": _SUMMARY_SYSTEM_PROMPT},)
+
+# 모델이 빈 값 대신 넣는 문자열 ("null"/"None"/"없음" 등)
+_EMPTY_VALUE_TOKENS = frozenset({"null", "none", "없음", "없다"})
+# 값 타입별 문자열 변환 (리스트는 쉼표로 구분된 문자열로 합침, 그 외 타입은 str)
+_VALUE_TO_TEXT: dict[type, Callable[[Any], str]] = {
+    str: lambda value: value,
+    list: lambda value: ", ".join(str(v) for v in value if v),
+}
+
+
+def _normalize_value(value: Any) -> str | None:
+    """안전장치: 리스트/숫자/"null" 문자열 등을 정규화해 문자열 또는 None으로."""
+    if value is None:
+        return None
+    text = _VALUE_TO_TEXT.get(type(value), str)(value).strip()
+    if not text or text.lower() in _EMPTY_VALUE_TOKENS:
+        return None
+    return text
+
+
+# 리뷰 추출 응답에서 읽는 필드 (place_type은 쿼리 전용)
+_REVIEW_CATEGORY_FIELDS = ("companion", "menu", "mood", "purpose")
+
+
+class RawCategory(CategoryInfo):
+    """LLM JSON 응답 파싱용 CategoryInfo. 리스트/숫자/"null" 문자열 등은 검증 단계에서 문자열 또는 None으로 정규화."""
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def _normalize(cls, value: Any) -> str | None:
+        return _normalize_value(value)
+
+
+def _http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.openai_max_connections,
+        max_keepalive_connections=settings.openai_max_keepalive_connections,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
 
 
 class LLMService:
@@ -17,166 +190,151 @@ class LLMService:
     def __init__(self) -> None:
         if not settings.openai_api_key:
             raise RuntimeError("OPENAI_API_KEY is not configured.")
-        self._client = OpenAI(api_key=settings.openai_api_key)
+        # 스크립트/배치용 동기 클라이언트: 배치 임베딩/추출이 keep-alive 커넥션을 재사용하도록 풀을 명시
+        self._http = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            timeout=settings.openai_batch_timeout_seconds,
+            limits=_http_limits(),
+        )
+        self._client = OpenAI(api_key=settings.openai_api_key, http_client=self._http)
+        atexit.register(self._http.close)
+        # API 요청 경로용 비동기 클라이언트: 프로세스 전체에서 커넥션 풀 하나를 공유
+        self._async_client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=settings.openai_timeout_seconds,
+                limits=_http_limits(),
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """비동기 클라이언트의 커넥션 풀 정리."""
+        await self._async_client.close()
 
     def extract_categories(self, text: str) -> CategoryInfo:
+        """Extract structured category info from review text (exact 캐시 경유)."""
+        key = _REVIEW_CATEGORY_CACHE.make_key(text)
+        cached = _REVIEW_CATEGORY_CACHE.get_exact(key)
+        if _REVIEW_CATEGORY_CACHE.is_miss(cached):
+            cached = self._extract_categories(text)
+            _REVIEW_CATEGORY_CACHE.put(key, cached)
+        # 캐시에 든 객체를 호출자가 수정해도 오염되지 않도록 얕은 복사본 반환
+        return copy.copy(cached)
+
+    def _extract_categories(self, text: str) -> CategoryInfo:
         """Extract structured category info from review text via LLM."""
-        system_prompt = (
-            "너는 한국어 리뷰에서 동행자/메뉴/분위기/모임목적 정보를 추출하는 어시스턴트야. "
-            "JSON만 반환하고 값이 없으면 null을 사용해. "
-            "모든 필드는 반드시 문자열(string) 타입이어야 하며, 여러 값이 있으면 쉼표로 구분된 하나의 문자열로 반환해. "
-            "리스트나 배열 형태로 반환하지 마."
-        )
-        user_prompt = (
-            "리뷰에서 다음 필드를 채워줘:\n"
-            "- companion (동행자: 문자열, 여러 명이면 쉼표로 구분)\n"
-            "- menu (메뉴: 문자열, 여러 메뉴면 쉼표로 구분, 예: '볶음우동, 치킨가라야케')\n"
-            "- mood (분위기: 문자열)\n"
-            "- purpose (모임 목적: 문자열)\n\n"
-            "중요: 모든 값은 반드시 문자열(string) 타입이어야 합니다. 리스트나 배열을 사용하지 마세요.\n\n"
-            f"리뷰: {text}"
-        )
         response = self._client.chat.completions.create(
             model=settings.openai_response_model,
             messages=[
-                {
-                    "role": "system",
-                    "content": system_prompt,
-                },
-                {
-                    "role": "user",
-                    "content": user_prompt,
-                },
+                *_REVIEW_CATEGORY_MSG_HEAD,
+                {"role": "user", "content": _REVIEW_CATEGORY_USER_TEMPLATE.format(text=text)},
             ],
             response_format={"type": "json_object"},
             temperature=0.2,
         )
         content = response.choices[0].message.content
-        data: dict[str, Any] = json.loads(content)
-        
-        # 안전장치: 리스트/숫자/"null" 문자열 등을 정규화
-        def normalize_value(value: Any) -> str | None:
-            if value is None:
-                return None
-            if isinstance(value, list):
-                # 리스트를 쉼표로 구분된 문자열로 변환
-                joined = ", ".join(str(v) for v in value if v)
-                s = joined.strip()
-            elif isinstance(value, (int, float)):
-                s = str(value).strip()
-            else:
-                s = str(value).strip()
-            # 모델이 문자열 "null"/"None"/"없음" 등을 넣는 경우를 빈 값으로 처리
-            if not s:
-                return None
-            lowered = s.lower()
-            if lowered in {"null", "none"} or s in {"없음", "없다"}:
-                return None
-            return s
-        
-        return CategoryInfo(
-            companion=normalize_value(data.get("companion")),
-            menu=normalize_value(data.get("menu")),
-            mood=normalize_value(data.get("mood")),
-            purpose=normalize_value(data.get("purpose")),
+        data: dict[str, Any] = orjson.loads(content)
+        return RawCategory.model_validate({key: data.get(key) for key in _REVIEW_CATEGORY_FIELDS})
+
+    def _cached_query_call(self, cache: SemanticCache, query: str, compute: Callable[[str], T]) -> T:
+        """exact → semantic 순으로 캐시를 조회하고, 둘 다 miss면 LLM 호출 후 저장."""
+        key = cache.make_key(query)
+        cached = cache.get_exact(key)
+        if cache.is_miss(cached):
+            vector = self.embed_text(query)
+            cached = cache.get_similar(vector)
+            if cache.is_miss(cached):
+                cached = compute(query)
+            cache.put(key, cached, vector)
+        # 캐시에 든 객체를 호출자가 수정해도 오염되지 않도록 얕은 복사본 반환
+        return copy.copy(cached)
+
+    async def extract_query_info(self, query: str) -> tuple[CategoryInfo, dict[str, float] | None]:
+        """쿼리에서 카테고리와 위치를 함께 추출 (캐시 경유, miss 시 LLM 1회 호출)."""
+        category_key = _QUERY_CATEGORY_CACHE.make_key(query)
+        location_key = _QUERY_LOCATION_CACHE.make_key(query)
+        categories = _QUERY_CATEGORY_CACHE.get_exact(category_key)
+        location = _QUERY_LOCATION_CACHE.get_exact(location_key)
+        if _QUERY_CATEGORY_CACHE.is_miss(categories) or _QUERY_LOCATION_CACHE.is_miss(location):
+            vector = await self.embed_text_async(query)
+            if _QUERY_CATEGORY_CACHE.is_miss(categories):
+                categories = _QUERY_CATEGORY_CACHE.get_similar(vector)
+            if _QUERY_LOCATION_CACHE.is_miss(location):
+                location = _QUERY_LOCATION_CACHE.get_similar(vector)
+            if _QUERY_CATEGORY_CACHE.is_miss(categories) or _QUERY_LOCATION_CACHE.is_miss(location):
+                fresh_categories, fresh_location = await self._extract_query_info(query)
+                if _QUERY_CATEGORY_CACHE.is_miss(categories):
+                    categories = fresh_categories
+                if _QUERY_LOCATION_CACHE.is_miss(location):
+                    location = fresh_location
+            _QUERY_CATEGORY_CACHE.put(category_key, categories, vector)
+            _QUERY_LOCATION_CACHE.put(location_key, location, vector)
+        return copy.copy(categories), copy.copy(location)
+
+    async def _extract_query_info(self, query: str) -> tuple[CategoryInfo, dict[str, float] | None]:
+        """카테고리 + 위치를 한 번의 chat completion으로 추출."""
+        response = await self._async_client.chat.completions.create(
+            model=settings.openai_response_model,
+            messages=[
+                *_QUERY_INFO_MSG_HEAD,
+                {"role": "user", "content": _QUERY_INFO_USER_TEMPLATE.format(query=query)},
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.2,
         )
+        content = response.choices[0].message.content
+        data: dict[str, Any] = orjson.loads(content)
+        return self._query_categories_from_data(data), self._location_from_data(data)
 
     def extract_categories_from_query(self, query: str) -> CategoryInfo:
+        """Extract structured category info from user query (캐시 경유)."""
+        return self._cached_query_call(_QUERY_CATEGORY_CACHE, query, self._extract_categories_from_query)
+
+    def extract_location_from_query(self, query: str) -> dict[str, float] | None:
+        """자연어 쿼리에서 위치 정보 추출 (캐시 경유)."""
+        return self._cached_query_call(_QUERY_LOCATION_CACHE, query, self._extract_location_from_query)
+
+    def _extract_categories_from_query(self, query: str) -> CategoryInfo:
         """Extract structured category info from user query via LLM."""
-        system_prompt = (
-            "너는 사용자의 장소 추천 요청에서 동행자/메뉴/분위기/모임목적/업종(place_type) 정보를 추출하는 어시스턴트야. "
-            "JSON만 반환하고 값이 없으면 null을 사용해. "
-            "모든 필드는 반드시 문자열(string) 타입이어야 하며, 여러 값이 있으면 쉼표로 구분된 하나의 문자열로 반환해. "
-            "리스트나 배열 형태로 반환하지 마."
-        )
-        user_prompt = (
-            "사용자 요청에서 다음 필드를 추출해줘:\n"
-            "- companion (동행자: 문자열, 예: 친구, 연인, 가족, 혼자 등)\n"
-            "- menu (먹고 싶은 메뉴/음식: 문자열. 구체적인 음식·메뉴일 때만 채워줘. 예: 파스타, 스테이크, 라떼, 브런치, 회, 초밥, 치킨, 베이글 등. '한식', '카페', '양식'처럼 장소 종류는 place_type에 넣고 menu에는 넣지 마)\n"
-            "- mood (분위기: 문자열, 예: 조용한, 시끌벅적한, 로맨틱한, 편안한 등)\n"
-            "- purpose (모임 목적: 문자열, 예: 데이트, 비즈니스, 친목, 회식 등)\n"
-            "- place_type (사용자가 원하는 장소의 업종/종류: 문자열 하나만. 예: 카페, 한식, 이탈리아음식, 일식, 중식, 양식, 베이커리, 술집, 호프 등. '카페 추천해줘', '한식당 있어?', '이탈리안 가고 싶어'처럼 구체적인 업종이 있으면 그걸로 채우고, 없으면 null)\n\n"
-            "중요: 모든 값은 문자열(string) 타입으로, 리스트나 배열은 사용하지 마세요. place_type은 DB 장소 카테고리(업종)와 매칭하므로 한 단어 또는 짧은 표현(예: 이탈리아음식)으로만 적어줘.\n\n"
-            f"사용자 요청: {query}"
-        )
         response = self._client.chat.completions.create(
             model=settings.openai_response_model,
             messages=[
-                {
-                    "role": "system",
-                    "content": system_prompt,
-                },
-                {
-                    "role": "user",
-                    "content": user_prompt,
-                },
+                *_QUERY_CATEGORY_MSG_HEAD,
+                {"role": "user", "content": _QUERY_CATEGORY_USER_TEMPLATE.format(query=query)},
             ],
             response_format={"type": "json_object"},
             temperature=0.2,
         )
         content = response.choices[0].message.content
-        data: dict[str, Any] = json.loads(content)
-        
-        # 안전장치: 리스트/숫자/"null" 문자열 등을 정규화
-        def normalize_value(value: Any) -> str | None:
-            if value is None:
-                return None
-            if isinstance(value, list):
-                joined = ", ".join(str(v) for v in value if v)
-                s = joined.strip()
-            elif isinstance(value, (int, float)):
-                s = str(value).strip()
-            else:
-                s = str(value).strip()
-            if not s:
-                return None
-            lowered = s.lower()
-            if lowered in {"null", "none"} or s in {"없음", "없다"}:
-                return None
-            return s
-        
-        return CategoryInfo(
-            companion=normalize_value(data.get("companion")),
-            menu=normalize_value(data.get("menu")),
-            mood=normalize_value(data.get("mood")),
-            purpose=normalize_value(data.get("purpose")),
-            place_type=normalize_value(data.get("place_type")),
-        )
+        data: dict[str, Any] = orjson.loads(content)
+        return self._query_categories_from_data(data)
 
-    def extract_location_from_query(self, query: str) -> dict[str, float] | None:
+    @staticmethod
+    def _query_categories_from_data(data: dict[str, Any]) -> CategoryInfo:
+        """쿼리 추출 JSON에서 CategoryInfo 생성 (위치 등 나머지 키는 무시)."""
+        return RawCategory.model_validate(data)
+
+    def _extract_location_from_query(self, query: str) -> dict[str, float] | None:
         """자연어 쿼리에서 위치 정보 추출 (위도/경도 또는 지역명)."""
-        system_prompt = (
-            "너는 사용자의 장소 추천 요청에서 위치 정보를 추출하는 어시스턴트야. "
-            "위치 정보가 있으면 JSON으로 반환하고, 없으면 null을 반환해. "
-            "지역명이 있으면 해당 지역의 대표적인 위도/경도를 반환해줘. "
-            "예: 홍대 -> latitude: 37.5563, longitude: 126.9239"
-        )
-        user_prompt = (
-            "사용자 요청에서 위치 정보를 추출하고, 지역명이면 해당 지역의 위도/경도를 반환해줘:\n"
-            "- latitude (위도: 숫자, 지역명이면 해당 지역의 대표 위도)\n"
-            "- longitude (경도: 숫자, 지역명이면 해당 지역의 대표 경도)\n"
-            "- region (지역명: 문자열, 참고용)\n\n"
-            f"사용자 요청: {query}\n\n"
-            "지역명 예시:\n"
-            "- 홍대: latitude: 37.5563, longitude: 126.9239\n"
-            "- 강남: latitude: 37.4979, longitude: 127.0276\n"
-            "- 신촌: latitude: 37.5551, longitude: 126.9368\n"
-            "- 이태원: latitude: 37.5345, longitude: 126.9947"
-        )
         response = self._client.chat.completions.create(
             model=settings.openai_response_model,
             messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
+                *_QUERY_LOCATION_MSG_HEAD,
+                {"role": "user", "content": _QUERY_LOCATION_USER_TEMPLATE.format(query=query)},
             ],
             response_format={"type": "json_object"},
             temperature=0.2,
         )
         content = response.choices[0].message.content
-        data: dict[str, Any] = json.loads(content)
-        
+        data: dict[str, Any] = orjson.loads(content)
+        return self._location_from_data(data)
+
+    @staticmethod
+    def _location_from_data(data: dict[str, Any]) -> dict[str, float] | None:
+        """위치 추출 JSON에서 위도/경도 dict 생성."""
         # 위도/경도가 있으면 반환
-        if "latitude" in data and "longitude" in data:
+        if data.get("latitude") is not None and data.get("longitude") is not None:
             try:
                 return {
                     "latitude": float(data["latitude"]),
@@ -200,27 +358,11 @@ class LLMService:
         context = "\n".join(f"- {line}" for line in clipped)
         place_info = f"장소명: {place_name}\n" if place_name else ""
 
-        system_prompt = (
-            "너는 여러 사용자 리뷰를 1개의 대표 리뷰로 압축 요약하는 어시스턴트야. "
-            "추천 시스템에서 카테고리(companion/menu/mood/purpose)를 잘 추출할 수 있게 "
-            "핵심 키워드를 빠뜨리지 말고 한국어로 요약해."
-        )
-        user_prompt = (
-            f"{place_info}"
-            "아래 리뷰들을 바탕으로 단일 요약 리뷰를 작성해줘.\n"
-            "조건:\n"
-            "1) 250~700자 사이의 자연스러운 한국어 문단 1개\n"
-            "2) 동행자, 메뉴, 분위기, 방문목적 관련 단서를 최대한 포함\n"
-            "3) 긍정/부정 포인트를 균형 있게 포함\n"
-            "4) 없는 사실을 만들지 말 것\n\n"
-            f"리뷰 목록:\n{context}"
-        )
-
         response = self._client.chat.completions.create(
             model=settings.openai_response_model,
             messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
+                *_SUMMARY_MSG_HEAD,
+                {"role": "user", "content": _SUMMARY_USER_TEMPLATE.format(place_info=place_info, context=context)},
             ],
             temperature=0.2,
         )
@@ -228,11 +370,57 @@ class LLMService:
 
     def embed_text(self, text: str) -> list[float]:
         """Return OpenAI embedding vector."""
-        result = self._client.embeddings.create(
-            model=settings.openai_embedding_model,
-            input=text,
-        )
-        return result.data[0].embedding
+        return self.embed_texts([text])[0]
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """여러 텍스트를 EMBEDDING_BATCH_SIZE 단위 배치 호출로 임베딩 (입력 순서 유지, 캐시에 없는 것만 호출)."""
+        vectors, missing = self._embeddings_from_cache(texts)
+        for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+            chunk = missing[start:start + EMBEDDING_BATCH_SIZE]
+            result = self._client.embeddings.create(
+                model=settings.openai_embedding_model,
+                input=chunk,
+            )
+            self._fill_embeddings(texts, vectors, chunk, result.data)
+        return vectors
+
+    @staticmethod
+    def _embeddings_from_cache(texts: list[str]) -> tuple[list[list[float] | None], list[str]]:
+        """캐시 hit은 채우고, miss 텍스트는 중복 없이 모아 반환."""
+        vectors = [_EMBEDDING_CACHE.get(text) for text in texts]
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        return vectors, missing
+
+    @staticmethod
+    def _fill_embeddings(
+        texts: list[str],
+        vectors: list[list[float] | None],
+        chunk: list[str],
+        data: list[Any],
+    ) -> None:
+        """API 응답(data[i].index는 chunk 기준)을 캐시에 넣고 vectors의 빈 자리를 채운다."""
+        embedded = {chunk[item.index]: item.embedding for item in data}
+        for text, embedding in embedded.items():
+            _EMBEDDING_CACHE.put(text, embedding)
+        for i, text in enumerate(texts):
+            if vectors[i] is None and text in embedded:
+                vectors[i] = embedded[text]
+
+    async def embed_text_async(self, text: str) -> list[float]:
+        """Return OpenAI embedding vector (API 요청 경로용, 공유 커넥션 풀 사용)."""
+        return (await self.embed_texts_async([text]))[0]
+
+    async def embed_texts_async(self, texts: list[str]) -> list[list[float]]:
+        """embed_texts의 비동기 버전 (API 요청 경로용)."""
+        vectors, missing = self._embeddings_from_cache(texts)
+        for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+            chunk = missing[start:start + EMBEDDING_BATCH_SIZE]
+            result = await self._async_client.embeddings.create(
+                model=settings.openai_embedding_model,
+                input=chunk,
+            )
+            self._fill_embeddings(texts, vectors, chunk, result.data)
+        return vectors
 
 
 _llm_service_instance: LLMService | None = None
@@ -246,6 +434,14 @@ def get_llm_service() -> LLMService:
     return _llm_service_instance
 
 
+async def close_llm_service() -> None:
+    """생성된 LLM 서비스가 있으면 커넥션 풀을 닫는다 (앱 종료 시)."""
+    global _llm_service_instance
+    if _llm_service_instance is not None:
+        await _llm_service_instance.aclose()
+        _llm_service_instance = None
+
+
 # 하위 호환성을 위한 모듈 레벨 변수 (lazy)
 class _LazyLLMService:
     """Lazy wrapper for LLM service."""
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Iterable
-
-from sqlalchemy import Select, func, select
+import logging
+import math
+from typing import Sequence
+
+import numpy as np
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import ColumnElement, Select, and_, cast, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -14,11 +20,19 @@ from app.models.review_embedding import PlaceEmbedding
 from app.models.place_summary_embedding import PlaceSummaryEmbedding
 from app.schemas.review import CategoryInfo
 from app.schemas.place import PlaceOut
-from app.services.llm import llm_service
+from app.services.llm import get_llm_service
+from app.services.embedding_index import SummaryEmbeddingIndex
+from app.services.extraction_cache import content_hash, load_cached_categories, store_cached_categories
+from app.services.scoring import build_query_matrix, collect_scores, score_places
 
+logger = logging.getLogger(__name__)
 
 CATEGORY_KEYS = ("companion", "menu", "mood", "purpose")
 SUMMARY_REVIEW_LIMIT = 100
+# 전체 검색 시 ANN으로 먼저 뽑는 임베딩 행 수 = 결과 장소 수 × 이 값
+ANN_ROWS_PER_RESULT = 10
+# pgvector가 허용하는 hnsw.ef_search 상한
+HNSW_EF_SEARCH_MAX = 1000
 
 # 카테고리별 가중치 (고정값)
 CATEGORY_WEIGHTS = {
@@ -30,36 +44,234 @@ CATEGORY_WEIGHTS = {
 
 # ai_score 0~100 환산용 (가중치 합 = 1.0이면 만점 1.0)
 MAX_RAW_SCORE = sum(CATEGORY_WEIGHTS.values())
+# 카테고리 → 행렬 인덱스, 가중치 벡터 (scoring 커널에 연속 배열로 그대로 전달)
+CATEGORY_INDEX = {key: i for i, key in enumerate(CATEGORY_KEYS)}
+WEIGHTS_VEC = np.array([CATEGORY_WEIGHTS[key] for key in CATEGORY_KEYS], dtype=np.float32)
+_ABSOLUTE_SCORE_SCALE = 100.0 / MAX_RAW_SCORE if MAX_RAW_SCORE > 0 else 0.0
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.0
 
 # 메뉴가 구체적으로 지정됐을 때, 이 거리(코사인 거리) 이내인 리뷰 메뉴 임베딩이 있는 장소만 후보로 둠.
 # (거리 0 = 동일, 2 = 반대. 0.45 이하면 유사도 약 0.775 이상으로 실제 그 메뉴를 다루는 장소로 간주)
 MENU_MATCH_DISTANCE_THRESHOLD = 0.45
 # 메뉴 지정 시, 이 가중 점수(menu 기여분) 미만인 장소는 최종 추천에서 제외
 MENU_MIN_WEIGHTED_SCORE = 0.28
+# 서버 기동 시 적재하는 장소 요약 임베딩 centroid 행렬 (요청 경로에서 pgvector 쿼리 생략)
+summary_embedding_index = SummaryEmbeddingIndex(CATEGORY_KEYS, WEIGHTS_VEC)
+# (인덱스 미적재 시) 후보 장소가 이 개수 이하이면 카테고리별 pgvector 쿼리 대신 centroid를 한 번에 받아 프로세스 내에서 점수 계산
+IN_PROCESS_SCORING_MAX_CANDIDATES = 500
+# 추천 결과 장소는 PlaceOut 필드만 SELECT (읽기 전용 커넥션에서도 ORM 객체 없이 동작)
+_PLACE_OUT_COLUMNS = tuple(getattr(Place, name) for name in PlaceOut.model_fields)
+
+
+def to_absolute_scores(raw_scores: Sequence[float]) -> list[float]:
+    """raw 가중합 점수들을 만점 100점 절대점수(소수 둘째자리)로 한 번에 환산."""
+    raws = np.asarray(raw_scores, dtype=np.float64)
+    return np.minimum(100.0, np.round(raws * _ABSOLUTE_SCORE_SCALE, 2)).tolist()
+
+
+def haversine_km(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+) -> np.ndarray:
+    """기준 좌표에서 여러 좌표까지의 거리(km, haversine)를 한 번에 계산."""
+    lat1 = np.radians(latitude)
+    lat2 = np.radians(latitudes)
+    dlat = lat2 - lat1
+    dlon = np.radians(longitudes) - np.radians(longitude)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * np.arcsin(np.sqrt(a))
+
+
+def within_radius_clause(latitude: float, longitude: float, radius_km: float) -> ColumnElement[bool]:
+    """반경 필터 SQL 조건 (위도/경도 bounding box + earthdistance).
+
+    위도/경도 BETWEEN은 (latitude, longitude) B-tree 인덱스로, earth_box @> ll_to_earth(...) 는
+    GiST(ll_to_earth(latitude, longitude)) 인덱스로 후보를 줄일 수 있어 플래너가 더 싼 쪽을 고른다.
+    둘 다 사각형이라 earth_distance로 원형 반경을 한 번 더 확인한다.
+    """
+    radius_m = radius_km * 1000.0
+    # 위도 1도 ≈ 111km, 경도 1도 ≈ 111km·cos(위도). 극 근처에서 0으로 나누지 않도록 하한을 둔다.
+    dlat_deg = radius_km / KM_PER_DEGREE
+    dlon_deg = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01))
+    center = func.ll_to_earth(latitude, longitude)
+    point = func.ll_to_earth(Place.latitude, Place.longitude)
+    return and_(
+        Place.latitude.between(latitude - dlat_deg, latitude + dlat_deg),
+        Place.longitude.between(longitude - dlon_deg, longitude + dlon_deg),
+        func.earth_box(center, radius_m).op("@>")(point),
+        func.earth_distance(center, point) <= radius_m,
+    )
+
+
+async def find_place_ids_within_radius(db: AsyncSession | AsyncConnection, location_filter: dict[str, float]) -> list[int]:
+    """location_filter(latitude/longitude/radius_km) 반경 안의 장소 id 목록."""
+    radius_km = location_filter.get("radius_km") or settings.recommendation_default_radius_km
+    stmt = select(Place.id).where(
+        within_radius_clause(location_filter["latitude"], location_filter["longitude"], radius_km)
+    )
+    return list((await db.scalars(stmt)).all())
+
+
+def _unit_vector(vector: Sequence[float]) -> list[float]:
+    """L2 정규화. 저장 임베딩을 단위 벡터로 맞춰 내적(<#>)이 코사인과 같은 순위를 내게 한다."""
+    arr = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(arr))
+    return (arr / norm if norm else arr).tolist()
+
+
+def _halfvec_negative_inner_product(query_vector: list[float]) -> ColumnElement[float]:
+    """FP16으로 캐스팅한 음의 내적(<#>). ((embedding::halfvec) halfvec_ip_ops) HNSW 표현식 인덱스를 탄다.
+
+    저장 임베딩과 쿼리가 단위 벡터라 코사인 거리와 순위가 같고, 거리 계산마다 노름을 구하지 않는다.
+    """
+    embedding_type = PlaceSummaryEmbedding.embedding.type
+    half = HALFVEC(embedding_type.dim)
+    return cast(PlaceSummaryEmbedding.embedding, half).max_inner_product(
+        cast(literal(query_vector, embedding_type), half)
+    )
+
+
+def _nearest_places_stmt(category: str, query_vector: list[float], limit: int) -> Select:
+    """halfvec HNSW 인덱스로 쿼리에 가까운 임베딩 행 limit개의 place_id (ORDER BY <#> LIMIT)."""
+    return (
+        select(PlaceSummaryEmbedding.place_id)
+        .where(PlaceSummaryEmbedding.category == category)
+        .order_by(_halfvec_negative_inner_product(_unit_vector(query_vector)))
+        .limit(limit)
+    )
 
 
 def _similar_places_stmt(
     category: str,
     query_vector: list[float],
-    limit: int,
-    candidate_place_ids: list[int] | None = None,
+    candidate_place_ids: list[int] | Select,
 ) -> Select:
-    """장소 요약 임베딩 단위로 쿼리와 코사인 거리 계산 후 장소별 랭킹."""
-    distance = PlaceSummaryEmbedding.embedding.cosine_distance(query_vector)
-    stmt = (
+    """후보 장소마다 이 카테고리 임베딩과 쿼리의 평균 코사인 거리.
+
+    후보 전체의 평균을 LIMIT 없이 돌려준다 (카테고리별로 잘라 합산하면 장소마다 빠진 카테고리가 달라져
+    인메모리 경로와 총점이 달라진다). 단위 벡터이므로 코사인 거리는 1 - 내적 = 1 + (<#>)로 계산한다.
+    """
+    distance = 1 + PlaceSummaryEmbedding.embedding.max_inner_product(_unit_vector(query_vector))
+    return (
         select(
             PlaceSummaryEmbedding.place_id,
             func.avg(distance).label("avg_distance"),
         )
         .where(PlaceSummaryEmbedding.category == category)
+        .where(PlaceSummaryEmbedding.place_id.in_(candidate_place_ids))
+        .group_by(PlaceSummaryEmbedding.place_id)
     )
+
+
+async def _score_places_sql(
+    db: AsyncSession | AsyncConnection,
+    query_vectors: dict[str, list[float]],
+    limit: int,
+    candidate_place_ids: list[int] | None,
+) -> tuple[dict[int, float], dict[int, dict[str, float]]]:
+    """카테고리별 pgvector 유사도 쿼리 결과를 가중합.
+
+    후보 장소가 없으면 (전체 검색) 카테고리마다 halfvec HNSW 인덱스로 가까운 행을 뽑아 그 장소들의 합집합을
+    후보로 삼는다. 후보의 모든 카테고리 평균을 UNION ALL로 묶어 한 번의 왕복으로 가져오므로,
+    장소별 총점은 인메모리 경로(SummaryEmbeddingIndex/_score_places_in_process)와 같다.
+    """
+    candidates: list[int] | Select
     if candidate_place_ids:
-        stmt = stmt.where(PlaceSummaryEmbedding.place_id.in_(candidate_place_ids))
-    return (
-        stmt.group_by(PlaceSummaryEmbedding.place_id)
-        .order_by("avg_distance")
-        .limit(limit * 5)
-    )
+        candidates = candidate_place_ids
+    else:
+        ann_rows = limit * 5 * ANN_ROWS_PER_RESULT
+        # HNSW 스캔은 ef_search개까지만 후보를 내고 category 조건은 그 뒤에 걸러지므로,
+        # 이번 트랜잭션에서만 ef_search를 (ANN LIMIT × 카테고리 수)까지 올려 LIMIT이 실제로 채워지게 한다.
+        ef_search = min(
+            HNSW_EF_SEARCH_MAX,
+            max(settings.hnsw_ef_search, ann_rows * len(CATEGORY_KEYS)),
+        )
+        await db.execute(select(func.set_config("hnsw.ef_search", str(ef_search), True)))
+        nearest = [
+            select(_nearest_places_stmt(key, vector, ann_rows).subquery().c.place_id)
+            for key, vector in query_vectors.items()
+        ]
+        nearest_places = (nearest[0] if len(nearest) == 1 else union_all(*nearest)).cte("nearest_places")
+        candidates = select(nearest_places.c.place_id)
+
+    branches = []
+    for key, vector in query_vectors.items():
+        averages = _similar_places_stmt(key, vector, candidates).subquery()
+        branches.append(select(literal(key).label("category"), averages.c.place_id, averages.c.avg_distance))
+    stmt = branches[0] if len(branches) == 1 else union_all(*branches)
+    rows = (await db.execute(stmt)).fetchall()
+
+    place_scores: dict[int, float] = {}
+    place_scores_by_category: dict[int, dict[str, float]] = {}
+    for key, place_id, avg_distance in rows:
+        weight = CATEGORY_WEIGHTS.get(key, 1.0)
+        similarity_score = 1.0 - (avg_distance / 2.0)
+        weighted_score = similarity_score * weight
+        if place_id not in place_scores:
+            place_scores[place_id] = 0.0
+            place_scores_by_category[place_id] = {}
+        place_scores[place_id] += weighted_score
+        place_scores_by_category[place_id][key] = round(weighted_score, 4)
+    return place_scores, place_scores_by_category
+
+
+async def _score_places_in_process(
+    db: AsyncSession | AsyncConnection,
+    query_vectors: dict[str, list[float]],
+    candidate_place_ids: list[int],
+) -> tuple[dict[int, float], dict[int, dict[str, float]]]:
+    """후보 장소의 (장소, 카테고리)별 임베딩 평균을 한 번에 받아 scoring 커널로 가중합."""
+    rows = (
+        await db.execute(
+            select(
+                PlaceSummaryEmbedding.place_id,
+                PlaceSummaryEmbedding.category,
+                func.avg(PlaceSummaryEmbedding.embedding),
+            )
+            .where(PlaceSummaryEmbedding.place_id.in_(candidate_place_ids))
+            .where(PlaceSummaryEmbedding.category.in_(list(query_vectors)))
+            .group_by(PlaceSummaryEmbedding.place_id, PlaceSummaryEmbedding.category)
+        )
+    ).all()
+    if not rows:
+        return {}, {}
+
+    place_ids = sorted({row[0] for row in rows})
+    place_index = {pid: i for i, pid in enumerate(place_ids)}
+    dim = len(rows[0][2])
+
+    # 임베딩이 단위 벡터라 avg(embedding)·q̂ = 개별 코사인 유사도의 평균
+    place_emb = np.zeros((len(place_ids), len(CATEGORY_KEYS), dim), dtype=np.float32)
+    present = np.zeros((len(place_ids), len(CATEGORY_KEYS)), dtype=np.bool_)
+    for place_id, category, embedding in rows:
+        i, c = place_index[place_id], CATEGORY_INDEX[category]
+        place_emb[i, c] = embedding
+        present[i, c] = True
+
+    query_vecs, weights = build_query_matrix(query_vectors, CATEGORY_INDEX, WEIGHTS_VEC, dim)
+    by_category = score_places(place_emb, present, query_vecs, weights)
+    return collect_scores(place_ids, present, weights, by_category, CATEGORY_KEYS)
+
+
+async def _score_places(
+    db: AsyncSession | AsyncConnection,
+    query_vectors: dict[str, list[float]],
+    limit: int,
+    candidate_place_ids: list[int] | None,
+) -> tuple[dict[int, float], dict[int, dict[str, float]]]:
+    """카테고리별 쿼리 벡터로 장소 점수(가중합)와 카테고리별 점수를 계산."""
+    if not query_vectors:
+        return {}, {}
+    # 첫 적재가 비었거나(임베딩 0개/장소 수 초과) 실패했어도 TTL마다 다시 시도한다
+    summary_embedding_index.refresh_if_stale()
+    if summary_embedding_index.ready:
+        return summary_embedding_index.score(query_vectors, candidate_place_ids)
+    if candidate_place_ids is not None and len(candidate_place_ids) <= IN_PROCESS_SCORING_MAX_CANDIDATES:
+        return await _score_places_in_process(db, query_vectors, candidate_place_ids)
+    return await _score_places_sql(db, query_vectors, limit, candidate_place_ids)
 
 
 def _split_values(value: str | None) -> list[str]:
@@ -69,6 +281,31 @@ def _split_values(value: str | None) -> list[str]:
     return list(dict.fromkeys(values))
 
 
+def _embed_values(
+    db: Session,
+    model: type[PlaceEmbedding] | type[PlaceSummaryEmbedding],
+    texts: list[str],
+) -> list[list[float]]:
+    """값 텍스트들을 임베딩. 다른 장소/리뷰에 이미 저장된 같은 값("친구", "한식" 등)의 벡터는 재사용하고 없는 값만 API 호출."""
+    unique = list(dict.fromkeys(texts))
+    if not unique:
+        return []
+    stored = dict(
+        db.execute(
+            select(model.value_text, model.embedding)
+            .where(model.value_text.in_(unique))
+            .distinct(model.value_text)
+        ).all()
+    )
+    missing = [text for text in unique if text not in stored]
+    if missing:
+        # 내적 인덱스/검색을 위해 단위 벡터로 저장 (OpenAI 임베딩은 이미 정규화돼 있어 값은 사실상 그대로)
+        stored.update(
+            zip(missing, (_unit_vector(vector) for vector in get_llm_service().embed_texts(missing)))
+        )
+    return [stored[text] for text in texts]
+
+
 def upsert_place(db: Session, data: dict) -> Place:
     """Insert or update place metadata."""
     from datetime import datetime
@@ -106,58 +343,80 @@ def upsert_place(db: Session, data: dict) -> Place:
                 payload["review_count"] = 0
             place = Place(**payload)
             db.add(place)
+        # refresh 생략: 방금 쓴 값은 세션에 있다 (SessionLocal은 커밋 후에도 속성을 만료시키지 않음)
         db.commit()
-        db.refresh(place)
         return place
     except Exception:
         db.rollback()
         raise
 
 
-def refresh_embeddings(db: Session, place_id: int, review_id: int, content: str) -> tuple[CategoryInfo, int]:
-    """Extract categories from review text and store embeddings (리뷰별 각각 저장)."""
-    import sys
-    
-    def split_values(value: str | None) -> list[str]:
-        if not value:
-            return []
-        # 동일 리뷰 내 중복 토큰(예: "친구, 친구, 친구")은 한 번만 처리
-        values = [v.strip() for v in str(value).split(",") if v.strip()]
-        return list(dict.fromkeys(values))
-    
-    categories = llm_service.extract_categories(content)
-    inserted = 0
-    
-    for key in CATEGORY_KEYS:
-        value = getattr(categories, key)
-        if not value:
-            continue
-        values = split_values(value)
-        for single_value in values:
-            exists = (
-                db.query(PlaceEmbedding)
-                .filter(
-                    PlaceEmbedding.place_id == place_id,
-                    PlaceEmbedding.review_id == review_id,
-                    PlaceEmbedding.category == key,
-                    PlaceEmbedding.value_text == single_value,
-                )
-                .first()
-            )
-            if exists:
-                continue
-            embedding = llm_service.embed_text(single_value)
-            embedding_row = PlaceEmbedding(
-                place_id=place_id,
-                review_id=review_id,
-                category=key,
-                value_text=single_value,
-                embedding=embedding,
-            )
-            db.add(embedding_row)
-            inserted += 1
-            print(f"[DEBUG] place_id={place_id}, review_id={review_id}, {key}=\"{single_value}\" → 임베딩 생성", file=sys.stderr)
-    db.commit()
+def refresh_embeddings(
+    db: Session,
+    place_id: int,
+    review_id: int,
+    content: str,
+    categories: CategoryInfo | None = None,
+    commit: bool = True,
+) -> tuple[CategoryInfo, int]:
+    """Extract categories from review text and store embeddings (리뷰별 각각 저장).
+
+    categories를 넘기면 (호출 측에서 병렬로 미리 추출한 경우) LLM 추출을 건너뛴다.
+    없으면 본문 해시로 추출 캐시를 먼저 보고, 없을 때만 LLM을 호출해 캐시에 남긴다.
+    commit=False면 커밋은 호출 측에 맡긴다 (여러 리뷰를 한 트랜잭션으로 묶을 때).
+    """
+    if categories is None:
+        h = content_hash(content)
+        categories = load_cached_categories(db, [h]).get(h)
+        if categories is None:
+            categories = get_llm_service().extract_categories(content)
+            store_cached_categories(db, {h: categories})
+
+    # 이 리뷰에 이미 저장된 (카테고리, 값)은 한 번의 조회로 가져와 건너뛴다
+    existing = {
+        (category, value_text)
+        for category, value_text in db.query(PlaceEmbedding.category, PlaceEmbedding.value_text)
+        .filter(PlaceEmbedding.place_id == place_id, PlaceEmbedding.review_id == review_id)
+        .all()
+    }
+    # 동일 리뷰 내 중복 토큰(예: "친구, 친구, 친구")은 한 번만 처리
+    pending = [
+        (key, single_value)
+        for key in CATEGORY_KEYS
+        for single_value in _split_values(getattr(categories, key))
+        if (key, single_value) not in existing
+    ]
+
+    if not pending:
+        if commit:
+            db.commit()
+        return categories, 0
+
+    # 새로 만들 값들은 (저장된 같은 값 벡터를 제외하고) 임베딩 API 한 번에 배치 호출하고, INSERT 한 문장으로 저장
+    # (조회 이후 동시 적재된 값은 uq_review_embedding_per_review 충돌로 건너뛰고 RETURNING으로 개수 집계)
+    embeddings = _embed_values(db, PlaceEmbedding, [single_value for _, single_value in pending])
+    rows = [
+        {
+            "place_id": place_id,
+            "review_id": review_id,
+            "category": key,
+            "value_text": single_value,
+            "embedding": embedding,
+        }
+        for (key, single_value), embedding in zip(pending, embeddings)
+    ]
+    stmt = (
+        pg_insert(PlaceEmbedding)
+        .values(rows)
+        .on_conflict_do_nothing(constraint="uq_review_embedding_per_review")
+        .returning(PlaceEmbedding.id)
+    )
+    inserted = len(db.execute(stmt).all())
+    if logger.isEnabledFor(logging.DEBUG):
+        for key, single_value in pending:
+            logger.debug('place_id=%s, review_id=%s, %s="%s" → 임베딩 생성', place_id, review_id, key, single_value)
+    if commit:
+        db.commit()
     return categories, inserted
 
 
@@ -201,35 +460,38 @@ def refresh_place_summary_embeddings_from_review_texts(
     if not cleaned:
         return "", CategoryInfo(), 0
 
-    summary_text = llm_service.summarize_reviews(cleaned, place_name)
+    llm = get_llm_service()
+    summary_text = llm.summarize_reviews(cleaned, place_name)
     if not summary_text:
         return "", CategoryInfo(), 0
 
-    categories = llm_service.extract_categories(summary_text)
+    categories = llm.extract_categories(summary_text)
     db.query(PlaceSummaryEmbedding).filter(PlaceSummaryEmbedding.place_id == place_id).delete()
 
-    inserted = 0
-    for key in CATEGORY_KEYS:
-        values = _split_values(getattr(categories, key))
-        for single_value in values:
-            embedding = llm_service.embed_text(single_value)
-            db.add(
-                PlaceSummaryEmbedding(
-                    place_id=place_id,
-                    category=key,
-                    value_text=single_value,
-                    summary_text=summary_text,
-                    embedding=embedding,
-                )
-            )
-            inserted += 1
+    pending = [
+        (key, single_value)
+        for key in CATEGORY_KEYS
+        for single_value in _split_values(getattr(categories, key))
+    ]
+    embeddings = _embed_values(db, PlaceSummaryEmbedding, [single_value for _, single_value in pending])
+    db.add_all(
+        PlaceSummaryEmbedding(
+            place_id=place_id,
+            category=key,
+            value_text=single_value,
+            summary_text=summary_text,
+            embedding=embedding,
+        )
+        for (key, single_value), embedding in zip(pending, embeddings)
+    )
+    inserted = len(pending)
 
     db.commit()
     return summary_text, categories, inserted
 
 
-def build_profile_vectors(
-    db: Session,
+async def build_profile_vectors(
+    db: AsyncSession | AsyncConnection,
     past_place_ids: list[int],
 ) -> dict[str, list[float]]:
     """과거 선택 장소들의 카테고리별 임베딩 평균을 내어 유저 프로필 벡터를 생성."""
@@ -238,9 +500,11 @@ def build_profile_vectors(
 
     profile: dict[str, list[list[float]]] = {key: [] for key in CATEGORY_KEYS}
 
-    rows = db.execute(
-        select(PlaceSummaryEmbedding.category, PlaceSummaryEmbedding.embedding)
-        .where(PlaceSummaryEmbedding.place_id.in_(past_place_ids))
+    rows = (
+        await db.execute(
+            select(PlaceSummaryEmbedding.category, PlaceSummaryEmbedding.embedding)
+            .where(PlaceSummaryEmbedding.place_id.in_(past_place_ids))
+        )
     ).fetchall()
 
     for category, embedding in rows:
@@ -258,28 +522,25 @@ def build_profile_vectors(
     return result
 
 
-def recommend_places_by_profile(
-    db: Session,
+async def _fetch_places_in_order(db: AsyncSession | AsyncConnection, place_ids: list[int]) -> list:
+    """place_ids 순서대로 PlaceOut 컬럼 행을 반환 (DB에 없는 id는 건너뜀)."""
+    if not place_ids:
+        return []
+    rows = (await db.execute(select(*_PLACE_OUT_COLUMNS).where(Place.id.in_(place_ids)))).all()
+    by_id = {row.id: row for row in rows}
+    return [by_id[pid] for pid in place_ids if pid in by_id]
+
+
+async def recommend_places_by_profile(
+    db: AsyncSession | AsyncConnection,
     profile_vectors: dict[str, list[float]],
     limit: int,
     candidate_place_ids: list[int] | None = None,
 ) -> tuple[list[PlaceOut], dict[int, float], dict[int, dict[str, float]]]:
     """유저 프로필 벡터 기반으로 장소를 추천. 카테고리별 유사도 가중합으로 랭킹."""
-    place_scores: dict[int, float] = {}
-    place_scores_by_category: dict[int, dict[str, float]] = {}
-
-    for key, vector in profile_vectors.items():
-        weight = CATEGORY_WEIGHTS.get(key, 1.0)
-        stmt = _similar_places_stmt(key, vector, limit * 5, candidate_place_ids)
-        rows = db.execute(stmt).fetchall()
-        for place_id, avg_distance in rows:
-            similarity_score = 1.0 - (avg_distance / 2.0)
-            weighted_score = similarity_score * weight
-            if place_id not in place_scores:
-                place_scores[place_id] = 0.0
-                place_scores_by_category[place_id] = {}
-            place_scores[place_id] += weighted_score
-            place_scores_by_category[place_id][key] = round(weighted_score, 4)
+    place_scores, place_scores_by_category = await _score_places(
+        db, profile_vectors, limit, candidate_place_ids
+    )
 
     if not place_scores:
         return [], {}, {}
@@ -288,15 +549,14 @@ def recommend_places_by_profile(
     top_place_ids = [pid for pid, _ in sorted_ids]
     top_scores = {pid: score for pid, score in sorted_ids}
 
-    places = db.execute(select(Place).where(Place.id.in_(top_place_ids))).scalars().all()
-    ordered = sorted(places, key=lambda p: top_place_ids.index(p.id))
+    ordered = await _fetch_places_in_order(db, top_place_ids)
     top_by_cat = {pid: place_scores_by_category.get(pid, {}) for pid in top_place_ids}
 
     return [PlaceOut.model_validate(p) for p in ordered], top_scores, top_by_cat
 
 
-def recommend_places(
-    db: Session,
+async def recommend_places(
+    db: AsyncSession | AsyncConnection,
     categories: CategoryInfo,
     limit: int | None = None,
     location_filter: dict[str, float] | None = None,
@@ -309,24 +569,7 @@ def recommend_places(
     
     candidate_place_ids: list[int] | None = None
     if location_filter:
-        from math import radians, cos, sin, asin, sqrt
-        R = 6371.0
-        lat = location_filter["latitude"]
-        lon = location_filter["longitude"]
-        radius_km = location_filter.get("radius_km") or settings.recommendation_default_radius_km
-        all_places = db.execute(select(Place)).scalars().all()
-        candidate_place_ids = []
-        lat1, lon1 = radians(lat), radians(lon)
-        for place in all_places:
-            if place.latitude is None or place.longitude is None:
-                continue
-            lat2, lon2 = radians(place.latitude), radians(place.longitude)
-            dlat = lat2 - lat1
-            dlon = lon2 - lon1
-            a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-            c = 2 * asin(sqrt(a))
-            if R * c <= radius_km:
-                candidate_place_ids.append(place.id)
+        candidate_place_ids = await find_place_ids_within_radius(db, location_filter)
         if not candidate_place_ids:
             return [], categories, {}, {}
 
@@ -372,7 +615,7 @@ def recommend_places(
             )
             stmt = stmt.where(~cafe_or_bar)
 
-        tab_candidate_ids = [row[0] for row in db.execute(stmt).fetchall()]
+        tab_candidate_ids = [row[0] for row in (await db.execute(stmt)).fetchall()]
         if not tab_candidate_ids:
             return [], categories, {}, {}
         candidate_place_ids = tab_candidate_ids
@@ -384,14 +627,21 @@ def recommend_places(
             stmt_place_type = select(Place.id).where(Place.category.ilike(f"%{place_type}%"))
             if candidate_place_ids is not None:
                 stmt_place_type = stmt_place_type.where(Place.id.in_(candidate_place_ids))
-            candidate_place_ids = [row[0] for row in db.execute(stmt_place_type).fetchall()]
+            candidate_place_ids = [row[0] for row in (await db.execute(stmt_place_type)).fetchall()]
             if not candidate_place_ids:
                 return [], categories, {}, {}
 
+    # 카테고리 값 + 메뉴 필터용 텍스트를 임베딩 API 한 번으로 배치 호출
+    query_texts = {key: getattr(categories, key) for key in CATEGORY_KEYS if getattr(categories, key)}
+    menu_text = (categories.menu or "").strip()
+    embed_inputs = list(dict.fromkeys([*query_texts.values(), *([menu_text] if menu_text else [])]))
+    embedded = dict(zip(embed_inputs, await get_llm_service().embed_texts_async(embed_inputs)))
+
     # 메뉴가 구체적으로 지정됐을 때: 해당 메뉴와 유사한 요약 메뉴 임베딩이 있는 장소만 후보로 제한
-    if categories.menu and (categories.menu or "").strip():
-        menu_vector = llm_service.embed_text((categories.menu or "").strip())
-        dist_expr = PlaceSummaryEmbedding.embedding.cosine_distance(menu_vector)
+    if menu_text:
+        menu_vector = embedded[menu_text]
+        # 단위 벡터끼리의 코사인 거리 = 1 + 음의 내적(<#>)
+        dist_expr = 1 + PlaceSummaryEmbedding.embedding.max_inner_product(_unit_vector(menu_vector))
         stmt_menu = (
             select(PlaceSummaryEmbedding.place_id)
             .where(PlaceSummaryEmbedding.category == "menu")
@@ -400,49 +650,30 @@ def recommend_places(
         )
         if candidate_place_ids is not None:
             stmt_menu = stmt_menu.where(PlaceSummaryEmbedding.place_id.in_(candidate_place_ids))
-        menu_qualified_ids = [row[0] for row in db.execute(stmt_menu).fetchall()]
+        menu_qualified_ids = [row[0] for row in (await db.execute(stmt_menu)).fetchall()]
         if menu_qualified_ids:
             candidate_place_ids = menu_qualified_ids
 
     menu_specified = bool(categories.menu and (categories.menu or "").strip())
-    place_scores: dict[int, float] = {}
-    place_scores_by_category: dict[int, dict[str, float]] = {}
-    for key in CATEGORY_KEYS:
-        value = getattr(categories, key)
-        if not value:
-            continue
-        weight = CATEGORY_WEIGHTS.get(key, 1.0)
-        vector = llm_service.embed_text(value)
-        stmt = _similar_places_stmt(key, vector, limit * 5, candidate_place_ids)
-        rows = db.execute(stmt).fetchall()
-        for place_id, avg_distance in rows:
-            similarity_score = 1.0 - (avg_distance / 2.0)
-            weighted_score = similarity_score * weight
-            if place_id not in place_scores:
-                place_scores[place_id] = 0.0
-                place_scores_by_category[place_id] = {}
-            place_scores[place_id] += weighted_score
-            place_scores_by_category[place_id][key] = round(weighted_score, 4)
+    query_vectors: dict[str, list[float]] = {key: embedded[value] for key, value in query_texts.items()}
+    place_scores, place_scores_by_category = await _score_places(
+        db, query_vectors, limit, candidate_place_ids
+    )
     
     if not place_scores:
         # 카테고리가 하나도 없을 때: 위치 필터가 있으면 반경 내 장소를 거리순으로 반환 (ai_score=0)
         if location_filter and candidate_place_ids:
-            from math import radians, cos, sin, asin, sqrt
-            R = 6371.0
-            lat = location_filter["latitude"]
-            lon = location_filter["longitude"]
-            lat1, lon1 = radians(lat), radians(lon)
-            places_in_radius = db.execute(select(Place).where(Place.id.in_(candidate_place_ids))).scalars().all()
-            with_distance = []
-            for p in places_in_radius:
-                lat2, lon2 = radians(p.latitude), radians(p.longitude)
-                dlat = lat2 - lat1
-                dlon = lon2 - lon1
-                a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-                c = 2 * asin(sqrt(a))
-                with_distance.append((p, R * c))
-            with_distance.sort(key=lambda x: x[1])
-            top_places = [p for p, _ in with_distance[:limit]]
+            places_in_radius = (
+                await db.execute(select(*_PLACE_OUT_COLUMNS).where(Place.id.in_(candidate_place_ids)))
+            ).all()
+            distances = haversine_km(
+                location_filter["latitude"],
+                location_filter["longitude"],
+                np.fromiter((p.latitude for p in places_in_radius), dtype=np.float64, count=len(places_in_radius)),
+                np.fromiter((p.longitude for p in places_in_radius), dtype=np.float64, count=len(places_in_radius)),
+            )
+            nearest = np.argsort(distances, kind="stable")[:limit]
+            top_places = [places_in_radius[i] for i in nearest]
             top_scores = {p.id: 0.0 for p in top_places}
             by_cat = {p.id: {} for p in top_places}
             return [PlaceOut.model_validate(p) for p in top_places], categories, top_scores, by_cat
@@ -460,17 +691,13 @@ def recommend_places(
             if place_scores_by_category.get(pid, {}).get("menu", 0) >= MENU_MIN_WEIGHTED_SCORE
         ]
         if filtered_ids:
-            order_map = {pid: i for i, pid in enumerate(top_place_ids)}
-            filtered_ids.sort(key=lambda p: order_map.get(p, 9999))
+            # 필터는 top_place_ids 순서를 유지하므로 다시 정렬할 필요 없음
             top_place_ids = filtered_ids[:limit]
             top_scores = {pid: top_scores[pid] for pid in top_place_ids if pid in top_scores}
         else:
             top_place_ids = []
             top_scores = {}
-    places: Iterable[Place] = (
-        db.execute(select(Place).where(Place.id.in_(top_place_ids))).scalars().all()
-    )
-    ordered_places = sorted(places, key=lambda p: top_place_ids.index(p.id))
+    ordered_places = await _fetch_places_in_order(db, top_place_ids)
     # 카테고리별 점수는 top_place_ids에 있는 것만 (나머지는 버림)
     top_by_cat = {pid: place_scores_by_category.get(pid, {}) for pid in top_place_ids}
     return [PlaceOut.model_validate(p) for p in ordered_places], categories, top_scores, top_by_cat
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import json
-import subprocess
+import asyncio
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -11,32 +10,40 @@ from typing import Any, Iterable
 
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.place import Place
 from app.models.review import Review
 from app.schemas.crawl import ReviewCrawlSummary
+from app.schemas.review import CategoryInfo
+from app.services.extraction_cache import content_hash, load_cached_categories, store_cached_categories
+from app.services.llm import get_llm_service
 from app.services.recommendation import refresh_embeddings
 
-# backend 폴더 내부의 scripts 폴더에서 크롤러 실행
+# backend 폴더 내부의 scripts 폴더에 있는 크롤러를 import해서 사용
 BACKEND_ROOT = Path(__file__).resolve().parent.parent.parent
 REVIEW_SCRIPT = BACKEND_ROOT / "scripts" / "review_crawl.py"
-PYTHON_BIN = sys.executable
 
 
-def _upsert_review(db: Session, place_id: int, review_data: dict) -> Review | None:
-    """리뷰를 DB에 저장/업데이트 후 반환 (임베딩 시 review.id 사용)."""
+def _review_key(review_data: dict) -> str | None:
     rid = review_data.get("id") or review_data.get("review_id")
+    return str(rid) if rid else None
+
+
+def _upsert_review(db: Session, place_id: int, review_data: dict, known: dict[str, Review]) -> Review | None:
+    """리뷰를 세션에 추가/갱신 후 반환 (커밋은 호출 측에서 장소 단위로).
+
+    known: 이 장소 배치에서 미리 조회해 둔 {네이버 리뷰 ID: Review}. 새로 추가한 리뷰도 여기에 넣는다.
+    """
+    rid = _review_key(review_data)
     if not rid:
         return None
-    rid = str(rid)
-    existing = db.query(Review).filter(Review.review_id == rid).first()
+    existing = known.get(rid)
     content = (review_data.get("content") or "").strip()
     if existing:
         existing.content = content
         existing.author = review_data.get("author")
         existing.rating = review_data.get("rating")
         existing.crawled_at = datetime.now()
-        db.commit()
-        db.refresh(existing)
         return existing
     review = Review(
         place_id=place_id,
@@ -47,37 +54,22 @@ def _upsert_review(db: Session, place_id: int, review_data: dict) -> Review | No
         crawled_at=datetime.now(),
     )
     db.add(review)
-    db.commit()
-    db.refresh(review)
+    known[rid] = review
     return review
 
 
-def _run_command(args: list[str]) -> str:
-    completed = subprocess.run(
-        args,
-        cwd=BACKEND_ROOT,
-        capture_output=True,
-        text=True,
-    )
-    if completed.returncode != 0:
-        raise RuntimeError(completed.stderr.strip() or completed.stdout.strip() or "Review crawler failed")
-    return completed.stdout.strip()
-
-
-def fetch_reviews_from_cli(place_id: int, max_count: int) -> list[dict[str, Any]]:
-    cmd = [
-        PYTHON_BIN,
-        str(REVIEW_SCRIPT),
-        "--place-id",
-        str(place_id),
-        "--max-count",
-        str(max_count),
-        "--json-output",
-    ]
-    stdout = _run_command(cmd)
-    if not stdout:
-        return []
-    return json.loads(stdout)
+def _load_review_crawler_class():
+    """scripts/review_crawl.py의 NaverMapReviewCrawler를 같은 프로세스로 import (playwright 의존성은 호출 시점에만)."""
+    scripts_dir = str(REVIEW_SCRIPT.parent)
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    from review_crawl import NaverMapReviewCrawler
+
+    return NaverMapReviewCrawler
+
+
+async def _crawl_one(crawler: Any, place_id: int, max_count: int) -> list[dict[str, Any]]:
+    return await crawler.crawl_all_reviews(str(place_id), set(), max_count=max_count)
 
 
 def crawl_reviews_for_places(
@@ -91,42 +83,135 @@ def crawl_reviews_for_places(
     else:
         ids = [p.id for p in db.query(Place.id).all()]
 
+    # 장소마다 인터프리터를 띄우지 않고 크롤러 인스턴스 하나를 같은 프로세스에서 재사용
+    return asyncio.run(_crawl_reviews_for_places(db, ids, max_count))
+
+
+def _review_targets(reviews: list[dict[str, Any]]) -> list[tuple[dict[str, Any], str, str]]:
+    """본문이 있는 리뷰만 (리뷰, 본문, 본문 해시)로."""
+    return [
+        (review_data, content, content_hash(content))
+        for review_data in reviews
+        if (content := (review_data.get("content") or "").strip())
+    ]
+
+
+async def _extract_review_categories(
+    targets: list[tuple[dict[str, Any], str, str]],
+    cached: dict[str, CategoryInfo],
+    llm_semaphore: asyncio.Semaphore,
+) -> tuple[list[tuple[dict[str, Any], str, CategoryInfo]], dict[str, CategoryInfo]]:
+    """장소의 리뷰들에서 카테고리를 동시에 추출 (추출 캐시에 있는 본문은 LLM 생략).
+
+    반환: ((리뷰, 본문, 카테고리) 목록 (실패한 리뷰는 제외), 새로 추출한 {본문 해시: 카테고리})
+    """
+    extracted = [(review_data, content, cached[h]) for review_data, content, h in targets if h in cached]
+    misses = [(review_data, content, h) for review_data, content, h in targets if h not in cached]
+    if not misses:
+        return extracted, {}
+
+    extract_categories = get_llm_service().extract_categories
+
+    async def extract(content: str) -> CategoryInfo:
+        async with llm_semaphore:
+            # 동기 클라이언트(스레드 안전한 커넥션 풀)를 워커 스레드에서 호출. 429/5xx 재시도는 openai 클라이언트가 처리.
+            return await asyncio.to_thread(extract_categories, content)
+
+    results = await asyncio.gather(*(extract(content) for _, content, _ in misses), return_exceptions=True)
+    fresh: dict[str, CategoryInfo] = {}
+    for (review_data, content, h), result in zip(misses, results):
+        if isinstance(result, BaseException):
+            print(f"[SKIP] review_id={review_data.get('id')} category extraction failed: {result}", file=sys.stderr)
+            continue
+        extracted.append((review_data, content, result))
+        fresh[h] = result
+    return extracted, fresh
+
+
+def _store_reviews(
+    db: Session,
+    place_id: int,
+    extracted: list[tuple[dict[str, Any], str, CategoryInfo]],
+    fresh: dict[str, CategoryInfo],
+) -> tuple[int, int]:
+    """카테고리 추출이 끝난 리뷰를 저장하고 임베딩 생성. 반환: (처리 리뷰 수, 생성 임베딩 수).
+
+    장소 하나의 리뷰/임베딩/추출 캐시를 한 트랜잭션으로 커밋하고, 끝나면 세션의 identity map을 비운다.
+    """
+    rids = list(dict.fromkeys(rid for review_data, _, _ in extracted if (rid := _review_key(review_data))))
+    try:
+        store_cached_categories(db, fresh)
+        known = (
+            {review.review_id: review for review in db.query(Review).filter(Review.review_id.in_(rids))}
+            if rids
+            else {}
+        )
+        rows = []
+        for review_data, content, categories in extracted:
+            review_row = _upsert_review(db, place_id, review_data, known)
+            if review_row:
+                rows.append((review_row, content, categories))
+        # 새 리뷰의 id(임베딩 FK)를 한 번의 flush로 할당
+        db.flush()
+
+        embeddings_created = 0
+        for review_row, content, categories in rows:
+            _, inserted = refresh_embeddings(
+                db, place_id, review_row.id, content, categories=categories, commit=False
+            )
+            embeddings_created += inserted
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.expunge_all()
+    return len(rows), embeddings_created
+
+
+async def _crawl_reviews_for_places(db: Session, ids: list[int], max_count: int) -> ReviewCrawlSummary:
+    crawler = _load_review_crawler_class()(headless=True, verbose=False)
+    # 페이지 로딩(네트워크 대기)은 최대 review_crawl_concurrency개 장소씩 겹쳐서 진행
+    semaphore = asyncio.Semaphore(settings.review_crawl_concurrency)
+    # 리뷰별 LLM 카테고리 추출은 장소를 가리지 않고 최대 llm_concurrency개까지 동시에
+    llm_semaphore = asyncio.Semaphore(settings.llm_concurrency)
+    # 세션은 하나를 공유하므로 DB 저장(임베딩 포함)은 한 번에 한 장소씩 워커 스레드에서
+    db_lock = asyncio.Lock()
+
     places_processed = 0
     embeddings_created = 0
     review_failures = 0
 
-    for place_id in ids:
-        try:
-            reviews = fetch_reviews_from_cli(place_id, max_count)
-        except Exception as exc:  # noqa: BLE001
-            review_failures += 1
-            print(f"[SKIP] place_id={place_id} review crawl failed: {exc}", file=sys.stderr)
-            continue
+    async def process(place_id: int) -> None:
+        nonlocal places_processed, embeddings_created, review_failures
+        async with semaphore:
+            try:
+                reviews = await _crawl_one(crawler, place_id, max_count)
+            except Exception as exc:  # noqa: BLE001
+                review_failures += 1
+                print(f"[SKIP] place_id={place_id} review crawl failed: {exc}", file=sys.stderr)
+                return
 
         if not reviews:
-            continue
+            return
 
         places_processed += 1
         print(f"[INFO] place_id={place_id}: {len(reviews)}개 리뷰 처리 시작", file=sys.stderr)
-
-        reviews_processed = 0
-        for review_data in reviews:
-            content = (review_data.get("content") or "").strip()
-            if not content:
-                continue
-            review_row = _upsert_review(db, place_id, review_data)
-            if not review_row:
-                continue
-            reviews_processed += 1
-            _, inserted = refresh_embeddings(db, place_id, review_row.id, content)
-            embeddings_created += inserted
-        
-        print(f"[INFO] place_id={place_id}: {reviews_processed}개 리뷰 처리 완료, {embeddings_created}개 임베딩 생성", file=sys.stderr)
+        targets = _review_targets(reviews)
+        async with db_lock:
+            cached = await asyncio.to_thread(load_cached_categories, db, [h for _, _, h in targets])
+        extracted, fresh = await _extract_review_categories(targets, cached, llm_semaphore)
+        async with db_lock:
+            reviews_processed, inserted = await asyncio.to_thread(_store_reviews, db, place_id, extracted, fresh)
+        embeddings_created += inserted
+        print(f"[INFO] place_id={place_id}: {reviews_processed}개 리뷰 처리 완료, {inserted}개 임베딩 생성", file=sys.stderr)
+
+    # 브라우저는 한 번만 띄우고 장소마다 context만 새로 연다
+    async with crawler:
+        await asyncio.gather(*(process(place_id) for place_id in ids))
 
     return ReviewCrawlSummary(
         places_processed=places_processed,
         embeddings_created=embeddings_created,
         review_failures=review_failures,
     )
-
-
@@ -0,0 +1,125 @@
+"""In-process scoring kernel for category-weighted embedding similarity."""
+
+from __future__ import annotations
+
+import logging
+from typing import Mapping, Sequence
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _score_places_numpy(
+    place_emb: np.ndarray,
+    present: np.ndarray,
+    query_vecs: np.ndarray,
+    weights: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    sims = (np.einsum("ncd,cd->nc", place_emb, query_vecs) + 1.0) * 0.5
+    np.multiply(sims, weights, out=out)
+    out[~present] = 0.0
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _score_places_numba(place_emb, present, query_vecs, weights, out):
+        n_places, n_categories, dim = place_emb.shape
+        for p in prange(n_places):
+            for c in range(n_categories):
+                if not present[p, c] or weights[c] == 0.0:
+                    out[p, c] = 0.0
+                    continue
+                acc = 0.0
+                for d in range(dim):
+                    acc += place_emb[p, c, d] * query_vecs[c, d]
+                out[p, c] = (acc + 1.0) * 0.5 * weights[c]
+
+
+def score_places(
+    place_emb: np.ndarray,
+    present: np.ndarray,
+    query_vecs: np.ndarray,
+    weights: np.ndarray,
+) -> np.ndarray:
+    """장소별·카테고리별 가중 유사도 (n_places, n_categories) 반환.
+
+    - place_emb: (n_places, n_categories, dim) float32, 장소·카테고리별 정규화 임베딩 평균(centroid)
+    - present: (n_places, n_categories) bool, 해당 카테고리 임베딩 보유 여부
+    - query_vecs: (n_categories, dim) float32, 정규화된 쿼리 벡터 (없는 카테고리는 0)
+    - weights: (n_categories,) float32, 쿼리에 없는 카테고리는 0
+
+    centroid·q 는 개별 코사인 유사도의 평균과 같으므로 SQL의 avg(1 + <#>) (= 평균 코사인 거리)와 동일한 점수
+    (similarity = 1 - avg_distance / 2)를 낸다.
+    """
+    out = np.zeros(present.shape, dtype=np.float32)
+    if place_emb.shape[0] == 0:
+        return out
+    if NUMBA_AVAILABLE:
+        _score_places_numba(place_emb, present, query_vecs, weights, out)
+    else:
+        _score_places_numpy(place_emb, present, query_vecs, weights, out)
+    return out
+
+
+def build_query_matrix(
+    query_vectors: Mapping[str, Sequence[float]],
+    category_index: Mapping[str, int],
+    weights_vec: np.ndarray,
+    dim: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """카테고리별 쿼리 벡터를 (n_categories, dim) 정규화 행렬과 가중치 벡터(쿼리에 없는 카테고리는 0)로 변환."""
+    query_vecs = np.zeros((len(weights_vec), dim), dtype=np.float32)
+    active = np.zeros(len(weights_vec), dtype=np.bool_)
+    for key, vector in query_vectors.items():
+        c = category_index.get(key)
+        if c is None:
+            continue
+        q = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(q))
+        query_vecs[c] = q / norm if norm else q
+        active[c] = True
+    weights = np.where(active, weights_vec, 0.0).astype(np.float32)
+    return query_vecs, weights
+
+
+def collect_scores(
+    place_ids: Sequence[int],
+    present: np.ndarray,
+    weights: np.ndarray,
+    by_category: np.ndarray,
+    category_keys: Sequence[str],
+) -> tuple[dict[int, float], dict[int, dict[str, float]]]:
+    """커널 결과를 (장소별 총점, 장소별 카테고리 점수) dict로 변환. 매칭 카테고리가 없는 장소는 제외."""
+    matched = present & (weights > 0)
+    totals = by_category.sum(axis=1)
+    place_scores: dict[int, float] = {}
+    place_scores_by_category: dict[int, dict[str, float]] = {}
+    for i in np.flatnonzero(matched.any(axis=1)):
+        place_id = int(place_ids[i])
+        place_scores[place_id] = float(totals[i])
+        place_scores_by_category[place_id] = {
+            category_keys[c]: round(float(by_category[i, c]), 4) for c in np.flatnonzero(matched[i])
+        }
+    return place_scores, place_scores_by_category
+
+
+def warmup() -> None:
+    """JIT 컴파일 비용을 첫 요청이 아니라 기동 시점에 지불."""
+    if not NUMBA_AVAILABLE:
+        return
+    place_emb = np.zeros((1, 4, 8), dtype=np.float32)
+    present = np.ones((1, 4), dtype=np.bool_)
+    query_vecs = np.zeros((4, 8), dtype=np.float32)
+    weights = np.ones(4, dtype=np.float32)
+    score_places(place_emb, present, query_vecs, weights)
+    logger.info("scoring kernel warmed up (numba)")
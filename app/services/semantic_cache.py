@@ -0,0 +1,145 @@
+"""In-process exact + semantic caches for LLM query extraction and embeddings."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Sequence
+
+import numpy as np
+
+
+class SemanticCache:
+    """쿼리 원문(exact) 해시와 쿼리 임베딩(semantic) 두 단계로 조회하는 TTL 캐시.
+
+    - exact: 공백 정리한 쿼리의 SHA1 → 값
+    - semantic: 미리 할당한 (max_entries, dim) 정규화 행렬과 코사인 유사도 비교, threshold 이상이면 hit
+      (행 ↔ key 인덱스를 put/evict 때 갱신해 조회마다 행렬을 다시 쌓지 않는다)
+    스레드풀에서 동시에 호출되므로 내부 상태는 lock으로 보호한다.
+    """
+
+    _MISS = object()
+
+    def __init__(self, threshold: float, ttl_seconds: float, max_entries: int = 2048) -> None:
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> (expires_at, value, matrix row | None)
+        self._entries: OrderedDict[str, tuple[float, Any, int | None]] = OrderedDict()
+        # 첫 벡터가 들어올 때 차원을 보고 할당
+        self._matrix: np.ndarray | None = None
+        self._row_keys: list[str | None] = [None] * max_entries
+        self._free_rows: list[int] = list(range(max_entries - 1, -1, -1))
+        self._occupied = np.zeros(max_entries, dtype=np.bool_)
+
+    @staticmethod
+    def make_key(text: str) -> str:
+        normalized = " ".join((text or "").split())
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def get_exact(self, key: str) -> Any:
+        """exact hit이면 값, 아니면 miss 센티널 반환 (is_miss로 판별)."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return self._MISS
+            if entry[0] < now:
+                self._remove(key)
+                return self._MISS
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def get_similar(self, vector: Sequence[float]) -> Any:
+        """임베딩 코사인 유사도가 threshold 이상인 가장 가까운 항목 값, 없으면 miss 센티널."""
+        query = _normalize(vector)
+        now = time.monotonic()
+        with self._lock:
+            matrix = self._matrix
+            if matrix is None or matrix.shape[1] != query.shape[0] or len(self._free_rows) == self.max_entries:
+                return self._MISS
+            # 빈 행(0 벡터)은 점수 0이지만 threshold가 0 이하일 수도 있으니 명시적으로 제외
+            scores = np.where(self._occupied, matrix @ query, -np.inf)
+            while True:
+                best = int(np.argmax(scores))
+                if scores[best] < self.threshold:
+                    return self._MISS
+                key = self._row_keys[best]
+                entry = self._entries[key]
+                if entry[0] < now:
+                    self._remove(key)
+                    scores[best] = -np.inf
+                    continue
+                self._entries.move_to_end(key)
+                return entry[1]
+
+    def put(self, key: str, value: Any, vector: Sequence[float] | None = None) -> None:
+        normalized = _normalize(vector) if vector is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            row = None
+            if normalized is not None:
+                if self._matrix is None:
+                    self._matrix = np.zeros((self.max_entries, normalized.shape[0]), dtype=np.float32)
+                if self._matrix.shape[1] == normalized.shape[0]:
+                    if not self._free_rows:
+                        self._remove(next(iter(self._entries)))
+                    row = self._free_rows.pop()
+                    self._matrix[row] = normalized
+                    self._row_keys[row] = key
+                    self._occupied[row] = True
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value, row)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def is_miss(self, value: Any) -> bool:
+        return value is self._MISS
+
+    def _remove(self, key: str) -> None:
+        """항목 삭제 + 행렬 행 반납 (lock 안에서 호출)."""
+        _, _, row = self._entries.pop(key)
+        if row is not None:
+            self._matrix[row] = 0.0
+            self._row_keys[row] = None
+            self._occupied[row] = False
+            self._free_rows.append(row)
+
+
+class EmbeddingLRU:
+    """텍스트 → 임베딩 exact-match LRU ("친구", "조용한" 같은 짧은 값이 반복 임베딩되는 것을 방지).
+
+    벡터는 float32 배열로 보관한다 (1536차원 기준 항목당 약 6KB).
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    def get(self, text: str) -> list[float] | None:
+        with self._lock:
+            vector = self._entries.get(text)
+            if vector is None:
+                return None
+            self._entries.move_to_end(text)
+        return vector.tolist()
+
+    def put(self, text: str, vector: Sequence[float]) -> None:
+        if self.max_entries <= 0:
+            return
+        arr = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            self._entries[text] = arr
+            self._entries.move_to_end(text)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _normalize(vector: Sequence[float]) -> np.ndarray:
+    arr = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(arr))
+    return arr / norm if norm else arr
@@ -0,0 +1,37 @@
+"""Coalesce concurrent identical async calls into one execution."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """같은 key로 동시에 들어온 호출은 먼저 시작된 실행 하나의 결과를 함께 받는다.
+
+    실행은 별도 Task로 돌리고 호출자는 shield로 기다리므로, 먼저 호출한 요청이 취소(클라이언트 연결 종료)돼도
+    나머지 대기자의 결과는 유지된다. 실행이 끝나면 key를 지우므로 결과를 캐시하지는 않는다.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 대기자가 모두 취소된 경우에도 예외를 소비해 "never retrieved" 경고를 막는다
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug("singleflight call failed: key=%s", key, exc_info=task.exception())
@@ -11,6 +11,8 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import csv
 import os
 import subprocess
 import sys
@@ -31,7 +33,7 @@ THUMBNAIL_ONLY = True
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal
 from app.services.crawl_runner import ingest_from_crawl
 
 
@@ -51,17 +53,14 @@ def load_station_names(csv_path: Path, encoding: str = "euc-kr") -> list[str]:
         raise FileNotFoundError(f"CSV를 찾을 수 없습니다: {csv_path}")
     names: list[str] = []
     seen: set[str] = set()
-    with csv_path.open("r", encoding=encoding, errors="replace") as f:
-        for i, line in enumerate(f):
-            line = line.strip()
-            if not line:
+    # csv 모듈(C 구현)로 행을 나누고 역명 컬럼만 본다 (따옴표로 감싼 값도 올바르게 분리)
+    with csv_path.open("r", encoding=encoding, errors="replace", newline="") as f:
+        for i, row in enumerate(csv.reader(f)):
+            if len(row) < 4:
                 continue
-            parts = [p.strip() for p in line.split(",")]
-            if len(parts) < 4:
-                continue
-            if i == 0 and parts[0].isdigit() is False:
+            if i == 0 and not row[0].strip().isdigit():
                 continue  # 헤더 스킵 (숫자로 안 시작하면 헤더로 간주)
-            name = parts[3]
+            name = row[3].strip()
             if name and name not in seen:
                 seen.add(name)
                 names.append(name)
@@ -108,6 +107,31 @@ def run_crawl_reviews(max_reviews: int = 20, limit_places: int | None = None) ->
     return result.returncode == 0
 
 
+async def crawl_stations(stations: list[str]) -> tuple[int, int]:
+    """역별 쿼리를 순회하며 장소 크롤링 + DB upsert. (신규, 스킵) 개수 반환."""
+    total_ingested = 0
+    total_skipped = 0
+    async with AsyncSessionLocal() as db:
+        for i, name in enumerate(stations, 1):
+            print(f"[{i}/{len(stations)}] {name}")
+            station_query_name = normalize_station_query_name(name)
+            for keyword in CRAWL_KEYWORDS:
+                query = f"{station_query_name} {keyword}"
+                summary = await ingest_from_crawl(
+                    db,
+                    query,
+                    thumbnail_only=THUMBNAIL_ONLY,
+                    limit=LIMIT_PER_QUERY,
+                )
+                total_ingested += summary.places_fetched
+                total_skipped += summary.places_skipped
+                print(
+                    f"  [DB upsert] {query} -> 신규 {summary.places_fetched}개, 스킵 {summary.places_skipped}개",
+                    flush=True,
+                )
+    return total_ingested, total_skipped
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="지하철역 기준 역별 식당/카페/술집 자동 크롤링",
@@ -138,30 +162,7 @@ def main() -> None:
 
     print(f"총 {len(stations)}개 역 대상 (역당 식당/카페/술집 각 {LIMIT_PER_QUERY}개)")
     print("=" * 60)
-    total_ingested = 0
-    total_skipped = 0
-
-    db = SessionLocal()
-    try:
-        for i, name in enumerate(stations, 1):
-            print(f"[{i}/{len(stations)}] {name}")
-            station_query_name = normalize_station_query_name(name)
-            for keyword in CRAWL_KEYWORDS:
-                query = f"{station_query_name} {keyword}"
-                summary = ingest_from_crawl(
-                    db,
-                    query,
-                    thumbnail_only=THUMBNAIL_ONLY,
-                    limit=LIMIT_PER_QUERY,
-                )
-                total_ingested += summary.places_fetched
-                total_skipped += summary.places_skipped
-                print(
-                    f"  [DB upsert] {query} -> 신규 {summary.places_fetched}개, 스킵 {summary.places_skipped}개",
-                    flush=True,
-                )
-    finally:
-        db.close()
+    total_ingested, total_skipped = asyncio.run(crawl_stations(stations))
 
     print("=" * 60)
     print(f"크롤링+DB upsert 완료. 신규 {total_ingested}개, 스킵 {total_skipped}개")
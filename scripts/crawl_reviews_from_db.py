@@ -25,18 +25,16 @@ load_dotenv(BACKEND_ROOT / ".env")
 # backend 모듈 import를 위해 경로 추가
 sys.path.insert(0, str(BACKEND_ROOT))
 
-from sqlalchemy.orm import Session
-
 from app.db.session import SessionLocal
 from app.models.place import Place
 from app.services.recommendation import refresh_place_summary_embeddings_from_review_texts
 
 # S3 (선택): .env에 S3_BUCKET_NAME 있으면 리뷰 업로드
 try:
-    from utils.s3_storage import S3StorageManager
+    from utils.s3_storage import get_s3_manager, is_fatal_s3_error
     S3_AVAILABLE = True
 except Exception:
-    S3StorageManager = None
+    get_s3_manager = None
     S3_AVAILABLE = False
 
 # review_crawl.py의 크롤러 import (같은 scripts 폴더 안에 있음)
@@ -45,9 +43,27 @@ SCRIPTS_DIR = Path(__file__).resolve().parent
 if str(SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPTS_DIR))
 from review_crawl import NaverMapReviewCrawler
+def _store_place_summary(place_id: int, review_texts: list[str]) -> int:
+    """리뷰 텍스트로 장소 요약 임베딩 저장 (워커 스레드에서 장소별 세션 사용). 반환: 저장된 임베딩 수."""
+    db = SessionLocal()
+    try:
+        place_name = db.query(Place.name).filter(Place.id == place_id).scalar()
+        _, _, inserted = refresh_place_summary_embeddings_from_review_texts(
+            db=db,
+            place_id=place_id,
+            review_texts=review_texts,
+            place_name=place_name,
+        )
+        return inserted
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 async def crawl_reviews_for_place(
     crawler: NaverMapReviewCrawler,
-    db: Session,
     place_id: int,
     max_count: int = 100,
 ) -> tuple[int, int, int, list[dict]]:
@@ -73,16 +89,10 @@ async def crawl_reviews_for_place(
     if not review_texts:
         return 0, 0, 0, reviews
 
-    place_name = db.query(Place.name).filter(Place.id == place_id).scalar()
+    # LLM 요약/임베딩 + DB 저장은 동기 코드라 이벤트 루프(다른 장소 크롤링)를 막지 않도록 스레드에서 실행
     try:
-        _, _, inserted = refresh_place_summary_embeddings_from_review_texts(
-            db=db,
-            place_id=place_id,
-            review_texts=review_texts,
-            place_name=place_name,
-        )
+        inserted = await asyncio.to_thread(_store_place_summary, place_id, review_texts)
     except Exception as exc:
-        db.rollback()
         print(f"[FAIL] place_id={place_id} 요약 임베딩 저장 실패: {exc}", file=sys.stderr)
         return len(review_texts), 0, 1, reviews
 
@@ -94,6 +104,7 @@ async def crawl_reviews_from_db(
     max_count: int = 100,
     limit: int | None = None,
     headless: bool = True,
+    concurrency: int = 4,
 ) -> None:
     """DB에 저장된 장소들에 대해 리뷰 크롤링 후 요약 임베딩 저장."""
     db = SessionLocal()
@@ -113,7 +124,7 @@ async def crawl_reviews_from_db(
         s3_manager = None
         if S3_AVAILABLE and os.getenv("S3_BUCKET_NAME"):
             try:
-                s3_manager = S3StorageManager(
+                s3_manager = get_s3_manager(
                     bucket_name=os.getenv("S3_BUCKET_NAME"),
                     aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
                     aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
@@ -130,12 +141,17 @@ async def crawl_reviews_from_db(
         total_embeddings = 0
         total_failed = 0
         places_processed = 0
+        # 장소별 크롤링은 네트워크 대기가 대부분이라 concurrency개씩 겹쳐서 진행
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def process(i: int, place_id: int) -> None:
+            nonlocal total_reviews, total_embeddings, total_failed, places_processed, s3_manager
+            async with semaphore:
+                print(f"\n[{i}/{len(target_ids)}] place_id={place_id} 처리 중...", file=sys.stderr)
+                review_count, embeddings_created, failed, reviews_raw = await crawl_reviews_for_place(
+                    crawler, place_id, max_count
+                )
 
-        for i, place_id in enumerate(target_ids, 1):
-            print(f"\n[{i}/{len(target_ids)}] place_id={place_id} 처리 중...", file=sys.stderr)
-            
-            review_count, embeddings_created, failed, reviews_raw = await crawl_reviews_for_place(crawler, db, place_id, max_count)
-            
             if review_count > 0:
                 places_processed += 1
                 total_reviews += review_count
@@ -152,9 +168,23 @@ async def crawl_reviews_from_db(
                         print(f"[INFO] place_id={place_id}: S3 업로드 완료", file=sys.stderr)
                     except Exception as e:
                         print(f"[WARN] place_id={place_id} S3 업로드 실패: {e}", file=sys.stderr)
+                        if is_fatal_s3_error(e):
+                            # 버킷/권한 오류는 다른 장소도 똑같이 실패하므로 이후 업로드는 건너뛴다
+                            s3_manager = None
             else:
                 print(f"[INFO] place_id={place_id}: 리뷰 없음 또는 요약 생성 실패", file=sys.stderr)
 
+        # 브라우저는 한 번만 띄우고 장소마다 새 context만 만든다
+        async with crawler:
+            results = await asyncio.gather(
+                *(process(i, place_id) for i, place_id in enumerate(target_ids, 1)),
+                return_exceptions=True,
+            )
+        for place_id, result in zip(target_ids, results):
+            if isinstance(result, BaseException):
+                total_failed += 1
+                print(f"[ERROR] place_id={place_id} 처리 중 예외: {result}", file=sys.stderr)
+
         print("\n" + "=" * 60)
         print("리뷰 크롤링 및 요약 임베딩 저장 완료")
         print("=" * 60)
@@ -192,6 +222,12 @@ def main() -> None:
         default=True,
         help="브라우저를 헤드리스 모드로 실행 (기본: True)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="동시에 크롤링할 장소 수 (기본: 4, 브라우저 1개를 공유하고 장소마다 context 1개)",
+    )
     args = parser.parse_args()
 
     place_ids = None
@@ -207,6 +243,7 @@ def main() -> None:
             max_count=args.max_count,
             limit=args.limit,
             headless=args.headless,
+            concurrency=args.concurrency,
         )
     )
 
@@ -2,8 +2,16 @@
 pgvector 인덱스 생성 스크립트
 ---------------------------
 벡터 검색 성능 향상을 위한 인덱스 생성
+
+ivfflat은 적재된 데이터로 centroid를 학습하므로 대량 적재 후에 만든다:
+  python scripts/create_indexes.py --drop   # 적재 전: 벡터 인덱스 삭제
+  (임베딩 적재)
+  python scripts/create_indexes.py          # 적재 후: 인덱스 생성
 """
 
+import argparse
+import math
+import os
 import sys
 from pathlib import Path
 
@@ -21,26 +29,120 @@ from sqlalchemy import text
 
 from app.db.session import engine
 
+# 인덱스 빌드 세션 설정. DB 컨테이너 메모리(docker-compose 기준 256M)를 넘지 않는 값이 기본.
+MAINTENANCE_WORK_MEM = os.getenv("INDEX_MAINTENANCE_WORK_MEM", "128MB")
+MAX_PARALLEL_MAINTENANCE_WORKERS = int(os.getenv("INDEX_MAX_PARALLEL_MAINTENANCE_WORKERS", "2"))
+
+# 임베딩은 단위 벡터로 저장하므로 코사인 대신 내적(ip) 연산자 클래스로 인덱스를 만든다 (순위 동일, 거리 계산 저렴)
+REVIEW_HNSW_INDEX = "review_embeddings_embedding_ip_hnsw"
+REVIEW_IVFFLAT_INDEX = "review_embeddings_embedding_ip_idx"
+SUMMARY_HNSW_INDEX = "place_summary_embeddings_embedding_half_ip_hnsw"
+# 이전 코사인 인덱스 (생성 시 정리)
+LEGACY_VECTOR_INDEXES = (
+    "review_embeddings_embedding_idx",
+    "review_embeddings_embedding_hnsw",
+    "place_summary_embeddings_embedding_hnsw",
+    "place_summary_embeddings_embedding_half_hnsw",
+)
+# 대량 적재 전에 지우고 적재 후 다시 만드는 벡터(ANN) 인덱스
+VECTOR_INDEXES = (REVIEW_HNSW_INDEX, REVIEW_IVFFLAT_INDEX, SUMMARY_HNSW_INDEX) + LEGACY_VECTOR_INDEXES
+# review_embeddings에만 걸린 벡터 인덱스 (리뷰 임베딩 적재 중에는 이것만 지운다.
+# place_summary_embeddings 인덱스는 추천 요청이 계속 쓰므로 남겨 둔다)
+REVIEW_VECTOR_INDEXES = tuple(name for name in VECTOR_INDEXES if name.startswith("review_embeddings_"))
+
+# 행 수 구간별 HNSW 파라미터 (상한 행 수, m, ef_construction, 권장 ef_search)
+HNSW_PARAMS = (
+    (100_000, 16, 64, 40),
+    (1_000_000, 24, 128, 100),
+    (None, 32, 200, 200),
+)
+
+
+def hnsw_params(n_rows: int) -> tuple[int, int, int]:
+    """행 수에 맞는 (m, ef_construction, ef_search)."""
+    for upper, m, ef_construction, ef_search in HNSW_PARAMS:
+        if upper is None or n_rows < upper:
+            return m, ef_construction, ef_search
+    raise AssertionError("unreachable")
+
+
+def ivfflat_lists(n_rows: int) -> int:
+    """ivfflat lists 수: 100만 행까지 rows/1000, 그 이상은 sqrt(rows) (pgvector 권장값)."""
+    if n_rows <= 1_000_000:
+        return max(10, n_rows // 1000)
+    return max(10, math.isqrt(n_rows))
+
+
+def _set_build_params(conn) -> None:
+    """이 커넥션에서 실행하는 CREATE INDEX의 메모리/병렬 워커 설정."""
+    conn.execute(text(f"SET maintenance_work_mem = '{MAINTENANCE_WORK_MEM}'"))
+    conn.execute(text(f"SET max_parallel_maintenance_workers = {MAX_PARALLEL_MAINTENANCE_WORKERS}"))
+
+
+def _row_count(conn, table: str) -> int:
+    return conn.execute(text(f"SELECT count(*) FROM {table}")).scalar() or 0
+
+
+def drop_indexes(index_names: tuple[str, ...] = VECTOR_INDEXES) -> None:
+    """대량 적재 전에 벡터 인덱스 삭제 (적재 중 인덱스 유지 비용 제거, 적재 후 create_indexes로 재생성)."""
+    print("🧹 pgvector 인덱스 삭제 중...")
+    with engine.connect() as conn:
+        for index_name in index_names:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+            print(f"  - {index_name} 삭제")
+        conn.commit()
+    print("✅ 인덱스 삭제 완료 (적재 후 create_indexes.py 실행)")
 
-def create_indexes() -> None:
-    """벡터 검색 인덱스 생성."""
+
+def create_indexes(method: str = "hnsw") -> None:
+    """벡터 검색 인덱스 생성. method: review_embeddings 인덱스 종류 (hnsw | ivfflat)."""
     print("🔧 pgvector 인덱스 생성 중...")
     
     with engine.connect() as conn:
+        _set_build_params(conn)
+        for index_name in LEGACY_VECTOR_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+        conn.commit()
+
         # review_embeddings 테이블의 embedding 컬럼에 인덱스 생성
         # ivfflat은 대용량 데이터에 적합한 인덱스 타입
         # lists 파라미터는 데이터 크기에 따라 조정 (일반적으로 sqrt(행 수))
         
         print("  - review_embeddings.embedding 인덱스 생성 중...")
         try:
-            conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS review_embeddings_embedding_idx 
-                ON review_embeddings 
-                USING ivfflat (embedding vector_cosine_ops)
-                WITH (lists = 100);
-            """))
-            conn.commit()
-            print("  ✅ review_embeddings 인덱스 생성 완료")
+            n_rows = _row_count(conn, "review_embeddings")
+            if method == "hnsw":
+                # HNSW는 학습 단계가 없어 빈 테이블에도 만들 수 있다. 파라미터는 행 수 구간으로 결정.
+                m, ef_construction, ef_search = hnsw_params(n_rows)
+                conn.execute(text(f"DROP INDEX IF EXISTS {REVIEW_IVFFLAT_INDEX}"))
+                conn.execute(text(f"""
+                    CREATE INDEX IF NOT EXISTS {REVIEW_HNSW_INDEX}
+                    ON review_embeddings
+                    USING hnsw (embedding halfvec_ip_ops)
+                    WITH (m = {m}, ef_construction = {ef_construction});
+                """))
+                conn.commit()
+                print(
+                    f"  ✅ review_embeddings HNSW 인덱스 생성 완료 (rows={n_rows}, m={m}, "
+                    f"ef_construction={ef_construction}, 권장 HNSW_EF_SEARCH={ef_search})"
+                )
+            # 빈 테이블에 만들면 centroid 학습이 안 된 인덱스가 남으므로 적재 후로 미룬다
+            elif n_rows == 0:
+                print("  ⏭️  review_embeddings가 비어 있어 건너뜀 (임베딩 적재 후 다시 실행)")
+            else:
+                lists = ivfflat_lists(n_rows)
+                conn.execute(text(f"DROP INDEX IF EXISTS {REVIEW_HNSW_INDEX}"))
+                conn.execute(text(f"""
+                    CREATE INDEX IF NOT EXISTS {REVIEW_IVFFLAT_INDEX}
+                    ON review_embeddings 
+                    USING ivfflat (embedding halfvec_ip_ops)
+                    WITH (lists = {lists});
+                """))
+                conn.commit()
+                print(
+                    f"  ✅ review_embeddings 인덱스 생성 완료 (rows={n_rows}, lists={lists}, "
+                    f"검색 세션에서 SET ivfflat.probes = {math.isqrt(lists)} 권장)"
+                )
         except Exception as e:
             print(f"  ⚠️  review_embeddings 인덱스 생성 실패: {e}")
             conn.rollback()
@@ -71,6 +173,22 @@ def create_indexes() -> None:
             print(f"  ⚠️  place_id 인덱스 생성 실패: {e}")
             conn.rollback()
         
+        # 추천 쿼리(place_summary_embeddings)의 최근접 검색용 HNSW 인덱스
+        # ORDER BY embedding::halfvec <#> :q LIMIT k 를 전체 스캔 없이 인덱스로 처리.
+        # 인덱스는 FP16(halfvec)으로 만들어 크기/메모리 대역폭을 절반으로 줄이고, 점수는 FP32 원본으로 재계산한다.
+        print("  - place_summary_embeddings.embedding HNSW(halfvec) 인덱스 생성 중...")
+        try:
+            conn.execute(text(f"""
+                CREATE INDEX IF NOT EXISTS {SUMMARY_HNSW_INDEX}
+                ON place_summary_embeddings
+                USING hnsw ((embedding::halfvec(1536)) halfvec_ip_ops);
+            """))
+            conn.commit()
+            print("  ✅ place_summary_embeddings HNSW 인덱스 생성 완료")
+        except Exception as e:
+            print(f"  ⚠️  place_summary_embeddings HNSW 인덱스 생성 실패: {e}")
+            conn.rollback()
+
         print("\n✅ 인덱스 생성 완료")
         
         # 생성된 인덱스 확인
@@ -79,12 +197,32 @@ def create_indexes() -> None:
             SELECT indexname, tablename 
             FROM pg_indexes 
             WHERE schemaname = 'public' 
-            AND tablename = 'review_embeddings'
-            ORDER BY indexname;
+            AND tablename IN ('review_embeddings', 'place_summary_embeddings')
+            ORDER BY tablename, indexname;
         """))
         for row in result:
             print(f"  - {row[1]}.{row[0]}")
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description="pgvector 인덱스 생성/삭제")
+    parser.add_argument(
+        "--drop",
+        action="store_true",
+        help="벡터 인덱스 삭제 (대량 적재 전에 실행)",
+    )
+    parser.add_argument(
+        "--method",
+        choices=("hnsw", "ivfflat"),
+        default="hnsw",
+        help="review_embeddings 벡터 인덱스 종류 (기본: hnsw)",
+    )
+    args = parser.parse_args()
+    if args.drop:
+        drop_indexes()
+    else:
+        create_indexes(args.method)
+
+
 if __name__ == "__main__":
-    create_indexes()
+    main()
@@ -13,6 +13,7 @@ cron 예시:
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -23,7 +24,7 @@ BACKEND_ROOT = Path(__file__).resolve().parent.parent
 load_dotenv(BACKEND_ROOT / ".env")
 sys.path.insert(0, str(BACKEND_ROOT))
 
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal
 from app.services.crawl_runner import ingest_from_crawl
 
 
@@ -47,20 +48,19 @@ def build_default_queries() -> list[str]:
     return [f"{station} {cat}" for station in SEOUL_STATIONS for cat in CATEGORIES]
 
 
-def run_daily_crawl(queries: list[str] | None = None, thumbnail_only: bool = False) -> None:
+async def run_daily_crawl(queries: list[str] | None = None, thumbnail_only: bool = False) -> None:
     """여러 검색 쿼리에 대해 장소 크롤링 + DB upsert."""
     if not queries:
         queries = build_default_queries()
 
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         total_ingested = 0
         total_skipped = 0
 
         for i, q in enumerate(queries, 1):
             print(f"\n[{i}/{len(queries)}] 쿼리='{q}' 크롤링 시작...", file=sys.stderr)
             try:
-                summary = ingest_from_crawl(db, q, thumbnail_only=thumbnail_only)
+                summary = await ingest_from_crawl(db, q, thumbnail_only=thumbnail_only)
                 total_ingested += summary.places_fetched
                 total_skipped += summary.places_skipped
                 print(
@@ -76,13 +76,11 @@ def run_daily_crawl(queries: list[str] | None = None, thumbnail_only: bool = Fal
         print(f"  신규 장소: {total_ingested}개")
         print(f"  이미 존재해서 스킵: {total_skipped}개")
         print("=" * 60)
-    finally:
-        db.close()
 
 
 if __name__ == "__main__":
     # CRAWL_THUMBNAIL_ONLY=1 이면 상세페이지 보강 없이 리스트 썸네일만 사용 (가장 빠름)
     import os
     thumbnail_only = os.getenv("CRAWL_THUMBNAIL_ONLY", "").lower() in {"1", "true", "yes"}
-    run_daily_crawl(thumbnail_only=thumbnail_only)
+    asyncio.run(run_daily_crawl(thumbnail_only=thumbnail_only))
 
@@ -40,7 +40,7 @@ from generate_embeddings import generate_embeddings
 def main() -> None:
     # 1) 장소 크롤링
     print("=== [1/3] 일일 장소 크롤링 시작 ===")
-    run_daily_crawl()
+    asyncio.run(run_daily_crawl())
     print("=== [1/3] 일일 장소 크롤링 완료 ===\n")
 
     # 2) 리뷰 크롤링 (DB에 있는 모든 place_id 대상, 기존 review_id는 내부에서 스킵)
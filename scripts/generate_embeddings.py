@@ -8,7 +8,10 @@ from __future__ import annotations
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
+from typing import Callable, Iterator
 
 # 환경 변수 로드
 from dotenv import load_dotenv
@@ -20,78 +23,183 @@ load_dotenv(BACKEND_ROOT / ".env")
 # backend 모듈 import를 위해 경로 추가
 sys.path.insert(0, str(BACKEND_ROOT))
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
+from tqdm import tqdm
 
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, engine
 from app.models.place import Place
 from app.models.review import Review
+from app.services.extraction_cache import content_hash, load_cached_categories
 from app.services.recommendation import refresh_embeddings
 
+# 같은 scripts 폴더의 create_indexes import
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+from create_indexes import REVIEW_VECTOR_INDEXES, create_indexes, drop_indexes
+
+# 동시에 처리할 장소 수. 임베딩/추출은 OpenAI API 대기가 대부분이라 스레드로 겹친다.
+# 워커마다 DB 커넥션을 하나씩 쓰므로 동기 엔진 풀 크기(SYNC_DB_POOL_SIZE, 기본 10) 안에서 잡는다.
+DEFAULT_WORKERS = 4
+# 리뷰를 한 번의 IN 조회로 미리 읽어오는 장소 묶음 크기
+PLACE_CHUNK_SIZE = 500
+# 전체 장소 id를 서버 사이드 커서로 가져오는 단위
+PLACE_ID_FETCH_SIZE = 10_000
+
+
+def _load_reviews(db: Session, place_ids: list[int]) -> dict[int, list[tuple[int, str]]]:
+    """장소 묶음의 리뷰 (review_id, 본문)을 한 번에 조회해 장소별로 묶는다."""
+    grouped: dict[int, list[tuple[int, str]]] = {place_id: [] for place_id in place_ids}
+    rows = (
+        db.query(Review.place_id, Review.id, Review.content)
+        .filter(Review.place_id.in_(place_ids))
+        .order_by(Review.place_id, Review.id)
+    )
+    for place_id, review_id, content in rows:
+        grouped[place_id].append((review_id, content))
+    return grouped
 
-def generate_embeddings_for_place(db: Session, place_id: int) -> tuple[int, int]:
-    """특정 장소의 모든 리뷰에서 임베딩 생성."""
-    place = db.get(Place, place_id)
-    if not place:
-        return 0, 0
 
-    reviews = db.query(Review).filter(Review.place_id == place_id).all()
-    if not reviews:
+def generate_embeddings_for_place(
+    db: Session,
+    place_id: int,
+    reviews: list[tuple[int, str]] | None = None,
+) -> tuple[int, int]:
+    """특정 장소의 모든 리뷰에서 임베딩 생성.
+
+    reviews((review_id, 본문) 목록)를 넘기면 리뷰 조회를 건너뛴다. 추출 캐시는 장소 단위로 한 번 조회하고,
+    리뷰마다 SAVEPOINT를 두어 실패한 리뷰만 되돌린 뒤 장소 단위로 한 번 커밋한다.
+    """
+    if reviews is None:
+        reviews = _load_reviews(db, [place_id])[place_id]
+    targets = [(review_id, content.strip()) for review_id, content in reviews if content and content.strip()]
+    if not targets:
         return 0, 0
 
+    hashes = {review_id: content_hash(content) for review_id, content in targets}
+    cached = load_cached_categories(db, hashes.values())
+
     total_inserted = 0
     processed = 0
 
-    for review in reviews:
-        content = review.content.strip()
-        if not content:
-            continue
-
-        try:
-            _, inserted = refresh_embeddings(db, place_id, review.id, content)
-            total_inserted += inserted
-            processed += 1
-        except Exception as exc:
-            print(f"[ERROR] place_id={place_id}, review_id={review.id} error={exc}", file=sys.stderr)
+    try:
+        for review_id, content in targets:
+            try:
+                with db.begin_nested():
+                    _, inserted = refresh_embeddings(
+                        db, place_id, review_id, content, categories=cached.get(hashes[review_id]), commit=False
+                    )
+                total_inserted += inserted
+                processed += 1
+            except Exception as exc:
+                tqdm.write(f"[ERROR] place_id={place_id}, review_id={review_id} error={exc}", file=sys.stderr)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
 
     return processed, total_inserted
 
 
+def _generate_in_own_session(place_id: int, reviews: list[tuple[int, str]]) -> tuple[int, int]:
+    """워커 스레드용: 장소마다 별도 세션으로 generate_embeddings_for_place 실행."""
+    db = SessionLocal()
+    try:
+        return generate_embeddings_for_place(db, place_id, reviews)
+    finally:
+        db.close()
+
+
+def _iter_target_chunks(place_ids: list[int] | None, limit: int | None) -> Iterator[list[int]]:
+    """처리할 place_id를 PLACE_CHUNK_SIZE개씩 yield.
+
+    전체 장소는 별도 커넥션의 서버 사이드 커서(yield_per)로 읽어 id 목록 전체를 메모리에 올리지 않는다.
+    (작업 세션은 청크마다 트랜잭션을 닫으므로 같은 커넥션에서 커서를 열어둘 수 없다)
+    """
+    if place_ids:
+        ids = islice(place_ids, limit or None)
+        while chunk := list(islice(ids, PLACE_CHUNK_SIZE)):
+            yield chunk
+        return
+
+    with engine.connect() as conn:
+        result = conn.execution_options(yield_per=PLACE_ID_FETCH_SIZE).execute(select(Place.id))
+        ids = islice(result.scalars(), limit or None)
+        while chunk := list(islice(ids, PLACE_CHUNK_SIZE)):
+            yield chunk
+
+
 def generate_embeddings(
     db: Session,
     place_ids: list[int] | None = None,
     limit: int | None = None,
+    workers: int = DEFAULT_WORKERS,
 ) -> tuple[int, int, int]:
-    """리뷰에서 임베딩 생성."""
+    """리뷰에서 임베딩 생성. workers > 1이면 장소 단위로 병렬 처리."""
     if place_ids:
-        target_ids = list(dict.fromkeys(place_ids))
+        place_ids = list(dict.fromkeys(place_ids))
+        total = len(place_ids)
     else:
-        # 모든 장소 가져오기
-        places = db.query(Place.id).all()
-        target_ids = [p.id for p in places]
-
+        total = db.scalar(select(func.count()).select_from(Place)) or 0
     if limit:
-        target_ids = target_ids[:limit]
+        total = min(total, limit)
 
     places_processed = 0
     reviews_processed = 0
     embeddings_created = 0
 
-    for i, place_id in enumerate(target_ids, 1):
-        print(f"[{i}/{len(target_ids)}] place_id={place_id} 처리 중...", end=" ", flush=True, file=sys.stderr)
-        
-        processed, inserted = generate_embeddings_for_place(db, place_id)
-        
+    # 장소마다 stderr에 한 줄씩 쓰지 않고 진행률 표시줄만 갱신 (0.5초 간격)
+    progress = tqdm(total=total, unit="place", mininterval=0.5, file=sys.stderr)
+
+    def report(processed: int, inserted: int) -> None:
+        nonlocal places_processed, reviews_processed, embeddings_created
         if processed > 0:
             places_processed += 1
             reviews_processed += processed
             embeddings_created += inserted
-            print(f"✅ {processed}개 리뷰 처리, {inserted}개 임베딩 생성", file=sys.stderr)
+        progress.set_postfix(reviews=reviews_processed, embeddings=embeddings_created, refresh=False)
+        progress.update(1)
+
+    with progress:
+        if workers <= 1:
+            for chunk in _iter_target_chunks(place_ids, limit):
+                reviews_by_place = _load_reviews(db, chunk)
+                for place_id in chunk:
+                    report(*generate_embeddings_for_place(db, place_id, reviews_by_place[place_id]))
         else:
-            print(f"⏭️  리뷰 없음", file=sys.stderr)
+            _generate_parallel(db, place_ids, limit, workers, report, progress)
 
     return places_processed, reviews_processed, embeddings_created
 
 
+def _generate_parallel(
+    db: Session,
+    place_ids: list[int] | None,
+    limit: int | None,
+    workers: int,
+    report: Callable[[int, int], None],
+    progress: tqdm,
+) -> None:
+    """장소 청크마다 리뷰를 미리 읽고 워커 스레드에 장소 단위로 나눠 처리."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for chunk in _iter_target_chunks(place_ids, limit):
+            reviews_by_place = _load_reviews(db, chunk)
+            # 읽기 트랜잭션을 닫아 워커 처리 동안 커넥션을 붙잡지 않는다
+            db.rollback()
+            futures = {
+                executor.submit(_generate_in_own_session, place_id, reviews_by_place[place_id]): place_id
+                for place_id in chunk
+            }
+            for future in as_completed(futures):
+                place_id = futures[future]
+                try:
+                    report(*future.result())
+                except Exception as exc:
+                    progress.update(1)
+                    progress.write(f"[ERROR] place_id={place_id} error={exc}", file=sys.stderr)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="리뷰에서 카테고리 임베딩 생성")
     parser.add_argument(
@@ -104,6 +212,17 @@ def main() -> None:
         type=int,
         help="처리할 장소 최대 개수 (테스트용)",
     )
+    parser.add_argument(
+        "--defer-indexes",
+        action="store_true",
+        help="대량 생성 시 review_embeddings 벡터 인덱스를 먼저 지우고 생성이 끝난 뒤(실패해도) 다시 만든다",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"동시에 처리할 장소 수 (기본: {DEFAULT_WORKERS}, 1이면 순차 처리)",
+    )
     args = parser.parse_args()
 
     db = SessionLocal()
@@ -115,10 +234,20 @@ def main() -> None:
             except ValueError:
                 raise SystemExit("--place-ids는 숫자로만 구성되어야 합니다.")
 
+        # 추천 쿼리가 쓰는 place_summary_embeddings 인덱스는 건드리지 않고 review_embeddings 것만 지운다
+        if args.defer_indexes:
+            drop_indexes(REVIEW_VECTOR_INDEXES)
+
         print("🚀 임베딩 생성 시작...")
-        places_processed, reviews_processed, embeddings_created = generate_embeddings(
-            db, place_ids, args.limit
-        )
+        try:
+            places_processed, reviews_processed, embeddings_created = generate_embeddings(
+                db, place_ids, args.limit, workers=args.workers
+            )
+        finally:
+            # 실패/중단돼도 인덱스가 지워진 채로 남지 않도록 재생성
+            if args.defer_indexes:
+                db.rollback()
+                create_indexes()
 
         print("\n" + "=" * 60)
         print("임베딩 생성 완료")
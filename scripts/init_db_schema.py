@@ -19,25 +19,67 @@ sys.path.insert(0, str(BACKEND_ROOT))
 
 from sqlalchemy import text
 
-from app.models.place import Place
-from app.models.place_summary_embedding import PlaceSummaryEmbedding
+from app.db.init_db import init_db
 from app.db.session import engine
 
+EMBEDDING_DIM = 1536
+
+
+def migrate_review_embeddings_to_halfvec() -> None:
+    """review_embeddings.embedding이 아직 vector(FP32)면 halfvec(FP16)으로 변환.
+
+    기존 vector_cosine_ops 인덱스는 halfvec 컬럼에 다시 만들 수 없으므로 먼저 지운다
+    (변환 후 scripts/create_indexes.py로 재생성).
+    """
+    with engine.connect() as conn:
+        udt_name = conn.execute(text("""
+            SELECT udt_name
+            FROM information_schema.columns
+            WHERE table_schema = 'public'
+              AND table_name = 'review_embeddings'
+              AND column_name = 'embedding'
+        """)).scalar()
+        if udt_name != "vector":
+            return
+        print("🔧 review_embeddings.embedding → halfvec 변환 중...")
+        conn.execute(text("DROP INDEX IF EXISTS review_embeddings_embedding_idx"))
+        conn.execute(text("DROP INDEX IF EXISTS review_embeddings_embedding_hnsw"))
+        conn.execute(text(
+            f"ALTER TABLE review_embeddings ALTER COLUMN embedding "
+            f"TYPE halfvec({EMBEDDING_DIM}) USING embedding::halfvec({EMBEDDING_DIM})"
+        ))
+        conn.commit()
+    print("✅ halfvec 변환 완료 (scripts/create_indexes.py로 벡터 인덱스 재생성)")
+
+
+def make_review_place_fk_deferrable() -> None:
+    """reviews.place_id FK를 DEFERRABLE INITIALLY IMMEDIATE로 변경 (기본 동작은 그대로, 적재 시에만 지연)."""
+    with engine.connect() as conn:
+        deferrable = conn.execute(text("""
+            SELECT condeferrable
+            FROM pg_constraint
+            WHERE conname = 'reviews_place_id_fkey'
+              AND conrelid = to_regclass('public.reviews')
+        """)).scalar()
+        if deferrable is None or deferrable:
+            return
+        conn.execute(text(
+            "ALTER TABLE reviews ALTER CONSTRAINT reviews_place_id_fkey DEFERRABLE INITIALLY IMMEDIATE"
+        ))
+        conn.commit()
+    print("✅ reviews_place_id_fkey → DEFERRABLE")
+
 
 def init_db_schema() -> None:
     """데이터베이스 스키마 초기화."""
     print("🔧 데이터베이스 스키마 초기화 중...")
     
-    # pgvector extension 생성
-    with engine.connect() as conn:
-        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
-        conn.commit()
-        print("✅ pgvector extension 생성 완료")
-    
-    # 필요한 테이블만 생성 (불필요 테이블 재생성 방지)
-    Place.__table__.create(bind=engine, checkfirst=True)
-    PlaceSummaryEmbedding.__table__.create(bind=engine, checkfirst=True)
-    print("✅ 테이블 생성 완료")
+    # extension(pgvector/earthdistance) + 필요한 테이블/인덱스 생성 (앱 기동 시와 동일한 경로)
+    init_db()
+    print("✅ extension/테이블 생성 완료")
+
+    migrate_review_embeddings_to_halfvec()
+    make_review_place_fk_deferrable()
     
     print("\n📋 생성된 테이블:")
     with engine.connect() as conn:
@@ -7,11 +7,13 @@ places.jsonl 파일을 읽어서 PostgreSQL에 저장합니다.
 from __future__ import annotations
 
 import argparse
-import json
+import csv
+import io
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 # 환경 변수 로드
 from dotenv import load_dotenv
@@ -23,99 +25,242 @@ load_dotenv(BACKEND_ROOT / ".env")
 # backend 모듈 import를 위해 경로 추가
 sys.path.insert(0, str(BACKEND_ROOT))
 
+import orjson
+from sqlalchemy import text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
-from app.services.recommendation import upsert_place
+from app.models.place import Place
+
+# 기본 모드에서 한 번에 upsert/커밋하는 장소 수
+BATCH_SIZE = 500
 
 
 def iter_jsonl(path: Path):
-    """JSONL 파일을 한 줄씩 읽어 dict로 yield."""
-    with path.open("r", encoding="utf-8") as fp:
+    """JSONL 파일을 한 줄씩 읽어 dict로 yield (바이트 그대로 orjson 파싱, 빈 줄/깨진 줄은 건너뜀)."""
+    with path.open("rb") as fp:
         for line in fp:
-            line = line.strip()
-            if not line:
-                continue
             try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
                 continue
 
 
-def load_places(jsonl_path: Path, db: Session) -> tuple[int, int, int]:
-    """장소 JSONL을 DB에 적재."""
+# --bulk 모드에서 COPY로 임시 테이블에 넣는 컬럼 순서
+_COPY_COLUMNS = (
+    "id",
+    "name",
+    "category",
+    "road_address",
+    "image_url",
+    "latitude",
+    "longitude",
+    "review_count",
+    "crawled_at",
+    "updated_at",
+)
+# 기존 행과 비교해 바뀐 경우에만 UPDATE하는 컬럼 (적재 시각 컬럼은 매번 달라 비교에서 제외)
+_COMPARE_COLUMNS = tuple(column for column in _COPY_COLUMNS if column not in ("id", "crawled_at", "updated_at"))
+
+
+def _record_to_payload(record: dict, now: datetime) -> tuple[dict | None, str | None]:
+    """JSONL 레코드 1건을 places 컬럼 dict로 변환. 건너뛸 레코드면 (None, 사유).
+
+    now: crawled_at/updated_at에 넣을 적재 실행 시각 (행마다 시계를 읽지 않도록 호출 측에서 한 번 구한다).
+    """
+    place_id_str = record.get("place_id")
+    if not place_id_str:
+        return None, f"[SKIP] place_id 없음: {record}"
+
+    try:
+        place_id = int(place_id_str)
+    except (ValueError, TypeError):
+        return None, f"[SKIP] place_id 변환 실패: {place_id_str}"
+
+    # 필수 필드 확인
+    name = record.get("name")
+    category = record.get("category") or "기타"
+    road_address = record.get("road_address") or record.get("address")
+    latitude = record.get("latitude")
+    longitude = record.get("longitude")
+
+    if not all([name, road_address, latitude is not None, longitude is not None]):
+        missing_fields = []
+        if not name:
+            missing_fields.append("name")
+        if not road_address:
+            missing_fields.append("road_address")
+        if latitude is None:
+            missing_fields.append("latitude")
+        if longitude is None:
+            missing_fields.append("longitude")
+        return None, f"[SKIP] place_id={place_id_str} 필수 필드 누락: {', '.join(missing_fields)}"
+
+    return {
+        "id": place_id,
+        "name": name,
+        "category": category,
+        "road_address": road_address,
+        "image_url": record.get("image_url") or None,
+        "latitude": float(latitude),
+        "longitude": float(longitude),
+        "crawled_at": now,
+        "review_count": record.get("review_count") if record.get("review_count") is not None else 0,
+        "updated_at": now,
+    }, None
+
+
+def upsert_places(db: Session, payloads: list[dict]) -> tuple[int, int]:
+    """장소 payload 배치를 INSERT ... ON CONFLICT (id) DO UPDATE 한 문장으로 반영하고 커밋.
+
+    ORM 객체를 만들지 않으므로 세션 identity map이 커지지 않는다. 배치 안에서 같은 id가 반복되면 마지막 값을 쓴다.
+    내용이 그대로인 기존 장소는 ON CONFLICT의 WHERE 조건으로 UPDATE하지 않는다 (재실행 시 불필요한 쓰기/WAL 방지).
+    반환: (반영한 수, 변경 없어 건너뛴 수)
+    """
+    rows = list({payload["id"]: payload for payload in payloads}.values())
+    if not rows:
+        return 0, 0
+    stmt = pg_insert(Place).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Place.id],
+        set_={column: stmt.excluded[column] for column in _COPY_COLUMNS if column != "id"},
+        where=tuple_(*(Place.__table__.c[column] for column in _COMPARE_COLUMNS)).is_distinct_from(
+            tuple_(*(stmt.excluded[column] for column in _COMPARE_COLUMNS))
+        ),
+    ).returning(Place.id)
+    try:
+        written = len(db.execute(stmt).all())
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return written, len(rows) - written
+
+
+def load_places(jsonl_path: Path, db: Session, batch_size: int = BATCH_SIZE) -> tuple[int, int, int]:
+    """장소 JSONL을 DB에 적재 (batch_size개씩 모아 배치당 한 번 커밋)."""
     success = 0
     skipped = 0
     failed = 0
+    now = datetime.now()
+    batch: list[dict] = []
+
+    def flush() -> None:
+        nonlocal success, skipped, failed
+        try:
+            written, unchanged = upsert_places(db, batch)
+            success += written
+            skipped += unchanged
+            print(f"[INFO] {success}개 장소 적재 완료...", file=sys.stderr)
+        except Exception as exc:
+            failed += len(batch)
+            # 첫 번째 실패만 상세 로그 출력
+            if failed == len(batch):
+                import traceback
+                print(f"[FAIL] 장소 {len(batch)}개 배치 첫 번째 오류 상세:", file=sys.stderr)
+                print(traceback.format_exc(), file=sys.stderr)
+            else:
+                print(f"[FAIL] 장소 {len(batch)}개 배치 error={exc}", file=sys.stderr)
+        batch.clear()
 
     for record in iter_jsonl(jsonl_path):
-        place_id_str = record.get("place_id")
-        if not place_id_str:
+        try:
+            payload, skip_reason = _record_to_payload(record, now)
+        except (ValueError, TypeError) as exc:
+            payload, skip_reason = None, f"[SKIP] place_id={record.get('place_id')} 값 변환 실패: {exc}"
+        if payload is None:
             skipped += 1
             if skipped <= 5:  # 처음 5개만 로그 출력
-                print(f"[SKIP] place_id 없음: {record}", file=sys.stderr)
+                print(skip_reason, file=sys.stderr)
             continue
 
-        try:
-            place_id = int(place_id_str)
-        except (ValueError, TypeError):
-            skipped += 1
-            if skipped <= 5:
-                print(f"[SKIP] place_id 변환 실패: {place_id_str}", file=sys.stderr)
-            continue
+        batch.append(payload)
+        if len(batch) >= batch_size:
+            flush()
 
-        # 필수 필드 확인
-        name = record.get("name")
-        category = record.get("category") or "기타"
-        road_address = record.get("road_address") or record.get("address")
-        latitude = record.get("latitude")
-        longitude = record.get("longitude")
+    if batch:
+        flush()
+    return success, skipped, failed
 
-        if not all([name, road_address, latitude is not None, longitude is not None]):
-            skipped += 1
-            missing_fields = []
-            if not name:
-                missing_fields.append("name")
-            if not road_address:
-                missing_fields.append("road_address")
-            if latitude is None:
-                missing_fields.append("latitude")
-            if longitude is None:
-                missing_fields.append("longitude")
-            if skipped <= 5:
-                print(f"[SKIP] place_id={place_id_str} 필수 필드 누락: {', '.join(missing_fields)}", file=sys.stderr)
-            continue
 
-        try:
-            payload = {
-                "id": place_id,
-                "name": name,
-                "category": category,
-                "road_address": road_address,
-                "image_url": record.get("image_url") or None,
-                "latitude": float(latitude),
-                "longitude": float(longitude),
-                "crawled_at": datetime.now(),
-                "review_count": record.get("review_count") if record.get("review_count") is not None else 0,
-                "updated_at": datetime.now(),
-            }
-            upsert_place(db, payload)
-            success += 1
-            if success % 10 == 0:
-                print(f"[INFO] {success}개 장소 적재 완료...", file=sys.stderr)
-        except Exception as exc:
-            # 트랜잭션 롤백 후 계속 진행
-            db.rollback()
-            failed += 1
-            # 첫 번째 실패만 상세 로그 출력
-            if failed == 1:
-                import traceback
-                print(f"[FAIL] place_id={place_id} 첫 번째 오류 상세:", file=sys.stderr)
-                print(traceback.format_exc(), file=sys.stderr)
-            elif failed <= 5:
-                print(f"[FAIL] place_id={place_id} error={exc}", file=sys.stderr)
+class _CsvStream(io.TextIOBase):
+    """행 iterator를 COPY FROM STDIN용 CSV 스트림으로 노출 (전체 행을 메모리에 만들지 않고 read(n)마다 필요한 만큼만 변환)."""
 
-    return success, skipped, failed
+    def __init__(self, rows: Iterator[tuple]) -> None:
+        self._rows = rows
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self._pending = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._pending) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._writer.writerow(row)
+            self._pending += self._buffer.getvalue()
+            self._buffer.seek(0)
+            self._buffer.truncate()
+        if size < 0:
+            chunk, self._pending = self._pending, ""
+        else:
+            chunk, self._pending = self._pending[:size], self._pending[size:]
+        return chunk
+
+
+def load_places_bulk(jsonl_path: Path, db: Session) -> tuple[int, int, int]:
+    """장소 JSONL을 COPY FROM STDIN으로 임시 테이블에 밀어넣고 INSERT ... ON CONFLICT 한 문장으로 반영.
+
+    전체가 한 트랜잭션이라 실패하면 아무것도 반영되지 않는다 (실패 수는 항상 0).
+    """
+    skipped = 0
+    now = datetime.now()
+
+    def rows() -> Iterator[tuple]:
+        nonlocal skipped
+        for record in iter_jsonl(jsonl_path):
+            try:
+                payload, skip_reason = _record_to_payload(record, now)
+            except (ValueError, TypeError) as exc:
+                payload, skip_reason = None, f"[SKIP] place_id={record.get('place_id')} 값 변환 실패: {exc}"
+            if payload is None:
+                skipped += 1
+                if skipped <= 5:
+                    print(skip_reason, file=sys.stderr)
+                continue
+            yield tuple(payload[column] for column in _COPY_COLUMNS)
+
+    columns = ", ".join(_COPY_COLUMNS)
+    update_set = ", ".join(f"{column} = EXCLUDED.{column}" for column in _COPY_COLUMNS if column != "id")
+    current = ", ".join(f"places.{column}" for column in _COMPARE_COLUMNS)
+    incoming = ", ".join(f"EXCLUDED.{column}" for column in _COMPARE_COLUMNS)
+    try:
+        db.execute(text("CREATE TEMP TABLE _load_places (LIKE places INCLUDING DEFAULTS) ON COMMIT DROP"))
+        cursor = db.connection().connection.driver_connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY _load_places ({columns}) FROM STDIN WITH (FORMAT csv)", _CsvStream(rows()))
+        finally:
+            cursor.close()
+        loaded = db.execute(text("SELECT count(DISTINCT id) FROM _load_places")).scalar() or 0
+        # 파일 안에서 같은 id가 여러 번 나오면 마지막 줄을 반영 (COPY 직후 임시 테이블의 ctid는 입력 순서)
+        # 내용이 그대로인 기존 장소는 UPDATE하지 않는다
+        result = db.execute(text(
+            f"INSERT INTO places ({columns}) "
+            f"SELECT DISTINCT ON (id) {columns} FROM _load_places ORDER BY id, ctid DESC "
+            f"ON CONFLICT (id) DO UPDATE SET {update_set} "
+            f"WHERE ({current}) IS DISTINCT FROM ({incoming})"
+        ))
+        success = result.rowcount
+        skipped += loaded - success
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return success, skipped, 0
 
 
 def main() -> None:
@@ -126,6 +271,17 @@ def main() -> None:
         default=Path("places.jsonl"),
         help="장소 JSONL 파일 경로 (기본: ./places.jsonl)",
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="COPY FROM STDIN으로 한 번에 적재 (최초 대량 적재용, 한 트랜잭션)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"기본 모드에서 한 번에 저장/커밋할 장소 수 (기본: {BATCH_SIZE})",
+    )
     args = parser.parse_args()
 
     if not args.file.exists():
@@ -134,7 +290,10 @@ def main() -> None:
     db = SessionLocal()
     try:
         print(f"📖 {args.file}에서 장소 데이터 로드 중...")
-        success, skipped, failed = load_places(args.file, db)
+        if args.bulk:
+            success, skipped, failed = load_places_bulk(args.file, db)
+        else:
+            success, skipped, failed = load_places(args.file, db, batch_size=max(1, args.batch_size))
         
         print("\n" + "=" * 60)
         print("장소 적재 완료")
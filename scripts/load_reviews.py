@@ -7,9 +7,10 @@ reviews.jsonl 파일을 읽어서 PostgreSQL에 저장합니다.
 from __future__ import annotations
 
 import argparse
-import json
+import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 # 환경 변수 로드
@@ -22,108 +23,177 @@ load_dotenv(BACKEND_ROOT / ".env")
 # backend 모듈 import를 위해 경로 추가
 sys.path.insert(0, str(BACKEND_ROOT))
 
+import orjson
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
-from app.models.place import Place
 from app.models.review import Review
 
+# 한 번에 조회/INSERT/UPDATE 후 커밋하는 리뷰 수
+BATCH_SIZE = 500
+# 기존 리뷰 갱신 시 덮어쓰는 컬럼
+_REVIEW_UPDATE_FIELDS = ("content", "author", "rating", "visit_date", "crawled_at")
+# --reindex 시 적재 중 지웠다가 적재 후 다시 만드는 보조 인덱스
+# (review_id 유니크 인덱스는 ON CONFLICT에 필요하므로 유지)
+_DEFERRED_INDEXES = {
+    "ix_reviews_place_id": "CREATE INDEX IF NOT EXISTS ix_reviews_place_id ON reviews (place_id)",
+}
+# 방문 날짜 "월.일.요일" 앞부분
+_VISIT_DATE_RE = re.compile(r"^(\d{1,2})\.(\d{1,2})")
+# 방문 날짜에는 연도가 없어 적재 실행 시점의 연도를 쓴다
+_CURRENT_YEAR = datetime.now().year
+
 
 def iter_jsonl(path: Path):
-    """JSONL 파일을 한 줄씩 읽어 dict로 yield."""
-    with path.open("r", encoding="utf-8") as fp:
+    """JSONL 파일을 한 줄씩 읽어 dict로 yield (바이트 그대로 orjson 파싱, 빈 줄/깨진 줄은 건너뜀)."""
+    with path.open("rb") as fp:
         for line in fp:
-            line = line.strip()
-            if not line:
-                continue
             try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
                 continue
 
 
+@lru_cache(maxsize=4096)
 def parse_visit_date(date_str: str | None) -> datetime | None:
-    """방문 날짜 문자열을 datetime으로 변환."""
+    """방문 날짜 문자열을 datetime으로 변환 (같은 날짜 문자열이 많이 반복되므로 결과를 캐시)."""
     if not date_str:
         return None
     # "1.24.토" 형식 처리
+    match = _VISIT_DATE_RE.match(date_str)
+    if not match:
+        return None
     try:
-        parts = date_str.split(".")
-        if len(parts) >= 2:
-            month = int(parts[0])
-            day = int(parts[1])
-            # 현재 연도 사용 (정확하지 않지만 크롤링 시점 기준)
-            year = datetime.now().year
-            return datetime(year, month, day)
-    except (ValueError, IndexError):
-        pass
-    return None
-
-
-def upsert_review(db: Session, place_id: int, review_data: dict) -> Review | None:
-    """리뷰 데이터를 DB에 저장 또는 업데이트."""
-    review_id_str = review_data.get("id") or review_data.get("review_id")
-    if not review_id_str:
+        # 현재 연도 사용 (정확하지 않지만 크롤링 시점 기준)
+        return datetime(_CURRENT_YEAR, int(match.group(1)), int(match.group(2)))
+    except ValueError:
         return None
 
-    try:
-        # 기존 리뷰 확인
-        existing = db.query(Review).filter(Review.review_id == review_id_str).first()
-        
-        visit_date = parse_visit_date(review_data.get("visit_date"))
+
+def upsert_review(db: Session, place_id: int, review_data: dict) -> bool:
+    """리뷰 데이터를 DB에 저장 또는 업데이트. review_id가 없으면 False."""
+    if not (review_data.get("id") or review_data.get("review_id")):
+        return False
+    return upsert_reviews(db, [(place_id, review_data)]) > 0
+
+
+def upsert_reviews(
+    db: Session,
+    batch: list[tuple[int, dict]],
+    crawled_at: datetime | None = None,
+    defer_fk: bool = False,
+) -> int:
+    """(place_id, 리뷰 데이터) 배치를 저장하고 커밋. 반환: 저장한 리뷰 수.
+
+    INSERT ... ON CONFLICT (review_id) DO UPDATE 한 문장(multi-row VALUES)으로 반영한다.
+    배치 안에서 같은 review_id가 반복되면 마지막 값을 쓴다. crawled_at은 배치 전체에 같은 값을 쓴다 (없으면 현재 시각).
+    defer_fk는 reviews_place_id_fkey가 DEFERRABLE일 때만 켠다 (_place_fk_deferrable).
+    """
+    if crawled_at is None:
         crawled_at = datetime.now()
+    payloads: dict[str, dict] = {}
+    for place_id, review_data in batch:
+        review_id_str = str(review_data.get("id") or review_data.get("review_id"))
+        payloads[review_id_str] = {
+            "place_id": place_id,
+            "review_id": review_id_str,
+            "author": review_data.get("author"),
+            "content": review_data.get("content", ""),
+            "rating": review_data.get("rating"),
+            "visit_date": parse_visit_date(review_data.get("visit_date")),
+            "crawled_at": crawled_at,
+        }
+    if not payloads:
+        return 0
 
-        if existing:
-            # 업데이트
-            existing.content = review_data.get("content", "")
-            existing.author = review_data.get("author")
-            existing.rating = review_data.get("rating")
-            existing.visit_date = visit_date
-            existing.crawled_at = crawled_at
-            db.commit()
-            db.refresh(existing)
-            return existing
-        else:
-            # 새로 생성
-            review = Review(
-                place_id=place_id,
-                review_id=review_id_str,
-                author=review_data.get("author"),
-                content=review_data.get("content", ""),
-                rating=review_data.get("rating"),
-                visit_date=visit_date,
-                crawled_at=crawled_at,
-            )
-            db.add(review)
-            db.commit()
-            db.refresh(review)
-            return review
+    stmt = pg_insert(Review).values(list(payloads.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Review.review_id],
+        set_={field: stmt.excluded[field] for field in _REVIEW_UPDATE_FIELDS},
+    )
+    try:
+        if defer_fk:
+            # FK 검사를 INSERT 문이 아니라 커밋 시점으로 미룬다
+            db.execute(text("SET CONSTRAINTS reviews_place_id_fkey DEFERRED"))
+        db.execute(stmt)
+        db.commit()
     except Exception:
         db.rollback()
         raise
+    return len(payloads)
+
 
+def _parse_place_id(value) -> int | None:
+    if not value:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _existing_place_ids(db: Session, jsonl_path: Path) -> set[int]:
+    """파일에 등장하는 place_id 중 DB에 있는 것만 한 번의 조회로 가져온다 (리뷰마다 장소 존재 확인 대신)."""
+    place_ids = {
+        place_id
+        for place_id in (_parse_place_id(record.get("place_id")) for record in iter_jsonl(jsonl_path))
+        if place_id is not None
+    }
+    if not place_ids:
+        return set()
+    return set(
+        db.execute(
+            text("SELECT id FROM places WHERE id = ANY(:ids)"), {"ids": list(place_ids)}
+        ).scalars()
+    )
 
-def load_reviews(jsonl_path: Path, db: Session) -> tuple[int, int, int]:
-    """리뷰 JSONL을 DB에 적재."""
+
+def _place_fk_deferrable(db: Session) -> bool:
+    """reviews_place_id_fkey가 DEFERRABLE인지 (scripts/init_db_schema.py 또는 마이그레이션 적용 여부)."""
+    return bool(
+        db.execute(
+            text("SELECT condeferrable FROM pg_constraint WHERE conname = 'reviews_place_id_fkey'")
+        ).scalar()
+    )
+
+
+def load_reviews(jsonl_path: Path, db: Session, batch_size: int = BATCH_SIZE) -> tuple[int, int, int]:
+    """리뷰 JSONL을 DB에 적재 (batch_size개씩 모아 배치당 한 번 커밋)."""
+    valid_place_ids = _existing_place_ids(db, jsonl_path)
+    defer_fk = _place_fk_deferrable(db)
     success = 0
     skipped = 0
     failed = 0
+    batch: list[tuple[int, dict]] = []
+    # 적재 실행 시각 (모든 리뷰의 crawled_at)
+    crawled_at = datetime.now()
 
-    for record in iter_jsonl(jsonl_path):
-        place_id_str = record.get("place_id")
-        if not place_id_str:
-            skipped += 1
-            continue
-
+    def flush() -> None:
+        nonlocal success, failed
         try:
-            place_id = int(place_id_str)
-        except (ValueError, TypeError):
+            success += upsert_reviews(db, batch, crawled_at, defer_fk=defer_fk)
+            print(f"[INFO] {success}개 리뷰 적재 완료...", file=sys.stderr)
+        except Exception as exc:
+            failed += len(batch)
+            # 첫 번째 실패만 상세 로그 출력
+            if failed == len(batch):
+                import traceback
+                print(f"[FAIL] 리뷰 {len(batch)}개 배치 첫 번째 오류 상세:", file=sys.stderr)
+                print(traceback.format_exc(), file=sys.stderr)
+            else:
+                print(f"[FAIL] 리뷰 {len(batch)}개 배치 error={exc}", file=sys.stderr)
+        batch.clear()
+
+    for record in iter_jsonl(jsonl_path):
+        place_id = _parse_place_id(record.get("place_id"))
+        if place_id is None:
             skipped += 1
             continue
 
         # 장소가 DB에 존재하는지 확인
-        place = db.get(Place, place_id)
-        if not place:
+        if place_id not in valid_place_ids:
             skipped += 1
             if skipped <= 5:
                 print(f"[SKIP] place_id={place_id} 장소가 DB에 없음", file=sys.stderr)
@@ -145,26 +215,29 @@ def load_reviews(jsonl_path: Path, db: Session) -> tuple[int, int, int]:
                 print(f"[SKIP] place_id={place_id} review_id 없음", file=sys.stderr)
             continue
 
-        try:
-            upsert_review(db, place_id, record)
-            success += 1
-            if success % 10 == 0:
-                print(f"[INFO] {success}개 리뷰 적재 완료...", file=sys.stderr)
-        except Exception as exc:
-            # 트랜잭션 롤백 후 계속 진행
-            db.rollback()
-            failed += 1
-            # 첫 번째 실패만 상세 로그 출력
-            if failed == 1:
-                import traceback
-                print(f"[FAIL] place_id={place_id}, review_id={record.get('id')} 첫 번째 오류 상세:", file=sys.stderr)
-                print(traceback.format_exc(), file=sys.stderr)
-            elif failed <= 5:
-                print(f"[FAIL] place_id={place_id}, review_id={record.get('id')} error={exc}", file=sys.stderr)
+        batch.append((place_id, record))
+        if len(batch) >= batch_size:
+            flush()
 
+    if batch:
+        flush()
     return success, skipped, failed
 
 
+def drop_deferred_indexes(db: Session) -> None:
+    """대량 적재 전에 reviews 보조 인덱스 삭제 (행마다 인덱스를 갱신하지 않도록)."""
+    for index_name in _DEFERRED_INDEXES:
+        db.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+    db.commit()
+
+
+def create_deferred_indexes(db: Session) -> None:
+    """적재 후 drop_deferred_indexes로 지운 인덱스를 한 번에 다시 생성."""
+    for ddl in _DEFERRED_INDEXES.values():
+        db.execute(text(ddl))
+    db.commit()
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="reviews.jsonl → PostgreSQL 적재")
     parser.add_argument(
@@ -173,6 +246,18 @@ def main() -> None:
         default=Path("reviews.jsonl"),
         help="리뷰 JSONL 파일 경로 (기본: ./reviews.jsonl)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"한 번에 저장/커밋할 리뷰 수 (기본: {BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="대량 적재 시 reviews 보조 인덱스를 지우고 적재 후 다시 만든다 "
+        "(임베딩 벡터 인덱스는 generate_embeddings.py --defer-indexes)",
+    )
     args = parser.parse_args()
 
     if not args.file.exists():
@@ -181,8 +266,16 @@ def main() -> None:
     db = SessionLocal()
     try:
         print(f"📖 {args.file}에서 리뷰 데이터 로드 중...")
-        success, skipped, failed = load_reviews(args.file, db)
-        
+        if args.reindex:
+            drop_deferred_indexes(db)
+        try:
+            success, skipped, failed = load_reviews(args.file, db, batch_size=max(1, args.batch_size))
+        finally:
+            if args.reindex:
+                db.rollback()
+                print("🔧 reviews 인덱스 재생성 중...", file=sys.stderr)
+                create_deferred_indexes(db)
+
         print("\n" + "=" * 60)
         print("리뷰 적재 완료")
         print("=" * 60)
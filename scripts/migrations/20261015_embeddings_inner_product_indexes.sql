@@ -0,0 +1,63 @@
+-- Vector indexes for place summary / review embeddings, with inner-product operator classes.
+-- Embeddings are stored as unit vectors, so inner product ranks exactly like cosine distance
+-- without computing norms per comparison. Queries use <#> (negative inner product).
+-- Replaces the earlier FP32 / halfvec cosine HNSW indexes and converts review_embeddings.embedding
+-- to halfvec in the same run, so there is a single migration for vector storage and indexes.
+-- Idempotent: can be executed multiple times safely.
+-- Requires pgvector >= 0.7.0 (halfvec).
+
+BEGIN;
+
+-- 1) place_summary_embeddings: one half-precision inner-product HNSW index
+--    (scores are still recomputed from the FP32 column; the index only serves the nearest-row prefilter)
+DROP INDEX IF EXISTS place_summary_embeddings_embedding_hnsw;
+DROP INDEX IF EXISTS place_summary_embeddings_embedding_half_hnsw;
+
+CREATE INDEX IF NOT EXISTS place_summary_embeddings_embedding_half_ip_hnsw
+ON place_summary_embeddings
+USING hnsw ((embedding::halfvec(1536)) halfvec_ip_ops);
+
+-- 2) review_embeddings: store as halfvec (halves table and index size), then index with halfvec_ip_ops.
+--    Old vector_cosine_ops indexes cannot be rebuilt on halfvec, so they are dropped first.
+--    review_embeddings is dropped by 20260429_safe_schema_ai.sql
+DO $$
+BEGIN
+    IF to_regclass('public.review_embeddings') IS NOT NULL THEN
+        DROP INDEX IF EXISTS review_embeddings_embedding_idx;
+        DROP INDEX IF EXISTS review_embeddings_embedding_hnsw;
+
+        IF EXISTS (
+            SELECT 1
+            FROM information_schema.columns
+            WHERE table_schema = 'public'
+              AND table_name = 'review_embeddings'
+              AND column_name = 'embedding'
+              AND udt_name = 'vector'
+        ) THEN
+            ALTER TABLE review_embeddings
+                ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536);
+        END IF;
+
+        CREATE INDEX IF NOT EXISTS review_embeddings_embedding_ip_hnsw
+        ON review_embeddings
+        USING hnsw (embedding halfvec_ip_ops);
+    END IF;
+END $$;
+
+COMMIT;
+
+-- Post-migration verification
+
+-- Should return halfvec (no rows if review_embeddings does not exist)
+SELECT udt_name
+FROM information_schema.columns
+WHERE table_schema = 'public'
+  AND table_name = 'review_embeddings'
+  AND column_name = 'embedding';
+
+-- Should return the *_ip_* indexes only (review_embeddings one only if that table exists)
+SELECT tablename, indexname
+FROM pg_indexes
+WHERE schemaname = 'public'
+  AND tablename IN ('place_summary_embeddings', 'review_embeddings')
+  AND indexdef ILIKE '%USING hnsw%';
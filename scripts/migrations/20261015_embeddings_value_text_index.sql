@@ -0,0 +1,25 @@
+-- B-tree indexes on value_text so identical category values can reuse an already stored embedding.
+-- Idempotent: can be executed multiple times safely.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_place_summary_embeddings_value_text
+ON place_summary_embeddings (value_text);
+
+DO $$
+BEGIN
+    IF to_regclass('public.review_embeddings') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS ix_review_embeddings_value_text
+        ON review_embeddings (value_text);
+    END IF;
+END $$;
+
+COMMIT;
+
+-- Post-migration verification
+
+-- Should return the value_text indexes
+SELECT tablename, indexname
+FROM pg_indexes
+WHERE schemaname = 'public'
+  AND indexname LIKE 'ix_%_value_text';
@@ -0,0 +1,23 @@
+-- Radius search in SQL (earthdistance) for recommendation candidates.
+-- Idempotent: can be executed multiple times safely.
+
+BEGIN;
+
+-- 1) earthdistance depends on cube (both ship with postgres contrib)
+CREATE EXTENSION IF NOT EXISTS cube;
+CREATE EXTENSION IF NOT EXISTS earthdistance;
+
+-- 2) GiST index used by earth_box(ll_to_earth(:lat, :lon), :radius_m) @> ll_to_earth(latitude, longitude)
+CREATE INDEX IF NOT EXISTS places_earth_gix
+ON places USING gist (ll_to_earth(latitude, longitude));
+
+COMMIT;
+
+-- Post-migration verification
+
+-- Should return places_earth_gix
+SELECT indexname
+FROM pg_indexes
+WHERE schemaname = 'public'
+  AND tablename = 'places'
+  AND indexname = 'places_earth_gix';
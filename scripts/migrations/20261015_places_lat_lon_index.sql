@@ -0,0 +1,18 @@
+-- B-tree index for the latitude/longitude bounding-box prefilter used by radius search.
+-- Idempotent: can be executed multiple times safely.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_places_lat_lon
+ON places (latitude, longitude);
+
+COMMIT;
+
+-- Post-migration verification
+
+-- Should return ix_places_lat_lon
+SELECT indexname
+FROM pg_indexes
+WHERE schemaname = 'public'
+  AND tablename = 'places'
+  AND indexname = 'ix_places_lat_lon';
@@ -0,0 +1,22 @@
+-- Review content hash -> extracted categories cache (skips the LLM call on re-crawl).
+-- Idempotent: can be executed multiple times safely.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS review_extraction_cache (
+    content_hash CHAR(64) PRIMARY KEY,
+    companion TEXT,
+    menu TEXT,
+    mood TEXT,
+    purpose TEXT
+);
+
+COMMIT;
+
+-- Post-migration verification
+
+-- Should return review_extraction_cache
+SELECT tablename
+FROM pg_tables
+WHERE schemaname = 'public'
+  AND tablename = 'review_extraction_cache';
@@ -0,0 +1,23 @@
+-- Make reviews.place_id FK deferrable so bulk loaders can check it once at commit
+-- (SET CONSTRAINTS reviews_place_id_fkey DEFERRED). Default behaviour stays immediate.
+-- Idempotent: can be executed multiple times safely.
+
+-- reviews is dropped by 20260429_safe_schema_ai.sql
+DO $$
+BEGIN
+    IF to_regclass('public.reviews') IS NOT NULL AND EXISTS (
+        SELECT 1
+        FROM pg_constraint
+        WHERE conrelid = to_regclass('public.reviews')
+          AND conname = 'reviews_place_id_fkey'
+    ) THEN
+        ALTER TABLE reviews ALTER CONSTRAINT reviews_place_id_fkey DEFERRABLE INITIALLY IMMEDIATE;
+    END IF;
+END $$;
+
+-- Post-migration verification
+
+-- Should return reviews_place_id_fkey | t | f (no rows if reviews does not exist)
+SELECT conname, condeferrable, condeferred
+FROM pg_constraint
+WHERE conname = 'reviews_place_id_fkey';
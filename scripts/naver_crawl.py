@@ -1,11 +1,17 @@
 import argparse
 import asyncio
-import json
 import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import aclosing
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AbstractSet, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+# .env의 KEY=VALUE 한 줄 (주석/빈 줄/"=" 없는 줄은 매칭되지 않음)
+_DOTENV_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_]\w*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
+
 
 def _load_dotenv_fallback() -> None:
     """python-dotenv 없이도 .env를 읽어서 os.environ에 주입."""
@@ -14,17 +20,12 @@ def _load_dotenv_fallback() -> None:
     if not env_path.exists():
         return
     try:
-        for raw_line in env_path.read_text(encoding="utf-8").splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            k, v = line.split("=", 1)
-            k = k.strip()
-            v = v.strip().strip('"').strip("'")
-            if k and k not in os.environ:
-                os.environ[k] = v
+        pairs = _DOTENV_LINE_RE.findall(env_path.read_text(encoding="utf-8"))
     except Exception:
         return
+    os.environ.update(
+        {k: v.strip('"').strip("'") for k, v in pairs if k not in os.environ}
+    )
 
 
 # .env 파일 로드 (python-dotenv 사용, 없으면 fallback)
@@ -40,17 +41,19 @@ try:
 except Exception:
     _load_dotenv_fallback()
 
+import httpx
+import orjson
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright.async_api import async_playwright
 
 # backend 폴더 내부에서 실행되므로 상대 경로로 import
-import sys
-from pathlib import Path
 BACKEND_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(BACKEND_ROOT))
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
 
 # S3 업로드 (선택적)
 try:
-    from utils.s3_storage import S3StorageManager
+    from utils.s3_storage import get_s3_manager, is_fatal_s3_error
     S3_AVAILABLE = True
 except ImportError:
     S3_AVAILABLE = False
@@ -67,84 +70,223 @@ except Exception:
     datetime = None
     DB_AVAILABLE = False
 
+# S3 원본 업로드 동시 실행 수 (요청당 HTTPS 왕복이 대부분인 I/O 작업)
+S3_UPLOAD_WORKERS = 16
+
 # 타임아웃 상수 (ms)
 TIMEOUT = 20000
+# 스크롤 후 새 결과가 붙기를 기다리는 최대 시간 (ms). 넘기면 더 로드할 결과가 없다고 보고 스크롤을 멈춘다.
+SCROLL_WAIT_TIMEOUT = 2500
+
+# 장소 URL/링크의 place_id
+_PLACE_ID_RE = re.compile(r"/place/(\d+)")
+
+# 텍스트/JSON만 읽으므로 받지 않는 리소스 타입.
+# stylesheet는 검색 결과 스크롤 컨테이너(overflow)와 무한 스크롤 로딩이 CSS에 의존해 막지 않는다.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+# 서드파티/네이버 통계 비콘
+_BLOCKED_URL_RE = re.compile(r"(google-analytics|googletagmanager|doubleclick|criteo|wcs\.naver|nstat)")
+
+
+# 브라우저 실행 옵션 (headless는 인스턴스별로 덮어씀)
+_LAUNCH_OPTIONS = {
+    "args": [
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-blink-features=AutomationControlled",
+        "--disable-features=IsolateOrigins,site-per-process",
+        "--disable-web-security",
+        "--disable-site-isolation-trials",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-gpu",
+        "--disable-extensions",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--disable-translate",
+        "--hide-scrollbars",
+        "--metrics-recording-only",
+        "--mute-audio",
+        "--safebrowsing-disable-auto-update",
+        "--ignore-certificate-errors",
+        "--ignore-ssl-errors",
+        "--ignore-certificate-errors-spki-list",
+        "--disable-setuid-sandbox",
+        "--window-size=1920,1080",
+        "--start-maximized",
+    ],
+}
+
+# 브라우저 컨텍스트 옵션
+_CONTEXT_OPTIONS = {
+    "viewport": {"width": 1920, "height": 1080},
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "locale": "ko-KR",
+    "timezone_id": "Asia/Seoul",
+    "permissions": ["geolocation"],
+    "geolocation": {"latitude": 37.5665, "longitude": 126.9780},
+    "color_scheme": "light",
+    "device_scale_factor": 1,
+    "is_mobile": False,
+    "has_touch": False,
+    "extra_http_headers": {
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Cache-Control": "max-age=0",
+        "Sec-Ch-Ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+        "Sec-Ch-Ua-Mobile": "?0",
+        "Sec-Ch-Ua-Platform": '"Windows"',
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-User": "?1",
+        "Sec-Fetch-Dest": "document",
+        "Upgrade-Insecure-Requests": "1",
+    },
+}
+
+# 검색 결과 페이지의 Apollo 캐시를 JSON 문자열 그대로 가져오는 스크립트
+_APOLLO_STATE_JSON_JS = "() => JSON.stringify(window.__APOLLO_STATE__ || null)"
+_APOLLO_PLACE_KEY_PREFIXES = ("RestaurantListSummary:", "Place:")
+_LEADING_INT_RE = re.compile(r"\s*[+-]?\d+")
+
+
+def _parse_count(value) -> int:
+    """"1,234"/"999+" 같은 리뷰 수 표기를 정수로 (JS parseInt와 같이 앞쪽 숫자만, 실패 시 0)."""
+    match = _LEADING_INT_RE.match(str(value).replace(",", ""))
+    return int(match.group()) if match else 0
+
+
+def _parse_coord(value) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_apollo_state(raw_json: Optional[str]) -> List[Dict]:
+    """__APOLLO_STATE__ JSON 문자열에서 장소 목록 추출 (RestaurantListSummary:/Place: 항목)."""
+    if not raw_json:
+        return []
+    apollo = orjson.loads(raw_json)
+    if not isinstance(apollo, dict):
+        return []
+
+    places = []
+    for key, data in apollo.items():
+        if not key.startswith(_APOLLO_PLACE_KEY_PREFIXES):
+            continue
+        if not isinstance(data, dict) or not data.get("name") or not data.get("id"):
+            continue
+        # 방문자 리뷰 수(visitorReviewCount 또는 visitorReviewsTotal)를 우선 사용하고,
+        # 없으면 totalReviewCount(방문자+블로그 등 합계)를 사용
+        visitor = data.get("visitorReviewCount") or data.get("visitorReviewsTotal")
+        total = data.get("totalReviewCount")
+        review_count = _parse_count(visitor) if visitor else _parse_count(total) if total else 0
+
+        places.append({
+            "place_id": data["id"],
+            "name": data["name"],
+            "category": data.get("category") or data.get("businessCategory") or "",
+            "address": data.get("roadAddress") or data.get("address") or None,
+            "latitude": _parse_coord(data.get("y")),
+            "longitude": _parse_coord(data.get("x")),
+            "review_count": review_count,
+            "image_url": (
+                data.get("imageUrl") or data.get("thumbnailUrl") or data.get("thumUrl")
+                or data.get("mainPhotoUrl") or None
+            ),
+            "ai_summary": (
+                data.get("aiSummary") or data.get("summary") or data.get("oneLineSummary")
+                or data.get("oneSentenceSummary") or data.get("oneSentenceIntro")
+                or data.get("microReview") or None
+            ),
+        })
+    return places
+
+
+async def _log_public_ip() -> None:
+    """--debug-ip: 크롤러가 나가는 외부 IP를 stderr에 출력 (실패해도 크롤링은 계속)."""
+    try:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            resp = await client.get("https://httpbin.org/ip")
+        print(f"외부 IP: {resp.json().get('origin')}", file=sys.stderr)
+    except Exception as e:
+        print(f"외부 IP 확인 실패: {str(e)}", file=sys.stderr)
+
+
+async def _block_non_essential(route) -> None:
+    """이미지/폰트/미디어와 트래킹 요청은 중단하고 나머지는 통과."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _BLOCKED_URL_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 class NaverMapPlaceCrawler:
-    def __init__(self, headless: bool = True, verbose: bool = True, enrich_images: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        verbose: bool = True,
+        enrich_images: bool = True,
+        debug_ip: bool = False,
+    ):
         self.headless = headless
+        self.debug_ip = debug_ip
         self.verbose = verbose
         self.enrich_images = enrich_images
-        self.launch_options = self._get_launch_options()
+        self.launch_options = {**_LAUNCH_OPTIONS, "headless": headless}
         # 상세 페이지 보강(주소/이미지) 동시성 제한 (너무 크게 하면 차단/느려짐)
         self.detail_concurrency = 5
-
-    def _get_launch_options(self) -> dict:
-        """브라우저 실행 옵션 반환"""
-        
-        return {
-            "headless": self.headless,
-            "args": [
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-features=IsolateOrigins,site-per-process",
-                "--disable-web-security",
-                "--disable-site-isolation-trials",
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--disable-gpu",
-                "--disable-extensions",
-                "--disable-default-apps",
-                "--disable-sync",
-                "--disable-translate",
-                "--hide-scrollbars",
-                "--metrics-recording-only",
-                "--mute-audio",
-                "--safebrowsing-disable-auto-update",
-                "--ignore-certificate-errors",
-                "--ignore-ssl-errors",
-                "--ignore-certificate-errors-spki-list",
-                "--disable-setuid-sandbox",
-                "--window-size=1920,1080",
-                "--start-maximized",
-            ],
-        }
-
-    def _get_context_options(self) -> dict:
-        """브라우저 컨텍스트 옵션 반환"""
-        return {
-            "viewport": {"width": 1920, "height": 1080},
-            "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            "locale": "ko-KR",
-            "timezone_id": "Asia/Seoul",
-            "permissions": ["geolocation"],
-            "geolocation": {"latitude": 37.5665, "longitude": 126.9780},
-            "color_scheme": "light",
-            "device_scale_factor": 1,
-            "is_mobile": False,
-            "has_touch": False,
-            "extra_http_headers": {
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Cache-Control": "max-age=0",
-                "Sec-Ch-Ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-                "Sec-Ch-Ua-Mobile": "?0",
-                "Sec-Ch-Ua-Platform": '"Windows"',
-                "Sec-Fetch-Site": "none",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-User": "?1",
-                "Sec-Fetch-Dest": "document",
-                "Upgrade-Insecure-Requests": "1",
-            },
-        }
+        # 이미지 보강/fallback 추출이 함께 쓰는 상세 페이지 동시 열기 제한
+        self._detail_sem = asyncio.Semaphore(self.detail_concurrency)
+        # 동시에 진행하는 검색(탭) 수 제한 (CLI에서 --query 여러 개를 함께 돌릴 때)
+        self.search_concurrency = os.cpu_count() or 4
+        self._search_sem = asyncio.Semaphore(self.search_concurrency)
+        # start()로 띄워 여러 검색에서 재사용하는 Playwright/브라우저/컨텍스트
+        self._playwright = None
+        self._browser = None
+        self._context = None
+
+    async def start(self) -> None:
+        """브라우저와 컨텍스트를 한 번 띄운다. 이후 검색마다 새 탭만 연다."""
+        if self._context is not None:
+            return
+        self._playwright = await async_playwright().start()
+        if self.debug_ip:
+            # 외부 IP 확인은 브라우저 기동과 동시에 한 번만 (검색마다 거치지 않음)
+            self._browser, _ = await asyncio.gather(
+                self._playwright.chromium.launch(**self.launch_options),
+                _log_public_ip(),
+            )
+        else:
+            self._browser = await self._playwright.chromium.launch(**self.launch_options)
+        self._context = await self._browser.new_context(**_CONTEXT_OPTIONS)
+        # context에 걸어 _extract_address_info가 여는 상세 페이지에도 적용
+        await self._context.route("**/*", _block_non_essential)
+
+    async def close(self) -> None:
+        """start()로 띄운 브라우저 종료."""
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = self._browser = self._context = None
+
+    async def __aenter__(self) -> "NaverMapPlaceCrawler":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
     async def _perform_search(self, page, search_query: str):
         """검색 수행"""
-        await page.goto("https://httpbin.org/ip")
-        await page.goto("https://map.naver.com/", wait_until="domcontentloaded")
+        # 검색창 selector 대기가 실제 준비 신호이므로 내비게이션 커밋까지만 기다린다
+        await page.goto("https://map.naver.com/", wait_until="commit")
 
         search_input = await page.wait_for_selector(
             "input.input_search", state="visible", timeout=TIMEOUT
@@ -196,25 +338,10 @@ class NaverMapPlaceCrawler:
 
     async def _scroll_to_load_all(self, frame):
         """모든 결과가 로드될 때까지 스크롤"""
-        previous_count = 0
-        no_change_count = 0
-        max_no_change = 3
-
         while True:
             current_places = await frame.query_selector_all("li.UEzoS")
             current_count = len(current_places)
 
-            if current_count == previous_count:
-                no_change_count += 1
-                if no_change_count >= max_no_change:
-                    if self.verbose:
-                        print("더 이상 로드할 데이터가 없습니다.", file=sys.stderr)
-                    break
-            else:
-                no_change_count = 0
-
-            previous_count = current_count
-
             await frame.evaluate(
                 """
                 () => {
@@ -231,29 +358,52 @@ class NaverMapPlaceCrawler:
             """
             )
 
-            await asyncio.sleep(2)
-
-    async def _extract_basic_info(self, place):
-        """장소 기본 정보 추출"""
-        name_elem = await place.query_selector("span.TYaxT")
-        name = await name_elem.inner_text() if name_elem else "이름 없음"
-
-        category_elem = await place.query_selector("span.KCMnt")
-        category = await category_elem.inner_text() if category_elem else ""
+            # 고정 2초 대기 대신 결과 개수가 늘어나는 즉시 다음 스크롤로 진행.
+            # 대기 자체가 이미 "변화 없음" 판정이므로 한 번 타임아웃되면 바로 끝낸다.
+            try:
+                await frame.wait_for_function(
+                    "prev => document.querySelectorAll('li.UEzoS').length > prev",
+                    arg=current_count,
+                    timeout=SCROLL_WAIT_TIMEOUT,
+                )
+            except PlaywrightTimeoutError:
+                if self.verbose:
+                    print("더 이상 로드할 데이터가 없습니다.", file=sys.stderr)
+                break
 
-        return name, category
+    async def _extract_basic_infos(self, frame) -> list[dict]:
+        """리스트의 모든 장소 {name, category, href}를 evaluate 한 번으로 추출 (요소별 CDP 왕복 제거)."""
+        return await frame.evaluate(
+            """
+            () => Array.from(document.querySelectorAll('li.UEzoS')).map((li) => ({
+                name: li.querySelector('span.TYaxT')?.innerText || '이름 없음',
+                category: li.querySelector('span.KCMnt')?.innerText || '',
+                href: li.querySelector('a.place_bluelink')?.href || null,
+            }))
+            """
+        )
 
     async def _extract_place_id(self, place, page):
-        """place_id 추출"""
+        """place_id 추출 (링크 href에 있으면 클릭 없이 사용)"""
         link_elem = await place.query_selector("a.place_bluelink")
         if not link_elem:
             return None
 
+        href = await link_elem.get_attribute("href") or ""
+        match = _PLACE_ID_RE.search(href)
+        if match:
+            return match.group(1)
+
+        # href에 id가 없으면 클릭해 메인 페이지 URL(상세 패널)에서 읽는다.
+        # 검색 결과 iframe은 그대로 남으므로 뒤로 가기 없이 다음 장소를 클릭할 수 있다.
+        previous_url = page.url
         await link_elem.click()
-        await page.wait_for_url(lambda url: "/place/" in url, timeout=TIMEOUT)
+        await page.wait_for_url(
+            lambda url: "/place/" in url and url != previous_url, timeout=TIMEOUT
+        )
 
         new_url = page.url
-        match = re.search(r"/place/(\d+)", new_url)
+        match = _PLACE_ID_RE.search(new_url)
         return match.group(1) if match else None
 
     async def _extract_address_info(self, place_id: str, context):
@@ -270,7 +420,14 @@ class NaverMapPlaceCrawler:
 
         try:
             await detail_page.goto(place_detail_url, wait_until="domcontentloaded")
-            await detail_page.wait_for_timeout(2000)  # 페이지 로딩 대기
+            # 고정 2초 대기 대신 __NEXT_DATA__에 장소 정보가 생기는 즉시 진행 (없으면 아래 DOM fallback)
+            try:
+                await detail_page.wait_for_function(
+                    "() => window.__NEXT_DATA__ && window.__NEXT_DATA__.props?.pageProps?.initialState?.place",
+                    timeout=3000,
+                )
+            except PlaywrightTimeoutError:
+                pass
 
             # 먼저 __NEXT_DATA__에서 데이터 추출 시도 (가장 안정적)
             data = await detail_page.evaluate(
@@ -353,19 +510,16 @@ class NaverMapPlaceCrawler:
             # __NEXT_DATA__에서 못 찾았으면 DOM에서 시도 (fallback)
             if not origin_address or not road_address:
                 try:
-                    # 타임아웃을 짧게 설정 (5초)
-                    await detail_page.wait_for_selector("span.LDgIH", timeout=5000, state="visible")
-                    address_elems = await detail_page.query_selector_all("span.LDgIH")
-                    if address_elems:
-                        text_values = []
-                        for elem in address_elems:
-                            text = await elem.inner_text()
-                            if text:
-                                text_values.append(text)
-                        if text_values:
-                            origin_address = origin_address or text_values[0]
-                            if len(text_values) > 1:
-                                road_address = road_address or text_values[1]
+                    # 위에서 이미 로딩을 기다렸으므로 타임아웃을 짧게 설정 (2초)
+                    await detail_page.wait_for_selector("span.LDgIH", timeout=2000, state="visible")
+                    # 요소별 inner_text 대신 한 번의 호출로 전체 텍스트 수집
+                    text_values = [
+                        t for t in await detail_page.locator("span.LDgIH").all_inner_texts() if t
+                    ]
+                    if text_values:
+                        origin_address = origin_address or text_values[0]
+                        if len(text_values) > 1:
+                            road_address = road_address or text_values[1]
                 except Exception:
                     # 여러 셀렉터 시도
                     selectors = ["span.LDgIH", ".LDgIH", "[class*='address']", "[class*='LDgIH']"]
@@ -460,133 +614,46 @@ class NaverMapPlaceCrawler:
             "ai_summary": ai_summary,
         }
 
-    async def _enrich_image_urls_with_details(self, apollo_items: list[dict], context) -> list[dict]:
-        """image_url이 없는 항목만 상세페이지로 보강(동시성 제한)."""
-        if not apollo_items:
-            return apollo_items
-
-        sem = asyncio.Semaphore(self.detail_concurrency)
+    async def _fetch_detail_bounded(self, place_id: str, context) -> dict:
+        """상세 페이지 추출을 동시성 제한(detail_concurrency) 안에서 실행."""
+        async with self._detail_sem:
+            return await self._extract_address_info(place_id, context)
 
-        async def enrich_one(item: dict) -> dict:
-            place_id = item.get("place_id")
-            if not place_id or (item.get("image_url") and item.get("ai_summary")):
-                return item
-            async with sem:
-                try:
-                    detail = await self._extract_address_info(str(place_id), context)
-                    item["image_url"] = detail.get("image_url") or item.get("image_url")
-                    item["ai_summary"] = detail.get("ai_summary") or item.get("ai_summary")
-                except Exception:
-                    pass
-            return item
+    @staticmethod
+    def _needs_detail(item: dict) -> bool:
+        return bool(item.get("place_id")) and (not item.get("image_url") or not item.get("ai_summary"))
 
-        # 상세페이지 보강은 비용이 크므로 필요한 항목만 병렬 실행
-        tasks = [
-            enrich_one(d)
-            for d in apollo_items
-            if d.get("place_id") and (not d.get("image_url") or not d.get("ai_summary"))
-        ]
-        if not tasks:
-            return apollo_items
-        await asyncio.gather(*tasks)
-        return apollo_items
+    async def _enrich_with_details(self, item: dict, context) -> dict:
+        """image_url/ai_summary가 빈 항목을 상세페이지로 보강 (동시성 제한, 실패 시 그대로)."""
+        try:
+            detail = await self._fetch_detail_bounded(str(item["place_id"]), context)
+            item["image_url"] = detail.get("image_url") or item.get("image_url")
+            item["ai_summary"] = detail.get("ai_summary") or item.get("ai_summary")
+        except Exception:
+            pass
+        return item
 
-    async def _extract_place_data(self, places, frame, page, context, page_num: int = 1):
-        """장소 데이터 추출 (__APOLLO_STATE__ 우선 사용)"""
-        results = []
+    async def _iter_place_data(
+        self, places, frame, page, context, page_num: int = 1
+    ) -> AsyncIterator[Dict]:
+        """장소 데이터 추출 (__APOLLO_STATE__ 우선 사용).
 
+        상세 페이지 조회는 앞쪽 몇 개씩 미리 병렬로 돌리되, 결과는 검색 순위(목록) 순서대로 내보낸다
+        (호출 측이 limit에서 끊어도 상위 N개가 남도록).
+        """
         # 먼저 iframe 내부의 __APOLLO_STATE__에서 데이터 추출 시도
+        # (브라우저에서는 JSON 문자열만 받아오고 항목 순회/필드 매핑은 _parse_apollo_state에서)
         apollo_data = None
         if frame:
             try:
-                apollo_data = await frame.evaluate("""
-                    () => {
-                        if (window.__APOLLO_STATE__) {
-                            const apollo = window.__APOLLO_STATE__;
-                            const places = [];
-                            for (const key in apollo) {
-                                if (key.startsWith('RestaurantListSummary:') || key.startsWith('Place:')) {
-                                    const data = apollo[key];
-                                    if (data && data.name && data.id) {
-                                        // 방문자 리뷰 수(visitorReviewCount 또는 visitorReviewsTotal)를 우선 사용하고,
-                                        // 없으면 totalReviewCount(방문자+블로그 등 합계)를 사용
-                                        let reviewCount = 0;
-                                        const visitor = data.visitorReviewCount || data.visitorReviewsTotal;
-                                        const total = data.totalReviewCount;
-                                        if (visitor) {
-                                            const countStr = String(visitor).replace(/,/g, '');
-                                            reviewCount = parseInt(countStr) || 0;
-                                        } else if (total) {
-                                            const countStr = String(total).replace(/,/g, '');
-                                            reviewCount = parseInt(countStr) || 0;
-                                        }
-                                        
-                                        places.push({
-                                            place_id: data.id,
-                                            name: data.name,
-                                            category: data.category || data.businessCategory || '',
-                                            address: data.roadAddress || data.address || null,
-                                            latitude: data.y ? parseFloat(data.y) : null,
-                                            longitude: data.x ? parseFloat(data.x) : null,
-                                            review_count: reviewCount,
-                                            image_url: data.imageUrl || data.thumbnailUrl || data.thumUrl || data.mainPhotoUrl || null,
-                                            ai_summary: data.aiSummary || data.summary || data.oneLineSummary || data.oneSentenceSummary || data.oneSentenceIntro || data.microReview || null,
-                                        });
-                                    }
-                                }
-                            }
-                            return places;
-                        }
-                        return null;
-                    }
-                """)
+                apollo_data = _parse_apollo_state(await frame.evaluate(_APOLLO_STATE_JSON_JS))
             except Exception as e:
                 if self.verbose:
                     print(f"iframe에서 __APOLLO_STATE__ 추출 실패: {str(e)}", file=sys.stderr)
 
         # iframe에서 못 찾았으면 메인 페이지에서 시도
         if not apollo_data:
-            apollo_data = await page.evaluate("""
-            () => {
-                if (window.__APOLLO_STATE__) {
-                    const apollo = window.__APOLLO_STATE__;
-                    const places = [];
-                    for (const key in apollo) {
-                        if (key.startsWith('RestaurantListSummary:') || key.startsWith('Place:')) {
-                            const data = apollo[key];
-                            if (data && data.name && data.id) {
-                                // 방문자 리뷰 수(visitorReviewCount 또는 visitorReviewsTotal)를 우선 사용하고,
-                                // 없으면 totalReviewCount(방문자+블로그 등 합계)를 사용
-                                let reviewCount = 0;
-                                const visitor = data.visitorReviewCount || data.visitorReviewsTotal;
-                                const total = data.totalReviewCount;
-                                if (visitor) {
-                                    const countStr = String(visitor).replace(/,/g, '');
-                                    reviewCount = parseInt(countStr) || 0;
-                                } else if (total) {
-                                    const countStr = String(total).replace(/,/g, '');
-                                    reviewCount = parseInt(countStr) || 0;
-                                }
-                                
-                                places.push({
-                                    place_id: data.id,
-                                    name: data.name,
-                                    category: data.category || data.businessCategory || '',
-                                    address: data.roadAddress || data.address || null,
-                                    latitude: data.y ? parseFloat(data.y) : null,
-                                    longitude: data.x ? parseFloat(data.x) : null,
-                                    review_count: reviewCount,
-                                    image_url: data.imageUrl || data.thumbnailUrl || data.thumUrl || data.mainPhotoUrl || null,
-                                    ai_summary: data.aiSummary || data.summary || data.oneLineSummary || data.oneSentenceSummary || data.oneSentenceIntro || data.microReview || null,
-                                });
-                            }
-                        }
-                    }
-                    return places;
-                }
-                return null;
-            }
-        """)
+            apollo_data = _parse_apollo_state(await page.evaluate(_APOLLO_STATE_JSON_JS))
 
         if apollo_data and len(apollo_data) > 0:
             # __APOLLO_STATE__에서 데이터를 가져왔으면 바로 사용
@@ -614,100 +681,147 @@ class NaverMapPlaceCrawler:
                     "ai_summary": data.get("ai_summary"),
                 })
 
-            # 2) 그래도 없는 항목만 상세페이지로 보강 (동시성 제한 병렬)
-            if self.enrich_images:
-                await self._enrich_image_urls_with_details(normalized, context)
-            return normalized
+            # 2) 그래도 없는 항목만 상세페이지로 보강 (동시성 제한 병렬, 목록 순서대로 내보냄)
+            async def as_is(item: Dict) -> Dict:
+                return item
+
+            jobs = [
+                (lambda item=item: self._enrich_with_details(item, context))
+                if self.enrich_images and self._needs_detail(item)
+                else (lambda item=item: as_is(item))
+                for item in normalized
+            ]
+            async for item in _in_order(jobs, lookahead=self.detail_concurrency * 2):
+                yield item
+            return
 
         # __APOLLO_STATE__가 없으면 기존 방식 사용 (fallback)
         if self.verbose:
             print("__APOLLO_STATE__ 없음, 기존 방식으로 추출", file=sys.stderr)
 
-        for place in places:
-            name, category = await self._extract_basic_info(place)
-            place_id = await self._extract_place_id(place, page)
-
-            address_info = {}
-            if place_id:
-                address_info = await self._extract_address_info(place_id, context)
+        # 1) 리스트 페이지에서 기본 정보/place_id를 순서대로 수집.
+        #    이름/카테고리/링크는 한 번에 읽고, 링크에 id가 없는 장소만 클릭해서 얻는다 (뒤로 가기 없음).
+        basics = []
+        for place, info in zip(places, await self._extract_basic_infos(frame)):
+            match = _PLACE_ID_RE.search(info.get("href") or "")
+            place_id = match.group(1) if match else await self._extract_place_id(place, page)
+            basics.append((info["name"], info["category"], place_id))
+
+        # 2) 상세 페이지는 같은 context의 새 탭에서 동시성 제한 병렬로 조회 (목록 순서대로 내보냄)
+        async def fetch_detail(name: str, category: str, place_id: Optional[str]) -> Dict:
+            address_info = await self._fetch_detail_bounded(place_id, context) if place_id else {}
+            return {
+                "place_id": place_id,
+                "name": name,
+                "category": category,
+                "page": page_num,
+                "origin_address": address_info.get("origin_address"),
+                "address": address_info.get("address"),
+                "latitude": address_info.get("latitude"),
+                "longitude": address_info.get("longitude"),
+                "image_url": address_info.get("image_url"),
+                "ai_summary": address_info.get("ai_summary"),
+            }
 
-            results.append(
-                {
-                    "place_id": place_id,
-                    "name": name,
-                    "category": category,
-                    "page": page_num,
-                    "origin_address": address_info.get("origin_address"),
-                    "address": address_info.get("address"),
-                    "latitude": address_info.get("latitude"),
-                    "longitude": address_info.get("longitude"),
-                    "image_url": address_info.get("image_url"),
-                    "ai_summary": address_info.get("ai_summary"),
-                }
+        jobs = [lambda basic=basic: fetch_detail(*basic) for basic in basics]
+        async for item in _in_order(jobs, lookahead=self.detail_concurrency * 2):
+            yield item
+
+    async def iter_single_page(self, search_query: str) -> AsyncIterator[Dict]:
+        """특정 페이지 하나를 크롤링하며 장소를 추출되는 대로 내보냄.
+
+        start()(또는 async with)로 브라우저를 띄워 두었으면 새 탭만 열어 재사용하고,
+        아니면 이 호출 동안만 브라우저를 띄웠다가 닫는다.
+        여러 검색을 동시에 돌려도 search_concurrency개 탭까지만 연다.
+        중간에 그만 읽을 때는 contextlib.aclosing으로 감싸야 탭/브라우저가 바로 정리된다.
+        """
+        async with self._search_sem, aclosing(self._iter_search(search_query)) as items:
+            async for item in items:
+                yield item
+
+    async def _iter_search(self, search_query: str) -> AsyncIterator[Dict]:
+        owns_browser = self._context is None
+        if owns_browser:
+            await self.start()
+        context = self._context
+        page = await context.new_page()
+
+        count = 0
+        try:
+            # 검색 수행
+            await self._perform_search(page, search_query)
+
+            # iframe 가져오기
+            frame = await self._get_search_frame(page)
+            if not frame:
+                return
+
+            # 모든 결과 로드
+            await self._scroll_to_load_all(frame)
+            await frame.wait_for_selector(
+                "li.UEzoS", state="visible", timeout=TIMEOUT
             )
 
-            await page.go_back()
+            # 데이터 추출
+            places = await frame.query_selector_all("li.UEzoS")
+            async with aclosing(
+                self._iter_place_data(places, frame, page, context, page_num=1)
+            ) as items:
+                async for item in items:
+                    count += 1
+                    yield item
 
-        return results
-
-    async def crawl_single_page(self, search_query: str) -> List[Dict]:
-        """특정 페이지 하나만 크롤링"""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(**self.launch_options)
-            context = await browser.new_context(**self._get_context_options())
-            page = await context.new_page()
-
-            await page.route(
-                "**/*.{png,jpg,jpeg,gif,svg,webp}", lambda route: route.abort()
-            )
+            if self.verbose:
+                print(f"{count}개 수집", file=sys.stderr)
 
-            results = []
+        except Exception as e:
+            print(f"크롤링 중 오류: {str(e)}", file=sys.stderr)
+        finally:
+            await page.close()
+            if owns_browser:
+                await self.close()
 
-            try:
-                # 검색 수행
-                await self._perform_search(page, search_query)
-
-                # iframe 가져오기
-                frame = await self._get_search_frame(page)
-                if not frame:
-                    return results
-
-                # 모든 결과 로드
-                await self._scroll_to_load_all(frame)
-                await frame.wait_for_selector(
-                    "li.UEzoS", state="visible", timeout=TIMEOUT
-                )
+    async def crawl_single_page(self, search_query: str) -> List[Dict]:
+        """특정 페이지 하나만 크롤링해 리스트로 반환."""
+        return [item async for item in self.iter_single_page(search_query)]
 
-                # 데이터 추출
-                places = await frame.query_selector_all("li.UEzoS")
-                results = await self._extract_place_data(
-                    places, frame, page, context, page_num=1
-                )
 
-                if self.verbose:
-                    print(f"{len(places)}개 수집", file=sys.stderr)
+async def _in_order(jobs: List[Callable[[], Awaitable]], lookahead: int) -> AsyncIterator:
+    """작업 결과를 목록 순서대로 내보낸다.
 
-            except Exception as e:
-                if self.verbose:
-                    print(f"크롤링 중 오류: {str(e)}", file=sys.stderr)
-                else:
-                    print(f"크롤링 중 오류: {str(e)}", file=sys.stderr)
-            finally:
-                await browser.close()
-
-            return results
+    최대 lookahead개까지 미리 실행해 두고, 소비자가 중간에 멈추면 남은 태스크를 취소한다.
+    """
+    remaining = iter(jobs)
+    pending: deque = deque()
+    try:
+        for job in remaining:
+            pending.append(asyncio.ensure_future(job()))
+            if len(pending) >= lookahead:
+                break
+        while pending:
+            result = await pending.popleft()
+            next_job = next(remaining, None)
+            if next_job is not None:
+                pending.append(asyncio.ensure_future(next_job()))
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
 
 
 def merge_and_dedupe_results(
-    all_results: List[List[Dict]], existing_place_ids: set
+    all_results: List[List[Dict]], existing_place_ids: AbstractSet[str]
 ) -> List[Dict]:
-    """결과 병합 및 중복 제거"""
-    merged_results = []
-    for page_results in all_results:
-        merged_results.extend(page_results)
-
+    """결과 병합 및 중복 제거 (중간 병합 리스트 없이 한 번에)"""
+    # 기존 id 제외는 항목별 in 검사 대신 집합 차집합 한 번으로
+    new_ids = {
+        item["place_id"] for page_results in all_results for item in page_results
+    } - existing_place_ids
     return [
-        item for item in merged_results if item["place_id"] not in existing_place_ids
+        item
+        for page_results in all_results
+        for item in page_results
+        if item["place_id"] in new_ids
     ]
 
 
@@ -747,16 +861,54 @@ def print_results_summary(results: List[Dict]):
 
 async def crawl_places(query: str, limit: Optional[int] = None, verbose: bool = True) -> List[Dict]:
     """Helper for CLI/API usage."""
-    crawler = NaverMapPlaceCrawler(headless=True, verbose=verbose)
-    results = await crawler.crawl_single_page(query)
+    async with NaverMapPlaceCrawler(headless=True, verbose=verbose) as crawler:
+        results = await crawler.crawl_single_page(query)
     if limit is not None:
         return results[:limit]
     return results
 
 
+async def _crawl_with(
+    crawler: NaverMapPlaceCrawler, queries: List[str], limit: Optional[int], ndjson: bool
+) -> Dict[str, List[Dict]]:
+    """브라우저를 한 번 띄워 검색어들을 동시에 검색하고 종료 (limit은 검색어별).
+
+    ndjson 모드에서는 장소가 나오는 대로 한 줄씩 stdout에 쓰고 보관하지 않는다 (빈 리스트).
+    여러 검색어에서 같은 장소가 나오면 한 번만 쓴다.
+    """
+    written: set = set()
+
+    async def crawl_one(query: str) -> List[Dict]:
+        results: List[Dict] = []
+        count = 0
+        async with aclosing(crawler.iter_single_page(query)) as places:
+            async for place in places:
+                if limit is not None and count >= limit:
+                    break
+                count += 1
+                if not ndjson:
+                    results.append(place)
+                elif place.get("place_id") not in written:
+                    written.add(place.get("place_id"))
+                    sys.stdout.buffer.write(orjson.dumps(place) + b"\n")
+                    sys.stdout.buffer.flush()
+        return results
+
+    async with crawler:
+        async with asyncio.TaskGroup() as tg:
+            tasks = {query: tg.create_task(crawl_one(query)) for query in dict.fromkeys(queries)}
+    return {query: task.result() for query, task in tasks.items()}
+
+
 def run_cli() -> None:
     parser = argparse.ArgumentParser(description="네이버 지도 장소 크롤러")
-    parser.add_argument("--query", required=True, help="검색어 (예: 송도 맛집)")
+    parser.add_argument(
+        "--query",
+        required=True,
+        action="extend",
+        nargs="+",
+        help="검색어 (예: 송도 맛집). 여러 번/여러 개 지정하면 브라우저 하나로 동시에 검색",
+    )
     parser.add_argument("--limit", type=int, default=None, help="결과 최대 개수")
     parser.add_argument(
         "--thumbnail-only",
@@ -768,6 +920,16 @@ def run_cli() -> None:
         action="store_true",
         help="stdout에 JSON 배열 출력 (API 연동용)",
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="stdout에 장소 1건당 JSON 한 줄(NDJSON) 출력 (crawl_runner 스트리밍 연동용)",
+    )
+    parser.add_argument(
+        "--debug-ip",
+        action="store_true",
+        help="브라우저 기동 시 외부 IP를 한 번 확인해 stderr에 출력 (디버그용)",
+    )
     parser.add_argument(
         "--s3-bucket",
         type=str,
@@ -787,15 +949,23 @@ def run_cli() -> None:
         help="AWS Secret Access Key (환경변수 AWS_SECRET_ACCESS_KEY 사용 가능)",
     )
     args = parser.parse_args()
+    # 기계 판독용 출력 모드에서는 stdout에 결과 외 로그를 남기지 않는다.
+    if args.ndjson:
+        args.json_output = True
 
     crawler = NaverMapPlaceCrawler(
         headless=True,
         verbose=not args.json_output,
         enrich_images=not args.thumbnail_only,
+        debug_ip=args.debug_ip,
     )
-    results = asyncio.run(crawler.crawl_single_page(args.query))
-    if args.limit is not None:
-        results = results[: args.limit]
+    results_by_query = asyncio.run(_crawl_with(crawler, args.query, args.limit, args.ndjson))
+    # 여러 검색어 결과는 place_id 기준으로 처음 나온 것만 남겨 합친다
+    merged: Dict = {}
+    for query_results in results_by_query.values():
+        for place in query_results:
+            merged.setdefault(place.get("place_id") or id(place), place)
+    results = list(merged.values())
 
     # JSON 출력 모드(crawl_runner 연동)에서는 사이드 이펙트 없이 결과만 반환.
     # DB/S3 저장은 호출자(crawl_runner) 쪽에서 단일 경로로 처리한다.
@@ -850,25 +1020,40 @@ def run_cli() -> None:
     # S3 업로드 (선택적) - 크롤한 결과 전부 한번에 업로드
     if (not args.json_output) and args.s3_bucket and S3_AVAILABLE and results:
         try:
-            s3_manager = S3StorageManager(
+            s3_manager = get_s3_manager(
                 bucket_name=args.s3_bucket,
                 aws_access_key_id=args.aws_access_key_id or os.getenv("AWS_ACCESS_KEY_ID"),
                 aws_secret_access_key=args.aws_secret_access_key or os.getenv("AWS_SECRET_ACCESS_KEY"),
             )
 
+            # boto3 client는 스레드 안전하므로 하나를 공유하고 업로드만 병렬로 실행
             uploaded_count = 0
-            for place in results:
-                if not place.get("place_id"):
-                    continue
-                try:
-                    s3_manager.upload_place_raw_data(
+            # 날짜 prefix는 배치 전체에서 한 번만 만든다
+            prefix = s3_manager.build_place_prefix()
+            with ThreadPoolExecutor(max_workers=S3_UPLOAD_WORKERS) as pool:
+                futures = {
+                    pool.submit(
+                        s3_manager.upload_place_raw_data,
                         place_id=str(place.get("place_id")),
-                        data=place
-                    )
-                    uploaded_count += 1
-                except Exception as e:
-                    if not args.json_output:
-                        print(f"S3 업로드 실패 (place_id={place.get('place_id')}): {str(e)}", file=sys.stderr)
+                        data=place,
+                        prefix=prefix,
+                    ): place
+                    for place in results
+                    if place.get("place_id")
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        uploaded_count += 1
+                    except Exception as e:
+                        print(
+                            f"S3 업로드 실패 (place_id={futures[future].get('place_id')}): {str(e)}",
+                            file=sys.stderr,
+                        )
+                        if is_fatal_s3_error(e):
+                            # 버킷/권한 오류는 나머지도 똑같이 실패하므로 남은 업로드를 취소
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            break
 
             if not args.json_output:
                 print(f"S3에 {uploaded_count}개 장소 원본 데이터 업로드 완료")
@@ -879,8 +1064,12 @@ def run_cli() -> None:
         if not args.json_output:
             print("S3 업로드를 위해 s3_storage 모듈이 필요합니다.", file=sys.stderr)
 
+    if args.ndjson:
+        # 장소는 _crawl_with에서 나오는 대로 이미 한 줄씩 출력함
+        return
     if args.json_output:
-        print(json.dumps(results, ensure_ascii=False))
+        sys.stdout.buffer.write(orjson.dumps(results) + b"\n")
+        sys.stdout.buffer.flush()
     else:
         print_results_summary(results)
         print(f"\n크롤한 장소 수: {len(results)}개")
@@ -1,13 +1,20 @@
 import argparse
 import asyncio
 import hashlib
+import itertools
 import json
 import logging
 import os
+import re
 import sys
 import time
+from contextlib import AsyncExitStack
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+
+# .env의 KEY=VALUE 한 줄 (주석/빈 줄/"=" 없는 줄은 매칭되지 않음)
+_DOTENV_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_]\w*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
+
 
 def _load_dotenv_fallback() -> None:
     """python-dotenv 없이도 .env를 읽어서 os.environ에 주입."""
@@ -16,17 +23,13 @@ def _load_dotenv_fallback() -> None:
     if not env_path.exists():
         return
     try:
-        for raw_line in env_path.read_text(encoding="utf-8").splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            k, v = line.split("=", 1)
-            k = k.strip()
-            v = v.strip().strip('"').strip("'")
-            if k and k not in os.environ:
-                os.environ[k] = v
+        # 한 번에 bytes로 읽어 정규식 한 번으로 KEY=VALUE 쌍을 뽑는다 (텍스트 모드 줄 단위 순회 없음)
+        pairs = _DOTENV_LINE_RE.findall(env_path.read_bytes().decode("utf-8"))
     except Exception:
         return
+    os.environ.update(
+        {k: v.strip('"').strip("'") for k, v in pairs if k not in os.environ}
+    )
 
 
 # .env 파일 로드 (python-dotenv 사용, 없으면 fallback)
@@ -42,18 +45,19 @@ try:
 except Exception:
     _load_dotenv_fallback()
 
-import aiohttp
-from playwright.async_api import async_playwright
+import orjson
+
+# playwright/aiohttp는 실제로 브라우저를 띄우거나 이미지를 받을 때만 import (CLI 기동/런너 import 비용 절감)
 
 # backend 폴더 내부에서 실행되므로 상대 경로로 import
-import sys
-from pathlib import Path
 BACKEND_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(BACKEND_ROOT))
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
 
 # S3 업로드 (선택적)
+# 이미지 업로드는 aiobotocore가 있으면 이벤트 루프 안에서 비동기로 (없으면 스레드에서 boto3 사용)
 try:
-    from utils.s3_storage import S3StorageManager
+    from utils.s3_storage import AIOBOTOCORE_AVAILABLE, AsyncS3StorageManager, get_s3_manager, is_fatal_s3_error
     S3_AVAILABLE = True
 except ImportError:
     S3_AVAILABLE = False
@@ -63,43 +67,273 @@ logger = logging.getLogger(__name__)
 
 # 타임아웃 상수 (ms)
 TIMEOUT = 10000
+# 더보기/스크롤 후 새 리뷰가 붙기를 기다리는 최대 시간 (ms). 넘기면 "변화 없음"으로 본다.
+LOAD_MORE_TIMEOUT = 3000
+
+_REVIEW_ITEM_SELECTOR = "ul#_review_list > li.EjjAW"
+# 현재 로드된 리뷰 개수 / 개수가 prev보다 늘었는지
+_REVIEW_COUNT_JS = f"() => document.querySelectorAll('{_REVIEW_ITEM_SELECTOR}').length"
+_REVIEW_COUNT_GREW_JS = f"(prev) => document.querySelectorAll('{_REVIEW_ITEM_SELECTOR}').length > prev"
+# 리뷰 이미지 다운로드 시 동시에 여는 커넥션 수
+IMAGE_DOWNLOAD_CONNECTIONS = 32
+# 다운로드+S3 업로드를 동시에 진행하는 이미지 수 (메모리/S3 동시 요청 제한)
+IMAGE_UPLOAD_CONCURRENCY = 16
+
+# 리뷰 텍스트/Apollo 상태만 읽으므로 받지 않는 리소스 타입
+# (리뷰 목록은 문서 자체 스크롤이라 naver_crawl과 달리 stylesheet도 막는다)
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+# 서드파티/네이버 통계 비콘
+_BLOCKED_URL_RE = re.compile(r"(google-analytics|googletagmanager|doubleclick|criteo|wcs\.naver|nstat)")
+
+# __APOLLO_STATE__에서 방문자 리뷰를 뽑는 함수 (인자: { skip, stop } 리뷰 id 배열)
+_APOLLO_REVIEWS_JS = """
+({ skip, stop }) => {
+    if (window.__APOLLO_STATE__) {
+        const apollo = window.__APOLLO_STATE__;
+        const skipIds = new Set(skip);
+        const stopIds = new Set(stop);
+        const reviews = [];
+        let hitExisting = false;
+        // HTML 태그 제거용 정규식은 한 번만 만들고, 태그가 없는 리뷰는 replace 자체를 건너뜀
+        const STRIP_TAGS = /<[^>]*>/g;
+        const stripTags = (raw) => (raw.indexOf('<') < 0 ? raw : raw.replace(STRIP_TAGS, ''));
+
+        // VisitorReviews 키에서 리뷰 추출 (이미 수집한 리뷰는 직렬화하지 않음)
+        for (const key in apollo) {
+            if (key.startsWith('VisitorReviews:')) {
+                const data = apollo[key];
+                if (data && (data.review || data.reviewId)) {
+                    const reviewId = data.reviewId || key.split(':')[1];
+                    // 이미 저장된 리뷰부터는 옛 리뷰이므로 여기서 중단
+                    if (stopIds.has(String(reviewId))) {
+                        hitExisting = true;
+                        break;
+                    }
+                    if (skipIds.has(String(reviewId))) {
+                        continue;
+                    }
+                    reviews.push({
+                        review_id: reviewId,
+                        review: data.review || '',
+                        // HTML 태그 제거 (필요시)
+                        review_text: data.review ? stripTags(data.review) : '',
+                    });
+                }
+            }
+        }
+
+        // VisitorImages에서 추가 정보 추출 (작성자, 이미지 등)
+        const imagesMap = {};
+        for (const key in apollo) {
+            if (key.startsWith('VisitorImages:')) {
+                const imgData = apollo[key];
+                if (imgData && imgData.reviewId) {
+                    imagesMap[imgData.reviewId] = {
+                        nickname: imgData.nickname || '',
+                        image_url: imgData.imageUrl || null,
+                        profile_image_url: imgData.profileImageUrl || null,
+                    };
+                }
+            }
+        }
+
+        // 리뷰와 이미지 정보 병합
+        reviews.forEach(review => {
+            const imgInfo = imagesMap[review.review_id];
+            if (imgInfo) {
+                review.author = imgInfo.nickname;
+                review.image_url = imgInfo.image_url;
+                review.profile_image_url = imgInfo.profile_image_url;
+            }
+        });
+
+        return { reviews, hitExisting };
+    }
+    return null;
+}
+"""
+
+# JSONL 한 줄에서 "id"(없으면 "review_id") 문자열 값을 찾는 정규식 (append가 id를 먼저 씀)
+_REVIEW_ID_RE = re.compile(rb'"(?:review_)?id"\s*:\s*"([^"]+)"')
+_REVIEW_PLACE_ID_RE = re.compile(rb'"place_id"\s*:\s*"([^"]+)"')
+
+# 리뷰 목록 DOM에서 (작성자, 내용, 방문날짜)를 한 번에 읽는 스크립트 (요소가 없으면 기존 기본값)
+_DOM_REVIEWS_JS = """
+() => Array.from(document.querySelectorAll('ul#_review_list > li.EjjAW')).map((li) => ({
+    author: li.querySelector('span.pui__NMi-Dp')?.innerText ?? '익명',
+    content: li.querySelector('div.pui__vn15t2 > a')?.innerText ?? '',
+    visit_date: li.querySelector('time')?.innerText ?? '',
+}))
+"""
+
+# 더보기 클릭(없으면 스크롤) → 새 리뷰가 붙을 때까지 대기를 목표 개수/변화 없음 한도까지 반복.
+# 최종 로드된 리뷰 개수를 돌려준다.
+_LOAD_ALL_REVIEWS_JS = """
+async ({ target, maxIterations, maxNoChange, waitMs }) => {
+    const count = () => document.querySelectorAll('%(item)s').length;
+    const waitForGrowth = (prev) => new Promise((resolve) => {
+        if (count() > prev) {
+            resolve(true);
+            return;
+        }
+        let timer = null;
+        const observer = new MutationObserver(() => {
+            if (count() > prev) {
+                observer.disconnect();
+                clearTimeout(timer);
+                resolve(true);
+            }
+        });
+        observer.observe(document.body, { childList: true, subtree: true });
+        timer = setTimeout(() => {
+            observer.disconnect();
+            resolve(false);
+        }, waitMs);
+    });
+
+    let previous = count();
+    let noChange = 0;
+    for (let i = 0; i < maxIterations && previous < target; i++) {
+        const button = document.querySelector('div.NSTUp a.fvwqf') || document.querySelector('a.fvwqf');
+        if (button && button.offsetParent !== null) {
+            button.scrollIntoView({ block: 'center' });
+            button.click();
+        } else {
+            window.scrollTo(0, document.body.scrollHeight);
+        }
+        await waitForGrowth(previous);
+        const current = count();
+        if (current === previous) {
+            if (++noChange >= maxNoChange) {
+                break;
+            }
+        } else {
+            noChange = 0;
+        }
+        previous = current;
+    }
+    return previous;
+}
+""" % {"item": _REVIEW_ITEM_SELECTOR}
+
+# 추출 함수들을 context마다 한 번만 주입해 두고 evaluate에서는 이름으로 호출 (매번 소스 재파싱 없음)
+_EXTRACTORS_INIT_JS = (
+    f"window.__extractApolloReviews = {_APOLLO_REVIEWS_JS.strip()};\n"
+    f"window.__extractDomReviews = {_DOM_REVIEWS_JS.strip()};\n"
+)
+
+
+async def _block_non_essential(route) -> None:
+    """이미지/미디어/폰트/CSS와 트래킹 요청은 중단하고 나머지는 통과."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _BLOCKED_URL_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 class ReviewStorageManager:
-    """JSONL 기반 리뷰 저장소"""
+    """JSONL 기반 리뷰 저장소.
+
+    (place_id, 리뷰 id) 쌍은 옆에 둔 `<jsonl>.ids` 파일(한 줄에 "place_id\tid")에도 append해 두고,
+    다음 실행에서는 JSONL 전체 대신 이 파일만 읽는다. JSONL이 따로 수정돼 .ids보다 새로우면 다시 만든다.
+    """
 
     def __init__(self, output_path: str = "reviews.jsonl") -> None:
         self.path = Path(output_path)
+        self.ids_path = self.path.with_suffix(self.path.suffix + ".ids")
         if not self.path.parent.exists():
             self.path.parent.mkdir(parents=True, exist_ok=True)
 
-    def load_existing_review_ids(self) -> Set[str]:
-        """기존 리뷰 ID 집합 로드"""
+    def _ids_index_fresh(self) -> bool:
+        """.ids 파일이 JSONL의 모든 id를 담고 있는지 (JSONL 이후에 갱신됐는지)."""
+        if not self.path.exists():
+            return not self.ids_path.exists()
+        if not self.ids_path.exists():
+            return False
+        return self.ids_path.stat().st_mtime_ns >= self.path.stat().st_mtime_ns
+
+    def load_existing_review_ids(self, place_ids: List[str]) -> Dict[str, Set[str]]:
+        """장소별 기존 리뷰 ID 집합 로드 (place_ids에 있는 장소만, 없으면 빈 집합)"""
+        existing: Dict[str, Set[str]] = {place_id: set() for place_id in place_ids}
         if not self.path.exists():
-            return set()
+            return existing
+
+        pairs = self._read_ids_index() if self._ids_index_fresh() else None
+        if pairs is None:
+            pairs = self._scan_review_ids()
+            self.ids_path.write_text(
+                "".join(f"{place_id}\t{review_id}\n" for place_id, review_id in pairs),
+                encoding="utf-8",
+            )
 
-        review_ids: Set[str] = set()
-        with self.path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                review_id = data.get("id") or data.get("review_id")
-                if review_id:
-                    review_ids.add(str(review_id))
-        return review_ids
+        for place_id, review_id in pairs:
+            if place_id in existing:
+                existing[place_id].add(review_id)
+        return existing
+
+    def _read_ids_index(self) -> Optional[Set[Tuple[str, str]]]:
+        """.ids 파일에서 (place_id, id) 쌍 읽기. 예전 형식(id만 있는 줄)이면 None"""
+        pairs: Set[Tuple[str, str]] = set()
+        for line in self.ids_path.read_bytes().decode("utf-8").splitlines():
+            if not line:
+                continue
+            place_id, sep, review_id = line.partition("\t")
+            if not sep:
+                return None
+            pairs.add((place_id, review_id))
+        return pairs
+
+    def _scan_review_ids(self) -> Set[Tuple[str, str]]:
+        """JSONL 전체를 읽어 (place_id, 리뷰 ID) 쌍 집합 생성"""
+        pairs: Set[Tuple[str, str]] = set()
+        # 파일을 한 번에 읽어 줄 단위로 나눈다 (텍스트 모드 줄 버퍼링/디코딩 없음)
+        for line in self.path.read_bytes().split(b"\n"):
+            if not line:
+                continue
+            # 대부분의 줄은 정규식으로 place_id/id만 뽑고, 못 찾은 줄만 JSON 전체를 파싱
+            id_match = _REVIEW_ID_RE.search(line)
+            place_match = _REVIEW_PLACE_ID_RE.search(line)
+            if (
+                id_match
+                and place_match
+                and b"\\" not in id_match.group(1)
+                and b"\\" not in place_match.group(1)
+            ):
+                pairs.add((place_match.group(1).decode("utf-8"), id_match.group(1).decode("utf-8")))
+                continue
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            review_id = data.get("id") or data.get("review_id")
+            place_id = data.get("place_id")
+            if review_id and place_id:
+                pairs.add((str(place_id), str(review_id)))
+        return pairs
 
     def append(self, reviews: List[Dict]) -> None:
         """리뷰 데이터 추가 저장"""
         if not reviews:
             return
-        with self.path.open("a", encoding="utf-8") as f:
-            for review in reviews:
-                f.write(json.dumps(review, ensure_ascii=False) + "\n")
+        # 기존 .ids가 완전할 때만 이어 쓴다 (아니면 다음 로드 때 JSONL에서 새로 만든다)
+        if not self.path.exists():
+            self.ids_path.unlink(missing_ok=True)
+        index_fresh = self._ids_index_fresh()
+        # 배치 전체를 한 번에 직렬화해 write 한 번으로 추가
+        payload = b"".join(orjson.dumps(review) + b"\n" for review in reviews)
+        with self.path.open("ab") as f:
+            f.write(payload)
+        if index_fresh:
+            with self.ids_path.open("a", encoding="utf-8") as f:
+                f.writelines(
+                    f"{review['place_id']}\t{review['id']}\n"
+                    for review in reviews
+                    if review.get("id") and review.get("place_id")
+                )
 
 
 class NaverMapReviewCrawler:
@@ -107,6 +341,33 @@ class NaverMapReviewCrawler:
         self.headless = headless
         self.verbose = verbose
         self.launch_options = self._get_launch_options()
+        # start()로 띄워 여러 장소 크롤링에서 재사용하는 Playwright/브라우저
+        self._playwright = None
+        self._browser = None
+
+    async def start(self) -> None:
+        """브라우저를 한 번 띄운다. 이후 장소마다 새 context만 만든다."""
+        if self._browser is not None:
+            return
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(**self.launch_options)
+
+    async def close(self) -> None:
+        """start()로 띄운 브라우저 종료."""
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = self._browser = None
+
+    async def __aenter__(self) -> "NaverMapReviewCrawler":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
     def _get_launch_options(self) -> dict:
         """브라우저 실행 옵션 반환"""
@@ -178,60 +439,28 @@ class NaverMapReviewCrawler:
         hash_input = f"{author_name}|{review_text}|{visit_date}"
         return hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
 
-    async def _extract_reviews_from_apollo(self, page, place_id: str) -> List[Dict]:
-        """__APOLLO_STATE__에서 리뷰 데이터 추출"""
-        apollo_data = await page.evaluate("""
-            () => {
-                if (window.__APOLLO_STATE__) {
-                    const apollo = window.__APOLLO_STATE__;
-                    const reviews = [];
-                    
-                    // VisitorReviews 키에서 리뷰 추출
-                    for (const key in apollo) {
-                        if (key.startsWith('VisitorReviews:')) {
-                            const data = apollo[key];
-                            if (data && (data.review || data.reviewId)) {
-                                reviews.push({
-                                    review_id: data.reviewId || key.split(':')[1],
-                                    review: data.review || '',
-                                    // HTML 태그 제거 (필요시)
-                                    review_text: data.review ? data.review.replace(/<[^>]*>/g, '') : '',
-                                });
-                            }
-                        }
-                    }
-                    
-                    // VisitorImages에서 추가 정보 추출 (작성자, 이미지 등)
-                    const imagesMap = {};
-                    for (const key in apollo) {
-                        if (key.startsWith('VisitorImages:')) {
-                            const imgData = apollo[key];
-                            if (imgData && imgData.reviewId) {
-                                imagesMap[imgData.reviewId] = {
-                                    nickname: imgData.nickname || '',
-                                    image_url: imgData.imageUrl || null,
-                                    profile_image_url: imgData.profileImageUrl || null,
-                                };
-                            }
-                        }
-                    }
-                    
-                    // 리뷰와 이미지 정보 병합
-                    reviews.forEach(review => {
-                        const imgInfo = imagesMap[review.review_id];
-                        if (imgInfo) {
-                            review.author = imgInfo.nickname;
-                            review.image_url = imgInfo.image_url;
-                            review.profile_image_url = imgInfo.profile_image_url;
-                        }
-                    });
-                    
-                    return reviews;
-                }
-                return null;
-            }
-        """)
-        
+    async def _extract_reviews_from_apollo(
+        self,
+        page,
+        place_id: str,
+        skip_ids: Optional[Set[str]] = None,
+        stop_ids: Optional[Set[str]] = None,
+    ) -> Tuple[List[Dict], bool]:
+        """__APOLLO_STATE__에서 리뷰 데이터 추출.
+
+        skip_ids에 있는 리뷰는 브라우저에서 미리 제외하고, stop_ids(이미 저장된 리뷰)를 만나면
+        그 앞까지만 돌려준다. 반환값은 (리뷰 목록, stop_ids를 만났는지).
+        """
+        apollo_data = await page.evaluate(
+            "(args) => window.__extractApolloReviews(args)",
+            {"skip": list(skip_ids or ()), "stop": list(stop_ids or ())},
+        )
+
+        if not apollo_data:
+            return [], False
+        hit_existing = apollo_data["hitExisting"]
+        apollo_data = apollo_data["reviews"]
+
         if apollo_data and len(apollo_data) > 0:
             # 리뷰 데이터 정규화
             normalized_reviews = []
@@ -254,30 +483,23 @@ class NaverMapReviewCrawler:
                     "visit_date": None,  # __APOLLO_STATE__에는 방문일이 없을 수 있음
                 })
             
-            return normalized_reviews
-        
-        return []
+            return normalized_reviews, hit_existing
+
+        return [], hit_existing
 
     async def _extract_reviews_from_dom(self, page, place_id: str) -> List[Dict]:
         """DOM에서 리뷰 데이터 추출 (Fallback)"""
         reviews = []
         
         try:
-            review_elements = await page.query_selector_all("ul#_review_list > li.EjjAW")
-            
-            for elem in review_elements:
-                # 작성자
-                author_elem = await elem.query_selector("span.pui__NMi-Dp")
-                author_name = await author_elem.inner_text() if author_elem else "익명"
-                
-                # 리뷰 내용
-                content_elem = await elem.query_selector("div.pui__vn15t2 > a")
-                review_text = await content_elem.inner_text() if content_elem else ""
-                
-                # 방문날짜
-                date_elem = await elem.query_selector("time")
-                visit_date = await date_elem.inner_text() if date_elem else ""
-                
+            # 작성자/내용/방문날짜를 요소별로 묻지 않고 한 번의 evaluate로 가져온다
+            items = await page.evaluate("() => window.__extractDomReviews()")
+
+            for item in items:
+                author_name = item["author"]
+                review_text = item["content"]
+                visit_date = item["visit_date"]
+
                 # 고유 ID 생성
                 review_id = self._generate_review_id(
                     author_name=author_name,
@@ -294,12 +516,26 @@ class NaverMapReviewCrawler:
                 })
         except Exception as e:
             if self.verbose:
-                logger.warning(f"DOM에서 리뷰 추출 실패: {str(e)}", file=sys.stderr)
+                logger.warning(f"DOM에서 리뷰 추출 실패: {str(e)}")
         
         return reviews
 
+    async def _wait_for_more_reviews(self, page, previous_count: int) -> bool:
+        """리뷰 개수가 previous_count보다 늘어날 때까지 대기. 시간 안에 안 늘면 False."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        try:
+            await page.wait_for_function(
+                _REVIEW_COUNT_GREW_JS, arg=previous_count, timeout=LOAD_MORE_TIMEOUT
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
     async def _load_more_reviews(self, page):
-        """더보기 버튼 클릭 또는 스크롤로 더 많은 리뷰 로드"""
+        """더보기 버튼 클릭 또는 스크롤로 더 많은 리뷰 로드 (새 리뷰가 붙었으면 True)"""
+        previous_count = await page.evaluate(_REVIEW_COUNT_JS)
+
         # 더보기 버튼 찾기 (여러 셀렉터 시도)
         selectors = [
             "div.NSTUp a.fvwqf",  # 일반 더보기 버튼
@@ -313,12 +549,11 @@ class NaverMapReviewCrawler:
                     is_visible = await more_button.is_visible()
                     if is_visible:
                         await more_button.scroll_into_view_if_needed()
-                        await asyncio.sleep(0.5)
                         await more_button.click()
-                        await asyncio.sleep(2)  # 새 리뷰 로딩 대기
                         if self.verbose:
                             logger.info(f"더보기 버튼 클릭: {selector}")
-                        return True
+                        # 고정 sleep 대신 새 리뷰가 실제로 붙을 때까지만 대기
+                        return await self._wait_for_more_reviews(page, previous_count)
             except Exception as e:
                 if self.verbose:
                     logger.debug(f"더보기 버튼 찾기 실패 ({selector}): {str(e)}")
@@ -326,49 +561,27 @@ class NaverMapReviewCrawler:
         
         # 더보기 버튼이 없으면 스크롤로 추가 로드를 시도한다.
         await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await asyncio.sleep(2)
-        return True
+        return await self._wait_for_more_reviews(page, previous_count)
 
     async def _scroll_to_load_all(self, page, max_count: int = 100):
-        """모든 리뷰가 로드될 때까지 더보기 버튼 클릭 및 스크롤"""
-        previous_count = 0
-        no_change_count = 0
-        max_no_change = 5  # 더보기 버튼이 여러 번 있을 수 있으므로 증가
-        max_iterations = 50  # 무한 루프 방지
-
-        iteration = 0
-        while iteration < max_iterations:
-            iteration += 1
-            
-            # 현재 리뷰 개수 확인
-            try:
-                current_reviews = await page.query_selector_all("ul#_review_list > li.EjjAW")
-                current_count = len(current_reviews)
-            except Exception:
-                current_count = 0
-
-            if self.verbose and iteration % 5 == 0:
-                logger.info(f"현재 {current_count}개 리뷰 로드됨 (목표: {max_count}개)")
-
-            # 목표 개수 도달
-            if current_count >= max_count:
-                if self.verbose:
-                    logger.info(f"목표 개수 {max_count}개 도달 (현재: {current_count}개)")
-                break
+        """모든 리뷰가 로드될 때까지 더보기 버튼 클릭 및 스크롤.
 
-            if current_count == previous_count:
-                no_change_count += 1
-                if no_change_count >= max_no_change:
-                    if self.verbose:
-                        logger.info("더 이상 로드할 리뷰가 없습니다.")
-                    break
+        반복(클릭 → 새 리뷰 대기 → 개수 확인)은 브라우저 안에서 한 번의 evaluate로 돌린다.
+        """
+        loaded = await page.evaluate(
+            _LOAD_ALL_REVIEWS_JS,
+            {
+                "target": max_count,
+                "maxIterations": 50,  # 무한 루프 방지
+                "maxNoChange": 5,  # 더보기 버튼이 여러 번 있을 수 있으므로 여유 있게
+                "waitMs": LOAD_MORE_TIMEOUT,
+            },
+        )
+        if self.verbose:
+            if loaded >= max_count:
+                logger.info(f"목표 개수 {max_count}개 도달 (현재: {loaded}개)")
             else:
-                no_change_count = 0
-
-            previous_count = current_count
-
-            # 더보기 버튼 클릭 또는 스크롤
-            await self._load_more_reviews(page)
+                logger.info(f"더 이상 로드할 리뷰가 없습니다. (현재: {loaded}개)")
 
     async def crawl_all_reviews(
         self, place_id: str, existing_ids: Set[str], max_count: int = 100
@@ -379,150 +592,211 @@ class NaverMapReviewCrawler:
             place_id: 네이버 place_id
             existing_ids: 이미 존재하는 리뷰 id의 set. 발견 시 즉시 중단 (필수).
             max_count: 수집할 리뷰의 최대 개수 (기본 100).
+
+        start()(또는 async with)로 브라우저를 띄워 두었으면 새 context만 열어 재사용하고,
+        아니면 이 호출 전용 브라우저를 띄웠다가 닫는다 (동시에 여러 번 불려도 서로의 브라우저를 건드리지 않음).
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(**self.launch_options)
-            context = await browser.new_context(**self._get_context_options())
-            page = await context.new_page()
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        from playwright.async_api import async_playwright
 
-            await page.route(
-                "**/*.{png,jpg,jpeg,gif,svg,webp}", lambda route: route.abort()
-            )
+        own_playwright = None
+        browser = self._browser
+        if browser is None:
+            own_playwright = await async_playwright().start()
+            browser = await own_playwright.chromium.launch(**self.launch_options)
+        # 장소마다 새 context(쿠키/캐시 분리)만 만들고 브라우저는 재사용
+        context = await browser.new_context(**self._get_context_options())
+        await context.add_init_script(_EXTRACTORS_INIT_JS)
+        page = await context.new_page()
+
+        await page.route("**/*", _block_non_essential)
 
-            reviews: List[Dict] = []
-            already_appended_ids: Set[str] = set()
+        reviews: List[Dict] = []
+        already_appended_ids: Set[str] = set()
 
+        try:
+            # 리뷰 페이지로 이동
+            url = f"https://pcmap.place.naver.com/restaurant/{place_id}/review/visitor"
+            await page.goto(url, wait_until="domcontentloaded")
+            # 고정 3초 대신 리뷰 목록이 그려질 때까지만 대기 (리뷰가 없는 장소면 타임아웃 후 진행)
             try:
-                # 리뷰 페이지로 이동
-                url = f"https://pcmap.place.naver.com/restaurant/{place_id}/review/visitor"
-                await page.goto(url, wait_until="domcontentloaded")
-                await page.wait_for_timeout(3000)  # 페이지 로딩 대기
+                await page.wait_for_selector(_REVIEW_ITEM_SELECTOR, timeout=TIMEOUT)
+            except PlaywrightTimeoutError:
+                pass
 
-                # 최신순 정렬 시도
-                try:
-                    sort_buttons = await page.query_selector_all("a.place_btn_option")
-                    for btn in sort_buttons:
-                        btn_text = await btn.inner_text()
-                        if "최신순" in btn_text:
-                            await btn.click()
-                            await asyncio.sleep(2)
-                            if self.verbose:
-                                logger.info("최신순으로 정렬됨")
+            # 최신순 정렬 시도
+            try:
+                sort_buttons = await page.query_selector_all("a.place_btn_option")
+                for btn in sort_buttons:
+                    btn_text = await btn.inner_text()
+                    if "최신순" in btn_text:
+                        await btn.click()
+                        # 정렬 후 목록을 다시 받아오는 요청이 끝날 때까지 대기
+                        try:
+                            await page.wait_for_load_state("networkidle", timeout=LOAD_MORE_TIMEOUT)
+                        except PlaywrightTimeoutError:
+                            pass
+                        if self.verbose:
+                            logger.info("최신순으로 정렬됨")
+                        break
+            except Exception:
+                pass  # 정렬 실패해도 계속 진행
+
+            # 먼저 __APOLLO_STATE__에서 리뷰 추출 시도
+            # (이미 존재하는 리뷰를 만나면 브라우저 쪽에서 그 앞까지만 넘겨준다)
+            apollo_reviews, hit_existing = await self._extract_reviews_from_apollo(
+                page, place_id, stop_ids=existing_ids
+            )
+
+            if apollo_reviews and len(apollo_reviews) > 0:
+                if self.verbose:
+                    logger.info(f"__APOLLO_STATE__에서 {len(apollo_reviews)}개 리뷰 추출")
+
+                # 중복 체크 및 필터링
+                for review in apollo_reviews:
+                    review_id = review.get("id")
+                    if review_id not in already_appended_ids:
+                        reviews.append(review)
+                        already_appended_ids.add(review_id)
+
+                        if len(reviews) >= max_count:
                             break
-                except Exception:
-                    pass  # 정렬 실패해도 계속 진행
 
-                # 먼저 __APOLLO_STATE__에서 리뷰 추출 시도
-                apollo_reviews = await self._extract_reviews_from_apollo(page, place_id)
-                
-                if apollo_reviews and len(apollo_reviews) > 0:
-                    if self.verbose:
-                        logger.info(f"__APOLLO_STATE__에서 {len(apollo_reviews)}개 리뷰 추출")
-                    
-                    # 중복 체크 및 필터링
-                    for review in apollo_reviews:
-                        review_id = review.get("id")
-                        if review_id in existing_ids:
-                            if self.verbose:
-                                logger.info(f"이미 존재하는 리뷰(id={review_id}) 발견, 크롤링 중단")
-                            return reviews[:max_count] if len(reviews) > max_count else reviews
-                        
-                        if review_id not in already_appended_ids:
-                            reviews.append(review)
-                            already_appended_ids.add(review_id)
-                            
-                            if len(reviews) >= max_count:
-                                break
-                    
-                    # __APOLLO_STATE__에서 충분한 리뷰를 가져왔으면 반환
-                    if len(reviews) >= max_count:
-                        return reviews[:max_count]
-                    
-                    # 부족하면 더보기 버튼 클릭하여 더 로드
-                    if self.verbose:
-                        logger.info(f"__APOLLO_STATE__에서 {len(reviews)}개만 추출됨, 더 로드 시도...")
-                    
-                    # 더보기 버튼 클릭하여 더 많은 리뷰 로드
-                    await self._scroll_to_load_all(page, max_count=max_count)
-                    
-                    # 다시 __APOLLO_STATE__ 확인 (새로 로드된 리뷰)
-                    apollo_reviews_2 = await self._extract_reviews_from_apollo(page, place_id)
-                    if apollo_reviews_2:
-                        for review in apollo_reviews_2:
-                            review_id = review.get("id")
-                            if review_id in existing_ids:
-                                if self.verbose:
-                                    logger.info(f"이미 존재하는 리뷰(id={review_id}) 발견")
-                                break
-                            
-                            if review_id not in already_appended_ids:
-                                reviews.append(review)
-                                already_appended_ids.add(review_id)
-                                
-                                if len(reviews) >= max_count:
-                                    break
-                    
-                    if len(reviews) >= max_count:
-                        return reviews[:max_count]
-                
-                # __APOLLO_STATE__가 없거나 부족하면 DOM 방식 사용
+            if hit_existing:
                 if self.verbose:
-                    logger.info("__APOLLO_STATE__ 없음 또는 부족, DOM 방식으로 추출")
-
-                # DOM에서 리뷰 추출을 먼저 수행하고, 매 반복마다 누적한 뒤 더보기를 누른다.
-                # (화면 상태가 중간에 바뀌어도 이미 수집한 리뷰는 보존)
-                while len(reviews) < max_count:
-                    dom_reviews = await self._extract_reviews_from_dom(page, place_id)
-
-                    new_reviews_added = False
-                    for review in dom_reviews:
-                        review_id = review.get("id")
-                        if review_id in existing_ids:
-                            if self.verbose:
-                                logger.info(f"이미 존재하는 리뷰(id={review_id}) 발견, 크롤링 중단")
-                            return reviews[:max_count] if len(reviews) > max_count else reviews
-                        
-                        if review_id not in already_appended_ids:
-                            reviews.append(review)
-                            already_appended_ids.add(review_id)
-                            new_reviews_added = True
-                            
-                            if len(reviews) >= max_count:
-                                break
-                    
-                    # 새로운 리뷰가 없으면 종료
-                    if not new_reviews_added:
-                        if self.verbose:
-                            logger.info("더 이상 새로운 리뷰가 없습니다.")
-                        break
-                    
-                    # 목표 개수 도달
-                    if len(reviews) >= max_count:
-                        break
+                    logger.info("이미 존재하는 리뷰 발견, 크롤링 중단")
+                return reviews[:max_count]
 
-                    # 더보기 버튼 클릭/스크롤 시도. 더 이상 진행이 안 되면 종료.
-                    progressed = await self._load_more_reviews(page)
-                    if not progressed:
-                        if self.verbose:
-                            logger.info("더 이상 로드할 리뷰가 없습니다.")
-                        break
-                    await asyncio.sleep(1)
+            if apollo_reviews and len(apollo_reviews) > 0:
+                # __APOLLO_STATE__에서 충분한 리뷰를 가져왔으면 반환
+                if len(reviews) >= max_count:
+                    return reviews[:max_count]
 
-            except Exception as e:
+                # 부족하면 더보기 버튼 클릭하여 더 로드
                 if self.verbose:
-                    logger.error(f"크롤링 중 오류: {str(e)}", file=sys.stderr)
-            finally:
+                    logger.info(f"__APOLLO_STATE__에서 {len(reviews)}개만 추출됨, 더 로드 시도...")
+
+                # 더보기 버튼 클릭하여 더 많은 리뷰 로드
+                await self._scroll_to_load_all(page, max_count=max_count)
+
+                # 다시 __APOLLO_STATE__ 확인 (새로 로드된 리뷰)
+                # 첫 추출에서 이미 담은 리뷰는 빼고 새로 로드된 것만 받는다
+                apollo_reviews_2, hit_existing = await self._extract_reviews_from_apollo(
+                    page, place_id, skip_ids=already_appended_ids, stop_ids=existing_ids
+                )
+                for review in apollo_reviews_2:
+                    review_id = review.get("id")
+                    if review_id not in already_appended_ids:
+                        reviews.append(review)
+                        already_appended_ids.add(review_id)
+
+                        if len(reviews) >= max_count:
+                            break
+
+                if hit_existing:
+                    if self.verbose:
+                        logger.info("이미 존재하는 리뷰 발견, 크롤링 중단")
+                    return reviews[:max_count]
+                if len(reviews) >= max_count:
+                    return reviews[:max_count]
+
+            # __APOLLO_STATE__가 없거나 부족하면 DOM 방식 사용
+            if self.verbose:
+                logger.info("__APOLLO_STATE__ 없음 또는 부족, DOM 방식으로 추출")
+
+            # DOM에서 리뷰 추출을 먼저 수행하고, 매 반복마다 누적한 뒤 더보기를 누른다.
+            # (화면 상태가 중간에 바뀌어도 이미 수집한 리뷰는 보존)
+            while len(reviews) < max_count:
+                dom_reviews = await self._extract_reviews_from_dom(page, place_id)
+
+                new_reviews_added = False
+                for review in dom_reviews:
+                    review_id = review.get("id")
+                    if review_id in existing_ids:
+                        if self.verbose:
+                            logger.info(f"이미 존재하는 리뷰(id={review_id}) 발견, 크롤링 중단")
+                        return reviews[:max_count] if len(reviews) > max_count else reviews
+
+                    if review_id not in already_appended_ids:
+                        reviews.append(review)
+                        already_appended_ids.add(review_id)
+                        new_reviews_added = True
+
+                        if len(reviews) >= max_count:
+                            break
+
+                # 새로운 리뷰가 없으면 종료
+                if not new_reviews_added:
+                    if self.verbose:
+                        logger.info("더 이상 새로운 리뷰가 없습니다.")
+                    break
+
+                # 목표 개수 도달
+                if len(reviews) >= max_count:
+                    break
+
+                # 더보기 버튼 클릭/스크롤 시도. 더 이상 진행이 안 되면 종료.
+                progressed = await self._load_more_reviews(page)
+                if not progressed:
+                    if self.verbose:
+                        logger.info("더 이상 로드할 리뷰가 없습니다.")
+                    break
+
+        except Exception as e:
+            if self.verbose:
+                logger.error(f"크롤링 중 오류: {str(e)}")
+        finally:
+            await context.close()
+            if own_playwright is not None:
                 await browser.close()
+                await own_playwright.stop()
+
+        return reviews[:max_count] if len(reviews) > max_count else reviews
+
+    async def crawl_many(
+        self,
+        place_ids: List[str],
+        existing_ids_per_place: Optional[Dict[str, Set[str]]] = None,
+        max_count: int = 100,
+        concurrency: int = 4,
+    ) -> Dict[str, List[Dict]]:
+        """여러 장소를 브라우저 하나로 동시에 크롤링 (장소마다 별도 context, 최대 concurrency개씩)."""
+        existing_ids_per_place = existing_ids_per_place or {}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def crawl_one(place_id: str) -> List[Dict]:
+            async with semaphore:
+                return await self.crawl_all_reviews(
+                    place_id, existing_ids_per_place.get(place_id, set()), max_count=max_count
+                )
 
-            return reviews[:max_count] if len(reviews) > max_count else reviews
+        owns_browser = self._browser is None
+        if owns_browser:
+            await self.start()
+        try:
+            results = await asyncio.gather(*(crawl_one(place_id) for place_id in place_ids))
+        finally:
+            if owns_browser:
+                await self.close()
+        return dict(zip(place_ids, results))
 
 
 async def crawl_reviews(
-    place_id: str, max_count: int = 100, headless: bool = True, verbose: bool = True
+    place_id: str,
+    max_count: int = 100,
+    headless: bool = True,
+    verbose: bool = True,
+    crawler: Optional[NaverMapReviewCrawler] = None,
+    existing_ids: Optional[Set[str]] = None,
 ) -> List[Dict]:
-    """Convenience wrapper to get reviews."""
-    crawler = NaverMapReviewCrawler(headless=headless, verbose=verbose)
-    return await crawler.crawl_all_reviews(place_id, set(), max_count=max_count)
+    """Convenience wrapper to get reviews.
+
+    여러 장소를 연달아 크롤링할 때는 start()/async with로 띄워 둔 crawler를 넘기면 브라우저를 재사용한다.
+    existing_ids를 주면 이미 저장된 리뷰를 만나는 지점에서 멈춘다.
+    """
+    if crawler is None:
+        crawler = NaverMapReviewCrawler(headless=headless, verbose=verbose)
+    return await crawler.crawl_all_reviews(place_id, existing_ids or set(), max_count=max_count)
 
 
 def print_results_summary(reviews: List[Dict]):
@@ -540,7 +814,18 @@ def print_results_summary(reviews: List[Dict]):
 
 def run_cli() -> None:
     parser = argparse.ArgumentParser(description="네이버 지도 리뷰 크롤러")
-    parser.add_argument("--place-id", required=True, help="네이버 place_id")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--place-id", help="네이버 place_id")
+    target.add_argument(
+        "--place-ids",
+        help="쉼표로 구분한 place_id 목록 (브라우저 하나로 동시에 크롤링)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="--place-ids 사용 시 동시에 크롤링할 장소 수",
+    )
     parser.add_argument("--max-count", type=int, default=100, help="최대 리뷰 수집 개수")
     parser.add_argument(
         "--json-output",
@@ -583,30 +868,40 @@ def run_cli() -> None:
     )
     args = parser.parse_args()
 
-    reviews = asyncio.run(crawl_reviews(args.place_id, args.max_count, verbose=not args.json_output))
+    if args.place_ids:
+        place_ids = list(dict.fromkeys(pid.strip() for pid in args.place_ids.split(",") if pid.strip()))
+    else:
+        place_ids = [args.place_id]
+
+    # S3 업로드 및 이미지 다운로드 (선택적)
+    # .env에서 버킷 이름이 있으면 자동으로 사용
+    s3_bucket = args.s3_bucket or os.getenv("S3_BUCKET_NAME") or os.getenv("S3_BUCKET")
 
     # storage_manager append (optional)
-    new_results = reviews
+    manager = None
+    existing_by_place: Dict[str, Set[str]] = {place_id: set() for place_id in place_ids}
     if not args.skip_jsonl:
-        if args.jsonl_path:
-            manager = ReviewStorageManager(str(args.jsonl_path))
-        else:
-            manager = ReviewStorageManager()
-        existing = manager.load_existing_review_ids()
-        new_results = [
-            item
-            for item in reviews
-            if item.get("id") and item["id"] not in existing
-        ]
+        manager = ReviewStorageManager(str(args.jsonl_path)) if args.jsonl_path else ReviewStorageManager()
+        existing_by_place = manager.load_existing_review_ids(place_ids)
+
+    # 기존 리뷰 id는 크롤러에 넘겨 처음부터 수집하지 않게 한다 (최신순이라 만나면 바로 중단).
+    # S3에도 신규 리뷰만 NDJSON 샤드로 추가하므로 전체를 다시 수집할 필요가 없다.
+    crawler = NaverMapReviewCrawler(verbose=not args.json_output)
+    reviews_by_place = asyncio.run(
+        crawler.crawl_many(
+            place_ids,
+            existing_ids_per_place=existing_by_place,
+            max_count=args.max_count,
+            concurrency=args.concurrency,
+        )
+    )
+    new_results = [review for place_reviews in reviews_by_place.values() for review in place_reviews]
+    if manager is not None:
         manager.append(new_results)
 
-    # S3 업로드 및 이미지 다운로드 (선택적)
-    # .env에서 버킷 이름이 있으면 자동으로 사용
-    s3_bucket = args.s3_bucket or os.getenv("S3_BUCKET_NAME") or os.getenv("S3_BUCKET")
-    
     if s3_bucket and S3_AVAILABLE:
         try:
-            s3_manager = S3StorageManager(
+            s3_manager = get_s3_manager(
                 bucket_name=s3_bucket,
                 aws_access_key_id=args.aws_access_key_id or os.getenv("AWS_ACCESS_KEY_ID"),
                 aws_secret_access_key=args.aws_secret_access_key or os.getenv("AWS_SECRET_ACCESS_KEY"),
@@ -615,60 +910,94 @@ def run_cli() -> None:
             if not args.json_output:
                 print(f"\nS3 업로드 시작 (버킷: {s3_bucket})")
             
-            # 리뷰 원본 데이터 업로드
-            # NOTE: JSONL은 "신규만 append"라서 new_results가 0개일 수 있음(중복이면 전부 스킵).
-            # S3에는 원본 스냅샷(이번 실행에서 크롤링한 전체 reviews)을 올리는 게 맞음.
+            # 리뷰 원본 데이터 업로드 (이번 실행의 신규 리뷰만 장소별 NDJSON 샤드로 추가)
             uploaded_count = 0
-            try:
-                if reviews:
-                    s3_manager.upload_reviews(
-                        place_id=str(args.place_id),
-                        reviews=reviews,
-                    )
-                uploaded_count = len(reviews)
-                if not args.json_output:
-                    print(f"\nS3에 {uploaded_count}개 리뷰 원본 데이터 업로드 완료")
-            except Exception as e:
-                if not args.json_output:
-                    print(f"S3 리뷰 업로드 실패: {str(e)}", file=sys.stderr)
+            for place_id, place_reviews in reviews_by_place.items():
+                if not place_reviews:
+                    continue
+                try:
+                    s3_manager.append_reviews(str(place_id), place_reviews)
+                    uploaded_count += len(place_reviews)
+                except Exception as e:
+                    if not args.json_output:
+                        print(f"S3 리뷰 업로드 실패 (place_id={place_id}): {str(e)}", file=sys.stderr)
+                    if is_fatal_s3_error(e):
+                        break
+            if not args.json_output:
+                print(f"\nS3에 {uploaded_count}개 신규 리뷰 NDJSON 샤드 업로드 완료")
             
             # 이미지 다운로드 및 업로드
             if args.download_images:
+                import aiohttp
+
                 image_count = 0
-                async def download_and_upload_image(review_id: str, image_url: str):
+                # 동시에 진행되는 작업끼리 파일명이 겹치지 않도록 번호는 시작할 때 배정
+                image_seq = itertools.count()
+                upload_sem = asyncio.Semaphore(IMAGE_UPLOAD_CONCURRENCY)
+
+                async def download_and_upload_image(
+                    session: aiohttp.ClientSession, async_s3, review_id: str, image_url: str
+                ):
                     nonlocal image_count
                     try:
-                        async with aiohttp.ClientSession() as session:
-                            async with session.get(image_url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                                if response.status == 200:
-                                    image_data = await response.read()
-                                    image_name = f"{int(time.time())}_{image_count}.jpg"
-                                    s3_manager.upload_review_image(
-                                        review_id=review_id,
-                                        image_name=image_name,
-                                        image_data=image_data
-                                    )
-                                    image_count += 1
-                                    return True
+                        async with upload_sem:
+                            async with session.get(image_url) as response:
+                                if response.status != 200:
+                                    return False
+                                image_data = await response.read()
+                            image_name = f"{int(time.time())}_{next(image_seq)}.jpg"
+                            if async_s3 is not None:
+                                await async_s3.upload_review_image(review_id, image_name, image_data)
+                            else:
+                                # boto3 업로드는 동기 호출이라 스레드에서 실행해 이벤트 루프를 막지 않는다
+                                await asyncio.to_thread(
+                                    s3_manager.upload_review_image,
+                                    review_id=review_id,
+                                    image_name=image_name,
+                                    image_data=image_data,
+                                )
+                        image_count += 1
+                        return True
                     except Exception as e:
                         if not args.json_output:
                             logger.debug(f"이미지 다운로드 실패 (review_id={review_id}): {str(e)}")
                         return False
-                    return False
                 
-                # 비동기로 이미지 다운로드
+                # 비동기로 이미지 다운로드 (세션 하나로 커넥션/keep-alive 재사용)
                 async def download_all_images():
-                    tasks = []
-                    for review in new_results:
-                        review_id = review.get("id") or review.get("review_id", "")
-                        image_url = review.get("image_url")
-                        if image_url and review_id:
-                            tasks.append(download_and_upload_image(review_id, image_url))
-                    
-                    if tasks:
-                        await asyncio.gather(*tasks, return_exceptions=True)
-                        if not args.json_output:
-                            print(f"S3에 {image_count}개 리뷰 이미지 업로드 완료")
+                    targets = [
+                        (review.get("id") or review.get("review_id", ""), review.get("image_url"))
+                        for review in new_results
+                    ]
+                    targets = [(review_id, image_url) for review_id, image_url in targets if image_url and review_id]
+                    if not targets:
+                        return
+
+                    async with AsyncExitStack() as stack:
+                        connector = aiohttp.TCPConnector(limit=IMAGE_DOWNLOAD_CONNECTIONS, ttl_dns_cache=300)
+                        session = await stack.enter_async_context(
+                            aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=10))
+                        )
+                        # aiobotocore가 있으면 다운로드와 같은 이벤트 루프에서 업로드 (다운로드→업로드 파이프라인)
+                        async_s3 = None
+                        if AIOBOTOCORE_AVAILABLE:
+                            async_s3 = await stack.enter_async_context(
+                                AsyncS3StorageManager(
+                                    bucket_name=s3_manager.bucket_name,
+                                    aws_access_key_id=args.aws_access_key_id or os.getenv("AWS_ACCESS_KEY_ID"),
+                                    aws_secret_access_key=args.aws_secret_access_key or os.getenv("AWS_SECRET_ACCESS_KEY"),
+                                    region=s3_manager.region,
+                                )
+                            )
+                        await asyncio.gather(
+                            *(
+                                download_and_upload_image(session, async_s3, review_id, image_url)
+                                for review_id, image_url in targets
+                            ),
+                            return_exceptions=True,
+                        )
+                    if not args.json_output:
+                        print(f"S3에 {image_count}개 리뷰 이미지 업로드 완료")
                 
                 asyncio.run(download_all_images())
                 
@@ -1,22 +1,156 @@
 """S3 storage manager for crawling data.
 
-- places/raw/YYYYMMDD/{query}/{place_id}.json  (query optional)
-- reviews/{place_id}/reviews.json (+ optional YYYYMMDD backup)
+- places/raw/YYYYMMDD/{query}/{place_id}.json.gz  (query optional)
+- reviews/{place_id}/reviews.json.gz (+ optional YYYYMMDD backup)  전체 스냅샷
+- reviews/{place_id}/ndjson/{YYYYMMDD_HHMMSS_ffffff}.ndjson.gz  실행마다 새로 수집한 리뷰만 (읽을 때 샤드를 이어붙이고 id로 중복 제거)
 - images/places/{place_id}/{image_name}
 - images/reviews/{review_id}/{image_name}
 """
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
-from typing import Dict, List, Optional
+import asyncio
+import gzip
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 import boto3
+import orjson
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# 비동기 업로드 (선택적)
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+    AIOBOTOCORE_AVAILABLE = True
+except ImportError:
+    AIOBOTOCORE_AVAILABLE = False
 
-class S3StorageManager:
+# 업로드를 스레드풀로 병렬 실행할 때 스레드들이 함께 쓰는 커넥션 풀 크기 (기본 10)
+MAX_POOL_CONNECTIONS = 64
+# 일괄 업로드 기본 동시성 (커넥션 풀보다 작게 유지)
+BULK_UPLOAD_WORKERS = 32
+# 스로틀링/일시적 5xx는 클라이언트 측 속도 조절(adaptive)로 짧게 재시도 (4xx는 botocore가 재시도하지 않음)
+_RETRIES = {"mode": "adaptive", "max_attempts": 5}
+# 버킷/자격증명 문제라 다른 키로 넘어가도 똑같이 실패하는 오류 (배치 전체를 바로 중단)
+_FATAL_ERROR_CODES = frozenset(
+    {"NoSuchBucket", "AccessDenied", "AllAccessDisabled", "InvalidAccessKeyId", "SignatureDoesNotMatch"}
+)
+# 동기/비동기 클라이언트가 함께 쓰는 botocore 설정
+_CLIENT_OPTIONS = dict(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    retries=_RETRIES,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=60,
+)
+# 리뷰 JSON이 이 크기를 넘으면 멀티파트로 파트를 병렬 업로드 (작으면 단일 PUT)
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+MULTIPART_CONCURRENCY = 10
+# JSON은 압축률이 높아 gzip으로 올린다 (레벨 3: 속도 대비 압축률이 좋은 지점)
+GZIP_LEVEL = 3
+# 검색어로 만드는 키 경로 구간 최대 길이
+SAFE_PREFIX_MAX_LEN = 50
+# orjson은 항상 UTF-8 bytes를 내보낸다 (ensure_ascii=False + encode 와 동일), 숫자 키도 허용
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class _SafeKeyCharMap(dict):
+    """str.translate용 테이블: isalnum/'-'/'_'는 그대로, 나머지는 '_' (한글 검색어는 그대로 유지)
+
+    처음 보는 문자만 __missing__에서 판정해 저장하므로, 이후에는 C 레벨 dict 조회만 한다.
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        mapped = codepoint if char.isalnum() or char in "-_" else 0x5F
+        self[codepoint] = mapped
+        return mapped
+
+
+_SAFE_KEY_CHARS = _SafeKeyCharMap()
+
+
+def is_fatal_s3_error(exc: BaseException) -> bool:
+    """재시도하거나 다음 키로 넘어가도 소용없는 S3 오류인지 (호출 측에서 남은 업로드를 중단할 때 사용)"""
+    return isinstance(exc, ClientError) and exc.response.get("Error", {}).get("Code") in _FATAL_ERROR_CODES
+
+
+class _S3KeyLayout:
+    """동기/비동기 매니저가 함께 쓰는 키 경로와 직렬화 규칙"""
+
+    def __init__(self, bucket_name: str, region: str) -> None:
+        self.bucket_name = bucket_name
+        self.region = region
+        # (다음 자정 timestamp, YYYYMMDD) - 날짜가 바뀔 때만 strftime
+        self._date_cache: Tuple[float, str] = (0.0, "")
+
+    @staticmethod
+    def _safe_prefix(value: str, max_len: int = SAFE_PREFIX_MAX_LEN) -> str:
+        # 파일/키 경로에 안전한 형태로 변환 (공백/특수문자 → _)
+        return value.translate(_SAFE_KEY_CHARS)[:max_len]
+
+    def _today(self) -> str:
+        expires_at, date_str = self._date_cache
+        if time.time() < expires_at:
+            return date_str
+        now = datetime.now()
+        midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        date_str = now.strftime("%Y%m%d")
+        self._date_cache = (midnight.timestamp(), date_str)
+        return date_str
+
+    @staticmethod
+    def _json_bytes(data, pretty: bool = False) -> bytes:
+        # 기계가 읽는 파일이라 기본은 들여쓰기 없는 compact JSON (디버깅용으로만 pretty)
+        option = _JSON_OPTIONS | orjson.OPT_INDENT_2 if pretty else _JSON_OPTIONS
+        return orjson.dumps(data, option=option)
+
+    @classmethod
+    def _gzip_json(cls, data, pretty: bool = False) -> bytes:
+        return gzip.compress(cls._json_bytes(data, pretty), compresslevel=GZIP_LEVEL)
+
+    @staticmethod
+    def _gzip_ndjson(rows: Sequence[Dict]) -> bytes:
+        option = _JSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        return gzip.compress(b"".join(orjson.dumps(row, option=option) for row in rows), compresslevel=GZIP_LEVEL)
+
+    @staticmethod
+    def review_shard_key(place_id: str) -> str:
+        """신규 리뷰 NDJSON 샤드 키 (시각순으로 정렬되는 이름)"""
+        return f"reviews/{place_id}/ndjson/{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.ndjson.gz"
+
+    def build_place_prefix(self, query: Optional[str] = None) -> str:
+        """오늘 날짜(+검색어)의 장소 원본 prefix. 여러 장소를 올릴 때는 한 번만 만들어 재사용"""
+        if query:
+            return f"places/raw/{self._today()}/{self._safe_prefix(query)}/"
+        return f"places/raw/{self._today()}/"
+
+    @staticmethod
+    def build_place_key(place_id: str, *, prefix: str) -> str:
+        """build_place_prefix로 만든 prefix 아래의 장소 원본 키"""
+        return prefix + place_id + ".json.gz"
+
+    @staticmethod
+    def place_image_key(place_id: str, image_name: str) -> str:
+        """장소 이미지 키"""
+        return f"images/places/{place_id}/{image_name}"
+
+    @staticmethod
+    def review_image_key(review_id: str, image_name: str) -> str:
+        """리뷰 이미지 키"""
+        return f"images/reviews/{review_id}/{image_name}"
+
+
+class S3StorageManager(_S3KeyLayout):
     """S3에 크롤링 데이터 저장"""
 
     def __init__(
@@ -26,71 +160,119 @@ class S3StorageManager:
         aws_secret_access_key: Optional[str] = None,
         region: str = "ap-northeast-2",
     ) -> None:
-        self.bucket_name = bucket_name
+        super().__init__(bucket_name, region)
         self.s3_client = boto3.client(
             "s3",
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=region,
+            config=Config(**_CLIENT_OPTIONS),
         )
+        self._transfer_cfg = TransferConfig(
+            multipart_threshold=MULTIPART_CHUNK_SIZE,
+            multipart_chunksize=MULTIPART_CHUNK_SIZE,
+            max_concurrency=MULTIPART_CONCURRENCY,
+            use_threads=True,
+        )
+        # places/raw prefix -> 이미 올라가 있는 place_id 집합 (check_place_exists용)
+        self._exists_cache: Dict[str, Set[str]] = {}
+        # 업로드 스레드별로 재사용하는 gzip 본문 버퍼
+        self._tls = threading.local()
 
-    @staticmethod
-    def _safe_prefix(value: str, max_len: int = 50) -> str:
-        # 파일/키 경로에 안전한 형태로 변환 (공백/특수문자 → _)
-        safe = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in value)
-        return safe[:max_len] if len(safe) > max_len else safe
+    @contextmanager
+    def _gzip_json_body(self, data, pretty: bool = False) -> Iterator[io.BytesIO]:
+        """스레드별 BytesIO 하나에 gzip JSON을 바로 압축해 Body로 넘긴다 (업로드마다 압축 결과 bytes를 새로 만들지 않음)
 
-    def upload_place_raw_data(self, place_id: str, data: Dict, query: Optional[str] = None) -> str:
-        """장소 원본 크롤링 데이터를 S3에 업로드"""
-        date_str = datetime.now().strftime("%Y%m%d")
-        if query:
-            safe_query = self._safe_prefix(query)
-            key = f"places/raw/{date_str}/{safe_query}/{place_id}.json"
-        else:
-            key = f"places/raw/{date_str}/{place_id}.json"
+        put_object/upload_fileobj는 호출 스레드에서 본문을 다 읽고 반환하므로 같은 스레드 안에서는 안전하게 재사용된다.
+        """
+        buf = getattr(self._tls, "buf", None)
+        if buf is None:
+            buf = self._tls.buf = io.BytesIO()
+        try:
+            with gzip.GzipFile(fileobj=buf, mode="wb", compresslevel=GZIP_LEVEL, mtime=0) as gz:
+                gz.write(self._json_bytes(data, pretty))
+            buf.seek(0)
+            yield buf
+        finally:
+            # 큰 리뷰 목록의 본문이 스레드에 계속 남지 않도록 비운다
+            buf.seek(0)
+            buf.truncate()
 
-        self.s3_client.put_object(
-            Bucket=self.bucket_name,
-            Key=key,
-            Body=json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"),
-            ContentType="application/json",
-        )
+    def upload_place_raw_data(
+        self,
+        place_id: str,
+        data: Dict,
+        query: Optional[str] = None,
+        pretty: bool = False,
+        prefix: Optional[str] = None,
+    ) -> str:
+        """장소 원본 크롤링 데이터를 S3에 업로드 (prefix를 주면 query 대신 그대로 사용)"""
+        if prefix is None:
+            prefix = self.build_place_prefix(query)
+        key = self.build_place_key(place_id, prefix=prefix)
+
+        with self._gzip_json_body(data, pretty) as body:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=body,
+                ContentType="application/json",
+                ContentEncoding="gzip",
+            )
+        existing = self._exists_cache.get(prefix)
+        if existing is not None:
+            existing.add(place_id)
         return key
 
-    def upload_reviews(self, place_id: str, reviews: List[Dict], backup: bool = False) -> str:
+    def upload_reviews(
+        self, place_id: str, reviews: List[Dict], backup: bool = False, pretty: bool = False
+    ) -> str:
         """리뷰 데이터를 S3에 업로드
         
         Args:
             place_id: 장소 ID
             reviews: 리뷰 리스트
             backup: True면 날짜별 백업도 생성 (기본값: False, 중복 저장 방지)
+            pretty: True면 들여쓰기(2칸)한 JSON으로 저장 (기본값: False, compact)
         """
         # 최신 데이터 업로드
-        key = f"reviews/{place_id}/reviews.json"
-        body = json.dumps(reviews, ensure_ascii=False, indent=2).encode("utf-8")
-        self.s3_client.put_object(
-            Bucket=self.bucket_name,
-            Key=key,
-            Body=body,
-            ContentType="application/json",
-        )
+        key = f"reviews/{place_id}/reviews.json.gz"
+        with self._gzip_json_body(reviews, pretty) as body:
+            self._upload_large_json(key, body)
 
-        # 날짜별 백업 (선택적, 기본값은 False로 변경하여 중복 저장 방지)
-        if backup:
-            date_str = datetime.now().strftime("%Y%m%d")
-            backup_key = f"reviews/{place_id}/{date_str}_reviews.json"
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=backup_key,
-                Body=body,
-                ContentType="application/json",
-            )
+            # 날짜별 백업 (선택적, 기본값은 False로 변경하여 중복 저장 방지)
+            if backup:
+                date_str = self._today()
+                backup_key = f"reviews/{place_id}/{date_str}_reviews.json.gz"
+                self._upload_large_json(backup_key, body)
 
         return key
 
+    def append_reviews(self, place_id: str, new_reviews: Sequence[Dict]) -> Optional[str]:
+        """이번 실행에서 새로 수집한 리뷰만 NDJSON 샤드로 업로드 (기존 리뷰는 다시 직렬화/전송하지 않음)
+
+        S3 객체는 이어쓰기가 안 되므로 실행마다 샤드를 하나 추가한다. 올릴 리뷰가 없으면 None.
+        """
+        if not new_reviews:
+            return None
+        key = self.review_shard_key(place_id)
+        self._upload_large_json(key, io.BytesIO(self._gzip_ndjson(new_reviews)), content_type="application/x-ndjson")
+        return key
+
+    def _upload_large_json(self, key: str, body: io.BytesIO, content_type: str = "application/json") -> None:
+        # 임계값 이상이면 TransferManager가 멀티파트로 나눠 병렬 업로드, 미만이면 단일 PUT
+        body.seek(0)
+        self.s3_client.upload_fileobj(
+            body,
+            self.bucket_name,
+            key,
+            ExtraArgs={"ContentType": content_type, "ContentEncoding": "gzip"},
+            Config=self._transfer_cfg,
+        )
+
     def upload_place_image(self, place_id: str, image_name: str, image_data: bytes) -> str:
         """장소 이미지를 S3에 업로드"""
-        key = f"images/places/{place_id}/{image_name}"
+        key = self.place_image_key(place_id, image_name)
         self.s3_client.put_object(
             Bucket=self.bucket_name,
             Key=key,
@@ -99,9 +281,40 @@ class S3StorageManager:
         )
         return key
 
+    def upload_place_images_bulk(
+        self,
+        place_id: str,
+        items: Sequence[Tuple[str, bytes]],
+        max_workers: int = BULK_UPLOAD_WORKERS,
+    ) -> List[str]:
+        """장소 이미지 여러 장을 스레드풀로 동시에 업로드 (작은 객체는 요청 왕복이 병목)
+
+        Args:
+            place_id: 장소 ID
+            items: (image_name, image_data) 목록
+            max_workers: 동시 업로드 수
+
+        Returns:
+            items 순서대로 업로드된 키 목록 (하나라도 실패하면 예외 전파)
+        """
+        if not items:
+            return []
+        # boto3 client는 스레드 안전하므로 하나를 공유
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            futures = [
+                pool.submit(self.upload_place_image, place_id, image_name, image_data)
+                for image_name, image_data in items
+            ]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                # 하나가 실패하면 아직 시작하지 않은 업로드는 보내지 않는다
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+
     def upload_review_image(self, review_id: str, image_name: str, image_data: bytes) -> str:
         """리뷰 이미지를 S3에 업로드"""
-        key = f"images/reviews/{review_id}/{image_name}"
+        key = self.review_image_key(review_id, image_name)
         self.s3_client.put_object(
             Bucket=self.bucket_name,
             Key=key,
@@ -115,15 +328,159 @@ class S3StorageManager:
         return self.upload_place_image(place_id, image_name, image_data)
 
     def check_place_exists(self, place_id: str, query: Optional[str] = None) -> bool:
-        """S3에 해당 장소 데이터가 이미 있는지 확인"""
-        date_str = datetime.now().strftime("%Y%m%d")
-        if query:
-            safe_query = self._safe_prefix(query)
-            key = f"places/raw/{date_str}/{safe_query}/{place_id}.json"
-        else:
-            key = f"places/raw/{date_str}/{place_id}.json"
-        try:
-            self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
-            return True
-        except ClientError:
-            return False
+        """S3에 해당 장소 데이터가 이미 있는지 확인
+
+        장소마다 HEAD를 보내지 않고, prefix 단위로 한 번 목록을 받아(요청당 최대 1000개) 메모리에서 판단한다.
+        이 인스턴스가 올린 장소는 캐시에 바로 반영되지만, 다른 프로세스가 나중에 올린 객체는 보이지 않는다.
+        """
+        prefix = self.build_place_prefix(query)
+        existing = self._exists_cache.get(prefix)
+        if existing is None:
+            existing = self._prime_exists_cache(prefix)
+        return place_id in existing
+
+    def _prime_exists_cache(self, prefix: str) -> Set[str]:
+        # Delimiter로 하위 검색어 폴더는 제외하고 prefix 바로 아래 객체만 나열
+        place_ids: Set[str] = set()
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix, Delimiter="/"):
+            for obj in page.get("Contents", ()):
+                name = obj["Key"][len(prefix):]
+                # gzip 전환 이전에 올라간 .json 키도 기존 데이터로 인정
+                for suffix in (".json.gz", ".json"):
+                    if name.endswith(suffix):
+                        place_ids.add(name[: -len(suffix)])
+                        break
+        self._exists_cache[prefix] = place_ids
+        return place_ids
+
+
+class AsyncS3StorageManager(_S3KeyLayout):
+    """S3StorageManager의 비동기 버전 (aiobotocore, 선택적)
+
+    업로드를 크롤링/다운로드와 같은 이벤트 루프에서 asyncio.gather로 겹쳐 실행할 때 사용한다.
+    키 경로와 직렬화는 S3StorageManager와 같다 (리뷰 JSON은 멀티파트 없이 단일 PUT).
+
+        async with AsyncS3StorageManager(bucket) as s3:
+            await asyncio.gather(*(s3.upload_review_image(...) for ...))
+    """
+
+    def __init__(
+        self,
+        bucket_name: str,
+        aws_access_key_id: Optional[str] = None,
+        aws_secret_access_key: Optional[str] = None,
+        region: str = "ap-northeast-2",
+    ) -> None:
+        if not AIOBOTOCORE_AVAILABLE:
+            raise ImportError("AsyncS3StorageManager를 쓰려면 aiobotocore가 필요합니다.")
+        super().__init__(bucket_name, region)
+        self._session = get_session()
+        self._client_kwargs = dict(
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            region_name=region,
+            config=AioConfig(**_CLIENT_OPTIONS),
+        )
+        self._client_cm = None
+        self._client = None
+
+    async def __aenter__(self) -> "AsyncS3StorageManager":
+        self._client_cm = self._session.create_client("s3", **self._client_kwargs)
+        self._client = await self._client_cm.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        client_cm, self._client_cm, self._client = self._client_cm, None, None
+        if client_cm is not None:
+            await client_cm.__aexit__(*exc_info)
+
+    async def upload_place_raw_data(
+        self,
+        place_id: str,
+        data: Dict,
+        query: Optional[str] = None,
+        pretty: bool = False,
+        prefix: Optional[str] = None,
+    ) -> str:
+        """장소 원본 크롤링 데이터를 S3에 업로드 (prefix를 주면 query 대신 그대로 사용)"""
+        if prefix is None:
+            prefix = self.build_place_prefix(query)
+        key = self.build_place_key(place_id, prefix=prefix)
+        await self._client.put_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=self._gzip_json(data, pretty),
+            ContentType="application/json",
+            ContentEncoding="gzip",
+        )
+        return key
+
+    async def upload_reviews(
+        self, place_id: str, reviews: List[Dict], backup: bool = False, pretty: bool = False
+    ) -> str:
+        """리뷰 데이터를 S3에 업로드 (인자는 S3StorageManager.upload_reviews와 동일)"""
+        key = f"reviews/{place_id}/reviews.json.gz"
+        body = self._gzip_json(reviews, pretty)
+        keys = [key]
+        if backup:
+            keys.append(f"reviews/{place_id}/{self._today()}_reviews.json.gz")
+        await asyncio.gather(
+            *(
+                self._client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=k,
+                    Body=body,
+                    ContentType="application/json",
+                    ContentEncoding="gzip",
+                )
+                for k in keys
+            )
+        )
+        return key
+
+    async def append_reviews(self, place_id: str, new_reviews: Sequence[Dict]) -> Optional[str]:
+        """새로 수집한 리뷰만 NDJSON 샤드로 업로드 (S3StorageManager.append_reviews와 동일)"""
+        if not new_reviews:
+            return None
+        key = self.review_shard_key(place_id)
+        await self._client.put_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=self._gzip_ndjson(new_reviews),
+            ContentType="application/x-ndjson",
+            ContentEncoding="gzip",
+        )
+        return key
+
+    async def upload_place_image(self, place_id: str, image_name: str, image_data: bytes) -> str:
+        """장소 이미지를 S3에 업로드"""
+        key = self.place_image_key(place_id, image_name)
+        await self._client.put_object(
+            Bucket=self.bucket_name, Key=key, Body=image_data, ContentType="image/jpeg"
+        )
+        return key
+
+    async def upload_review_image(self, review_id: str, image_name: str, image_data: bytes) -> str:
+        """리뷰 이미지를 S3에 업로드"""
+        key = self.review_image_key(review_id, image_name)
+        await self._client.put_object(
+            Bucket=self.bucket_name, Key=key, Body=image_data, ContentType="image/jpeg"
+        )
+        return key
+
+
+@lru_cache(maxsize=None)
+def get_s3_manager(
+    bucket_name: str,
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+    region: str = "ap-northeast-2",
+) -> S3StorageManager:
+    """버킷/리전/자격증명별로 S3StorageManager를 하나만 만들어 공유 (커넥션 풀과 존재 여부 캐시 재사용)"""
+    return S3StorageManager(
+        bucket_name=bucket_name,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        region=region,
+    )
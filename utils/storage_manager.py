@@ -1,40 +1,82 @@
-import json
+import mmap
+import re
 from pathlib import Path
-from typing import Dict, Iterable, List, Set
+from typing import BinaryIO, Dict, Iterable, List, Optional, Set
+
+import orjson
+
+# append용 파일 핸들 버퍼 크기 (작은 레코드를 모아 한 번에 기록)
+WRITE_BUFFER_SIZE = 1 << 20
+# place_id만 필요하므로 대부분의 줄은 JSON 전체 대신 정규식으로 값만 뽑는다
+_PLACE_ID_RE = re.compile(rb'"place_id"\s*:\s*"([^"]+)"')
 
 
 class PlaceStorageManager:
-    """간단한 JSONL 기반 저장소"""
+    """간단한 JSONL 기반 저장소
+
+    append는 첫 호출 때 연 파일 핸들을 계속 재사용하므로, 다 쓴 뒤 close() 하거나 with 문으로 사용한다.
+    """
 
     def __init__(self, output_path: str = "places.jsonl") -> None:
         self.path = Path(output_path)
         if not self.path.parent.exists():
             self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fp: Optional[BinaryIO] = None
+
+    def __enter__(self) -> "PlaceStorageManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
-    def load_existing_place_ids(self) -> Set[str]:
+    def load_existing_place_ids(self, strict: bool = False) -> Set[str]:
+        """저장된 place_id 집합. strict=True면 정규식 fast path 없이 모든 줄을 JSON으로 파싱"""
+        if self._fp is not None:
+            # 버퍼에 남은 append 내용까지 읽히도록
+            self._fp.flush()
         if not self.path.exists():
             return set()
 
         place_ids: Set[str] = set()
-        with self.path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                place_id = data.get("place_id")
-                if place_id:
-                    place_ids.add(str(place_id))
+        with self.path.open("rb") as f:
+            if self.path.stat().st_size == 0:
+                # 빈 파일은 mmap 불가
+                return place_ids
+            # 텍스트 모드 디코딩 없이 bytes 줄을 그대로 orjson에 넘긴다
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    if len(line) <= 1:
+                        continue
+                    # 크래시로 반쯤 쓰인 줄은 fast path/파서(예외 생성)까지 가지 않고 건너뛴다
+                    if not (line.startswith(b"{") and line.rstrip().endswith(b"}")):
+                        continue
+                    if not strict:
+                        # 문자열 값이고 이스케이프가 없을 때만 사용, 나머지(숫자 id 등)는 JSON 파싱
+                        match = _PLACE_ID_RE.search(line)
+                        if match and b"\\" not in match.group(1):
+                            place_ids.add(match.group(1).decode("utf-8"))
+                            continue
+                    try:
+                        data = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue
+                    place_id = data.get("place_id")
+                    if place_id:
+                        place_ids.add(str(place_id))
         return place_ids
 
     def append(self, places: Iterable[Dict]) -> None:
         if not places:
             return
-        with self.path.open("a", encoding="utf-8") as f:
-            for place in places:
-                f.write(json.dumps(place, ensure_ascii=False) + "\n")
+        if self._fp is None:
+            self._fp = self.path.open("ab", buffering=WRITE_BUFFER_SIZE)
+        self._fp.writelines(orjson.dumps(place) + b"\n" for place in places)
 
+    def flush(self) -> None:
+        if self._fp is not None:
+            self._fp.flush()
 
+    def close(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None